@@ -0,0 +1,327 @@
+"""
+API load benchmark.
+
+Runs the scenarios in-process through the ASGI app, or against a running
+server with `--url`. Results can be stored as a baseline and later runs
+compared against it, failing when a scenario regresses.
+
+All readers come from one client address, so the rate limiter has to be
+disabled with `RATE_LIMIT_REQUESTS=0`, on the server too when using `--url`.
+
+Usage:
+    export APP_ENV=dev RATE_LIMIT_REQUESTS=0
+    python -m benchmarks.api --keep --save-baseline
+    python -m benchmarks.api --keep --skip-generate --compare
+    python -m benchmarks.api --url http://localhost:8000/api
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import random
+import sys
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from httpx import ASGITransport, AsyncClient, Response
+from sqlalchemy import text
+
+from benchmarks.data import cleanup, generate_dataset, generate_readers, reset_readers
+from benchmarks.utils import measure_concurrently, percentiles
+from conduit.app import app
+from conduit.core.config import get_app_settings
+from conduit.core.container import container
+from conduit.core.query_stats import collect_query_stats
+
+DEFAULT_BASELINE = Path(__file__).parent / "baselines" / "api.json"
+
+PAGE_SIZE = 20
+
+
+@dataclass
+class Reader:
+    headers: dict[str, str]
+    rng: random.Random
+    favorited: set[str] = field(default_factory=set)
+
+
+@dataclass
+class Context:
+    client: AsyncClient
+    # Ordered by popularity, the way the data generator skews activity.
+    slugs: list[str]
+    readers: list[Reader]
+
+    def pick_slug(self, reader: Reader) -> str:
+        return self.slugs[int(len(self.slugs) * reader.rng.random() ** 2)]
+
+
+@dataclass(frozen=True)
+class ScenarioResult:
+    requests: int
+    errors: int
+    rps: float
+    p50: float
+    p95: float
+    p99: float
+    # Unknown when the server runs in another process.
+    queries_per_request: float | None
+
+
+Scenario = Callable[[Context, Reader], Awaitable[Response]]
+
+
+async def feed(ctx: Context, reader: Reader) -> Response:
+    return await ctx.client.get(
+        "/articles/feed", params={"limit": PAGE_SIZE}, headers=reader.headers
+    )
+
+
+async def global_listing(ctx: Context, reader: Reader) -> Response:
+    # Anonymous, mostly the first pages.
+    offset = PAGE_SIZE * int(5 * reader.rng.random() ** 2)
+    return await ctx.client.get(
+        "/articles", params={"limit": PAGE_SIZE, "offset": offset}
+    )
+
+
+async def article_read(ctx: Context, reader: Reader) -> Response:
+    slug = ctx.pick_slug(reader=reader)
+    return await ctx.client.get(f"/articles/{slug}", headers=reader.headers)
+
+
+async def favorite(ctx: Context, reader: Reader) -> Response:
+    slug = ctx.pick_slug(reader=reader)
+    if slug in reader.favorited:
+        reader.favorited.discard(slug)
+        return await ctx.client.delete(
+            f"/articles/{slug}/favorite", headers=reader.headers
+        )
+    reader.favorited.add(slug)
+    return await ctx.client.post(f"/articles/{slug}/favorite", headers=reader.headers)
+
+
+async def comment_thread(ctx: Context, reader: Reader) -> Response:
+    slug = ctx.pick_slug(reader=reader)
+    return await ctx.client.get(f"/articles/{slug}/comments", headers=reader.headers)
+
+
+SCENARIOS: dict[str, Scenario] = {
+    "feed": feed,
+    "global listing": global_listing,
+    "article read": article_read,
+    "favorite": favorite,
+    "comment thread": comment_thread,
+}
+
+
+async def load_context(client: AsyncClient, readers_count: int) -> Context:
+    auth_token_service = container.auth_token_service()
+    user_service = container.user_service()
+    async with container.context_session() as session:
+        await reset_readers(session=session)
+        slugs = await session.scalars(
+            text(
+                "SELECT slug FROM article WHERE slug LIKE 'bench-article-%' "
+                "ORDER BY id LIMIT 10000"
+            )
+        )
+        readers = []
+        for number in range(1, readers_count + 1):
+            user = await user_service.get_user_by_username(
+                session=session, username=f"bench-reader-{number}"
+            )
+            token = auth_token_service.generate_jwt_token(user=user)
+            readers.append(
+                Reader(
+                    headers={"Authorization": f"Token {token}"},
+                    rng=random.Random(number),
+                )
+            )
+    return Context(client=client, slugs=list(slugs), readers=readers)
+
+
+async def run_scenario(
+    ctx: Context, scenario: Scenario, requests: int, in_process: bool
+) -> ScenarioResult:
+    errors = 0
+
+    async def call(number: int) -> None:
+        nonlocal errors
+        response = await scenario(ctx, ctx.readers[number])
+        if response.is_error:
+            errors += 1
+
+    # Warm up connections and caches the way a live server would be.
+    await measure_concurrently(
+        func=call, requests=len(ctx.readers), concurrency=len(ctx.readers)
+    )
+    errors = 0
+    with collect_query_stats() as queries:
+        samples, elapsed = await measure_concurrently(
+            func=call, requests=requests, concurrency=len(ctx.readers)
+        )
+    return ScenarioResult(
+        requests=len(samples),
+        errors=errors,
+        rps=len(samples) / elapsed,
+        **percentiles(samples),
+        queries_per_request=queries.count / len(samples) if in_process else None,
+    )
+
+
+def compare(
+    results: dict[str, ScenarioResult],
+    baseline: dict[str, dict[str, float]],
+    tolerance: float,
+) -> list[str]:
+    """
+    Return descriptions of the metrics worse than the baseline.
+    """
+    regressions = []
+    for name, result in results.items():
+        if (expected := baseline.get(name)) is None:
+            continue
+        for metric in ("p50", "p95", "p99"):
+            if getattr(result, metric) > expected[metric] * (1 + tolerance):
+                regressions.append(
+                    f"{name}: {metric} {getattr(result, metric):.2f}ms, "
+                    f"baseline {expected[metric]:.2f}ms"
+                )
+        if result.rps < expected["rps"] * (1 - tolerance):
+            regressions.append(
+                f"{name}: {result.rps:.1f} rps, baseline {expected['rps']:.1f} rps"
+            )
+        # Cache hits make query counts vary a little between runs.
+        if (
+            result.queries_per_request is not None
+            and expected.get("queries_per_request") is not None
+            and result.queries_per_request
+            > expected["queries_per_request"] * (1 + tolerance)
+        ):
+            regressions.append(
+                f"{name}: {result.queries_per_request:.2f} queries per request, "
+                f"baseline {expected['queries_per_request']:.2f}"
+            )
+    return regressions
+
+
+def format_result(name: str, result: ScenarioResult) -> str:
+    queries = (
+        f"{result.queries_per_request:6.2f}"
+        if result.queries_per_request is not None
+        else "     -"
+    )
+    return (
+        f"{name:<20} rps={result.rps:8.1f} p50={result.p50:8.2f}ms "
+        f"p95={result.p95:8.2f}ms p99={result.p99:8.2f}ms "
+        f"queries={queries} errors={result.errors}"
+    )
+
+
+async def run(args: argparse.Namespace) -> int:
+    if not args.skip_generate:
+        async with container.context_session() as session:
+            await generate_dataset(
+                session=session,
+                users_count=args.users,
+                articles_count=args.articles,
+                follows_per_user=args.follows,
+                favorites_per_user=args.favorites,
+                comments_count=args.comments,
+            )
+            await generate_readers(
+                session=session,
+                readers_count=args.concurrency,
+                users_count=args.users,
+                follows_count=args.follows,
+            )
+
+    in_process = args.url is None
+    if in_process:
+        # The transport does not run the lifespan, startup is entered below.
+        lifespan = app.router.lifespan_context(app)
+        client = AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://benchmark/api"
+        )
+    else:
+        lifespan = contextlib.nullcontext()
+        client = AsyncClient(base_url=args.url)
+
+    results = {}
+    try:
+        async with lifespan, client:
+            ctx = await load_context(client=client, readers_count=args.concurrency)
+            for name in args.scenario or SCENARIOS:
+                results[name] = await run_scenario(
+                    ctx=ctx,
+                    scenario=SCENARIOS[name],
+                    requests=args.requests,
+                    in_process=in_process,
+                )
+                print(format_result(name=name, result=results[name]))
+    finally:
+        if not args.keep:
+            async with container.context_session() as session:
+                await cleanup(session=session)
+
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(
+            json.dumps(
+                {name: asdict(result) for name, result in results.items()}, indent=2
+            )
+        )
+        print(f"Baseline saved to {args.baseline}")
+
+    if args.compare:
+        baseline = json.loads(args.baseline.read_text())
+        if regressions := compare(
+            results=results, baseline=baseline, tolerance=args.tolerance
+        ):
+            print("Regressions:", *regressions, sep="\n  ")
+            return 1
+        print("No regressions against the baseline")
+    return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--articles", type=int, default=100_000)
+    parser.add_argument("--follows", type=int, default=20, help="Per user.")
+    parser.add_argument("--favorites", type=int, default=20, help="Per user.")
+    parser.add_argument("--comments", type=int, default=300_000)
+    parser.add_argument("--requests", type=int, default=2000, help="Per scenario.")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument(
+        "--scenario", action="append", choices=list(SCENARIOS), help="Repeatable."
+    )
+    parser.add_argument(
+        "--url", help="Benchmark a running server, e.g. http://localhost:8000/api."
+    )
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--compare", action="store_true", help="Fail on regressions.")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="Allowed latency and throughput change against the baseline.",
+    )
+    parser.add_argument("--skip-generate", action="store_true", help="Reuse kept data.")
+    parser.add_argument(
+        "--keep", action="store_true", help="Keep generated data after the run."
+    )
+    args = parser.parse_args()
+    if args.url is None and get_app_settings().rate_limit_requests:
+        parser.error("set RATE_LIMIT_REQUESTS=0 to benchmark in-process")
+    sys.exit(asyncio.run(run(args=args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,328 @@
+"""
+Synthetic data generator for the benchmarks.
+
+All generated rows are prefixed with `bench-`, so they can be removed
+without touching the rest of the data.
+"""
+
+import random
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+WORDS = (
+    "python postgres async index query cursor cache fastapi pydantic vector "
+    "search rank token stream batch merge worker latency throughput profile "
+    "article comment author feed tag favorite follow json schema migration "
+    "pool transaction snapshot replica shard queue event loop thread memory "
+    "garden coffee travel music winter summer mountain river city history"
+).split()
+
+TAGS_COUNT = 50
+BATCH_SIZE = 50_000
+
+BENCH_USERS_SQL = (
+    'SELECT id FROM "user" '
+    "WHERE username LIKE 'bench-user-%' OR username LIKE 'bench-reader-%'"
+)
+
+
+def _skewed_number_sql(count: str, exponent: int) -> str:
+    # Power law over 1..count, low numbers are picked far more often.
+    return f"(1 + floor({count} * power(random(), {exponent})))::int"
+
+
+def _random_words_sql(count: int) -> str:
+    # Correlated with the series row, otherwise it is evaluated only once.
+    return (
+        "(SELECT string_agg("
+        "CAST(:words AS text[])[1 + floor(random() * :words_count)::int], ' ') "
+        f"FROM generate_series(1, {count} + 0 * i))"
+    )
+
+
+async def generate_users(session: AsyncSession, users_count: int) -> None:
+    await session.execute(
+        text(
+            """
+            INSERT INTO "user" (username, email, password_hash, bio, created_at)
+            SELECT 'bench-user-' || i, 'bench-user-' || i || '@example.com',
+                   '', '', now()
+            FROM generate_series(1, :users_count) AS i
+            ON CONFLICT DO NOTHING
+            """
+        ),
+        {"users_count": users_count},
+    )
+
+
+async def generate_articles(
+    session: AsyncSession, articles_count: int, users_count: int = 1000
+) -> None:
+    """
+    Generate articles with random text, spread over users and tags.
+    """
+    await generate_users(session=session, users_count=users_count)
+    await session.execute(
+        text(
+            """
+            INSERT INTO tag (tag, created_at)
+            SELECT 'bench-tag-' || i, now() FROM generate_series(0, :tags_count) AS i
+            ON CONFLICT DO NOTHING
+            """
+        ),
+        {"tags_count": TAGS_COUNT - 1},
+    )
+    words = list(WORDS)
+    random.shuffle(words)
+    for start in range(1, articles_count + 1, BATCH_SIZE):
+        stop = min(start + BATCH_SIZE - 1, articles_count)
+        await session.execute(
+            text(
+                f"""
+                INSERT INTO article (
+                    author_id, slug, title, description, body, comments_count,
+                    created_at, updated_at
+                )
+                SELECT "user".id, 'bench-article-' || i,
+                       {_random_words_sql(count=4)},
+                       {_random_words_sql(count=12)},
+                       {_random_words_sql(count=80)},
+                       0, now(), now()
+                FROM generate_series(:start, :stop) AS i
+                JOIN "user" ON "user".username = 'bench-user-' || (1 + i % :users)
+                ON CONFLICT (slug) DO NOTHING
+                """
+            ),
+            {
+                "start": start,
+                "stop": stop,
+                "users": users_count,
+                "words": words,
+                "words_count": len(words),
+            },
+        )
+        await session.commit()
+        print(f"Generated {stop}/{articles_count} articles")
+
+    await session.execute(
+        text(
+            """
+            INSERT INTO article_tag (article_id, tag_id, created_at)
+            SELECT article.id, tag.id, now()
+            FROM article
+            JOIN tag ON tag.tag = 'bench-tag-' || (article.id % :tags_count)
+            WHERE article.slug LIKE 'bench-article-%'
+            ON CONFLICT DO NOTHING
+            """
+        ),
+        {"tags_count": TAGS_COUNT},
+    )
+    await session.execute(text("ANALYZE"))
+
+
+async def generate_follows(
+    session: AsyncSession, users_count: int, follows_per_user: int
+) -> None:
+    """
+    Make every user follow authors, popular authors gain most followers.
+    """
+    await session.execute(
+        text(
+            f"""
+            WITH picks AS MATERIALIZED (
+                SELECT "user".id AS follower_id,
+                       {_skewed_number_sql(count=":users_count", exponent=3)} AS n
+                FROM "user"
+                CROSS JOIN generate_series(1, :follows_per_user)
+                WHERE "user".username LIKE 'bench-user-%'
+            )
+            INSERT INTO follower (follower_id, following_id, created_at)
+            SELECT DISTINCT picks.follower_id, "user".id, now()
+            FROM picks
+            JOIN "user" ON "user".username = 'bench-user-' || picks.n
+            WHERE "user".id <> picks.follower_id
+            ON CONFLICT DO NOTHING
+            """
+        ),
+        {"users_count": users_count, "follows_per_user": follows_per_user},
+    )
+
+
+async def generate_favorites(
+    session: AsyncSession, articles_count: int, favorites_per_user: int
+) -> None:
+    """
+    Make every user favorite articles, early articles are the popular ones.
+    """
+    await session.execute(
+        text(
+            f"""
+            WITH picks AS MATERIALIZED (
+                SELECT "user".id AS user_id,
+                       {_skewed_number_sql(count=":articles_count", exponent=2)} AS n
+                FROM "user"
+                CROSS JOIN generate_series(1, :favorites_per_user)
+                WHERE "user".username LIKE 'bench-user-%'
+            )
+            INSERT INTO favorite (user_id, article_id, created_at)
+            SELECT DISTINCT picks.user_id, article.id, now()
+            FROM picks
+            JOIN article ON article.slug = 'bench-article-' || picks.n
+            ON CONFLICT DO NOTHING
+            """
+        ),
+        {"articles_count": articles_count, "favorites_per_user": favorites_per_user},
+    )
+
+
+async def generate_comments(
+    session: AsyncSession, articles_count: int, users_count: int, comments_count: int
+) -> None:
+    """
+    Generate comments by random users, mostly under the popular articles.
+    """
+    for start in range(1, comments_count + 1, BATCH_SIZE):
+        stop = min(start + BATCH_SIZE - 1, comments_count)
+        await session.execute(
+            text(
+                f"""
+                WITH picks AS MATERIALIZED (
+                    SELECT i,
+                           {_skewed_number_sql(count=":articles", exponent=3)} AS n,
+                           1 + floor(random() * :users)::int AS author_n
+                    FROM generate_series(:start, :stop) AS i
+                )
+                INSERT INTO comment (article_id, author_id, body, created_at)
+                SELECT article.id, "user".id, {_random_words_sql(count=20)},
+                       now() - random() * interval '30 days'
+                FROM picks
+                JOIN article ON article.slug = 'bench-article-' || picks.n
+                JOIN "user" ON "user".username = 'bench-user-' || picks.author_n
+                """
+            ),
+            {
+                "start": start,
+                "stop": stop,
+                "articles": articles_count,
+                "users": users_count,
+                "words": list(WORDS),
+                "words_count": len(WORDS),
+            },
+        )
+        await session.commit()
+        print(f"Generated {stop}/{comments_count} comments")
+
+    await session.execute(
+        text(
+            """
+            UPDATE article SET comments_count = counts.total
+            FROM (
+                SELECT article_id, count(*) AS total FROM comment GROUP BY article_id
+            ) AS counts
+            WHERE article.id = counts.article_id
+              AND article.slug LIKE 'bench-article-%'
+            """
+        )
+    )
+
+
+async def generate_readers(
+    session: AsyncSession, readers_count: int, users_count: int, follows_count: int
+) -> None:
+    """
+    Generate users that only read, each following a few popular authors.
+    """
+    await session.execute(
+        text(
+            """
+            INSERT INTO "user" (username, email, password_hash, bio, created_at)
+            SELECT 'bench-reader-' || i, 'bench-reader-' || i || '@example.com',
+                   '', '', now()
+            FROM generate_series(1, :readers_count) AS i
+            ON CONFLICT DO NOTHING
+            """
+        ),
+        {"readers_count": readers_count},
+    )
+    await session.execute(
+        text(
+            f"""
+            WITH picks AS MATERIALIZED (
+                SELECT "user".id AS follower_id,
+                       {_skewed_number_sql(count=":users_count", exponent=3)} AS n
+                FROM "user"
+                CROSS JOIN generate_series(1, :follows_count)
+                WHERE "user".username LIKE 'bench-reader-%'
+            )
+            INSERT INTO follower (follower_id, following_id, created_at)
+            SELECT DISTINCT picks.follower_id, "user".id, now()
+            FROM picks
+            JOIN "user" ON "user".username = 'bench-user-' || picks.n
+            ON CONFLICT DO NOTHING
+            """
+        ),
+        {"users_count": users_count, "follows_count": follows_count},
+    )
+
+
+async def reset_readers(session: AsyncSession) -> None:
+    """
+    Drop favorites left by the readers of a previous run.
+    """
+    await session.execute(
+        text(
+            """
+            DELETE FROM favorite WHERE user_id IN
+            (SELECT id FROM "user" WHERE username LIKE 'bench-reader-%')
+            """
+        )
+    )
+
+
+async def generate_dataset(
+    session: AsyncSession,
+    users_count: int,
+    articles_count: int,
+    follows_per_user: int,
+    favorites_per_user: int,
+    comments_count: int,
+) -> None:
+    """
+    Generate the whole social graph around the articles.
+    """
+    await generate_articles(
+        session=session, articles_count=articles_count, users_count=users_count
+    )
+    await generate_follows(
+        session=session, users_count=users_count, follows_per_user=follows_per_user
+    )
+    await generate_favorites(
+        session=session,
+        articles_count=articles_count,
+        favorites_per_user=favorites_per_user,
+    )
+    await session.commit()
+    await generate_comments(
+        session=session,
+        articles_count=articles_count,
+        users_count=users_count,
+        comments_count=comments_count,
+    )
+    await session.execute(text("ANALYZE"))
+
+
+async def cleanup(session: AsyncSession) -> None:
+    """
+    Remove all generated rows.
+    """
+    for query in (
+        f"DELETE FROM comment WHERE author_id IN ({BENCH_USERS_SQL})",
+        f"DELETE FROM favorite WHERE user_id IN ({BENCH_USERS_SQL})",
+        "DELETE FROM article WHERE slug LIKE 'bench-article-%'",
+        "DELETE FROM tag WHERE tag LIKE 'bench-tag-%'",
+        f"DELETE FROM follower WHERE follower_id IN ({BENCH_USERS_SQL}) "
+        f"OR following_id IN ({BENCH_USERS_SQL})",
+        f'DELETE FROM "user" WHERE id IN ({BENCH_USERS_SQL})',
+    ):
+        await session.execute(text(query))
@@ -0,0 +1,98 @@
+"""
+CPU cost of expected client errors.
+
+Requests an unknown profile through `ProfileService` and compares the CPU
+time of the event loop thread per 404 with the former handling, which
+logged every miss with `logger.exception` and its traceback.
+
+No database is needed, the user lookup always misses. Logs are written to
+`/dev/null`. The logging level and the sampling come from the environment
+settings, `LOG_SAMPLING_BURST=0` turns the sampling off like before it
+existed.
+
+Usage:
+    APP_ENV=dev python -m benchmarks.errors --requests 10000
+"""
+
+import argparse
+import asyncio
+import contextlib
+import os
+import time
+from collections.abc import Awaitable, Callable
+
+from structlog import get_logger
+
+from conduit.core.config import get_app_settings
+from conduit.core.exceptions import ProfileNotFoundException, UserNotFoundException
+from conduit.core.logging import configure_logger
+from conduit.services.profile import ProfileService
+
+logger = get_logger()
+
+
+class MissingUserService:
+    async def get_user_by_username(self, session: None, username: str) -> None:
+        raise UserNotFoundException()
+
+
+async def former_get_profile_by_username(
+    user_service: MissingUserService, username: str
+) -> None:
+    try:
+        await user_service.get_user_by_username(session=None, username=username)
+    except UserNotFoundException:
+        logger.exception("Profile not found", username=username)
+        raise ProfileNotFoundException()
+
+
+async def cpu_per_call(
+    func: Callable[[int], Awaitable[object]], requests: int, warmup: int = 100
+) -> float:
+    """
+    Return CPU time of the current thread per call in microseconds.
+    """
+    for number in range(warmup):
+        with contextlib.suppress(ProfileNotFoundException):
+            await func(number)
+
+    started_at = time.thread_time()
+    for number in range(requests):
+        with contextlib.suppress(ProfileNotFoundException):
+            await func(number)
+    return (time.thread_time() - started_at) / requests * 1_000_000
+
+
+async def run(requests: int) -> None:
+    user_service = MissingUserService()
+    profile_service = ProfileService(
+        user_service=user_service, follower_repo=None, suggestions_cache=None
+    )
+    scenarios = {
+        "former logger.exception": lambda number: former_get_profile_by_username(
+            user_service=user_service, username=f"unknown-{number}"
+        ),
+        "client error event": lambda number: profile_service.get_profile_by_username(
+            session=None, username=f"unknown-{number}"
+        ),
+    }
+    for name, func in scenarios.items():
+        cpu = await cpu_per_call(func=func, requests=requests)
+        print(f"{name:<30} {cpu:8.1f}us CPU per 404")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--requests", type=int, default=10_000)
+    args = parser.parse_args()
+
+    # The log handler keeps writing to the stderr of the configuration time.
+    with contextlib.redirect_stderr(open(os.devnull, "w")):
+        configure_logger(json_logs=get_app_settings().json_logs)
+    asyncio.run(run(requests=args.requests))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Full text search benchmark.
+
+Usage:
+    APP_ENV=dev python -m benchmarks.search --articles 1000000
+"""
+
+import argparse
+import asyncio
+
+from benchmarks.data import cleanup, generate_articles
+from benchmarks.utils import format_percentiles, measure
+from conduit.core.container import container
+from conduit.infrastructure.repositories.article import ArticleRepository
+
+SCENARIOS = {
+    "single word": dict(q="postgres"),
+    "several words": dict(q="async postgres cursor"),
+    "phrase": dict(q='"search rank"'),
+    "negation": dict(q="postgres -winter"),
+    "word and tag": dict(q="postgres", tags=["bench-tag-7"]),
+    "rare word": dict(q="nonexistentword"),
+}
+
+
+async def run(articles_count: int, iterations: int, keep: bool) -> None:
+    article_repository: ArticleRepository = container.article_repository()
+    async with container.context_session() as session:
+        await generate_articles(session=session, articles_count=articles_count)
+
+    try:
+        async with container.context_session() as session:
+            for name, filters in SCENARIOS.items():
+                samples = await measure(
+                    lambda filters=filters: article_repository.list_by_filters_v2(
+                        session=session, user_id=None, limit=20, offset=0, **filters
+                    ),
+                    iterations=iterations,
+                )
+                print(format_percentiles(name=f"list {name}", samples=samples))
+
+                samples = await measure(
+                    lambda filters=filters: article_repository.count_by_filters(
+                        session=session, **filters
+                    ),
+                    iterations=iterations,
+                )
+                print(format_percentiles(name=f"count {name}", samples=samples))
+    finally:
+        if not keep:
+            async with container.context_session() as session:
+                await cleanup(session=session)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--articles", type=int, default=1_000_000)
+    parser.add_argument("--iterations", type=int, default=100)
+    parser.add_argument(
+        "--keep", action="store_true", help="Keep generated data after the run."
+    )
+    args = parser.parse_args()
+    asyncio.run(
+        run(articles_count=args.articles, iterations=args.iterations, keep=args.keep)
+    )
+
+
+if __name__ == "__main__":
+    main()
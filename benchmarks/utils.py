@@ -0,0 +1,60 @@
+import asyncio
+import itertools
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+
+
+def percentiles(samples: list[float]) -> dict[str, float]:
+    """
+    Return p50, p95 and p99 of the samples.
+    """
+    quantiles = statistics.quantiles(samples, n=100, method="inclusive")
+    return {"p50": quantiles[49], "p95": quantiles[94], "p99": quantiles[98]}
+
+
+async def measure(
+    func: Callable[[], Awaitable[object]], iterations: int, warmup: int = 5
+) -> list[float]:
+    """
+    Run the function sequentially and return durations in milliseconds.
+    """
+    for _ in range(warmup):
+        await func()
+
+    samples = []
+    for _ in range(iterations):
+        started_at = time.perf_counter()
+        await func()
+        samples.append((time.perf_counter() - started_at) * 1000)
+    return samples
+
+
+async def measure_concurrently(
+    func: Callable[[int], Awaitable[object]], requests: int, concurrency: int
+) -> tuple[list[float], float]:
+    """
+    Run the function from `concurrency` workers until `requests` calls are made.
+
+    The worker number is passed to the function. Returns durations in
+    milliseconds and the wall clock time of the whole run in seconds.
+    """
+    calls = itertools.count()
+    samples: list[float] = []
+
+    async def worker(number: int) -> None:
+        while next(calls) < requests:
+            started_at = time.perf_counter()
+            await func(number)
+            samples.append((time.perf_counter() - started_at) * 1000)
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(worker(number) for number in range(concurrency)))
+    return samples, time.perf_counter() - started_at
+
+
+def format_percentiles(name: str, samples: list[float]) -> str:
+    values = " ".join(
+        f"{key}={value:8.2f}ms" for key, value in percentiles(samples).items()
+    )
+    return f"{name:<40} {values}"
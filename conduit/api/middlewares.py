@@ -1,11 +1,30 @@
+import re
+import time
+import uuid
 from datetime import datetime, timedelta
 from typing import Any, Unpack
 
+from starlette.datastructures import Headers, MutableHeaders
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from starlette.requests import Request
 from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from structlog import get_logger
 
 from conduit.core.exceptions import RateLimitExceededException
+from conduit.core.metrics import (
+    RATE_LIMITED_REQUESTS,
+    REQUEST_DURATION,
+    REQUESTS_IN_FLIGHT,
+)
+from conduit.core.query_stats import collect_query_stats
+from conduit.core.request_context import bind_request_context, get_request_context
+
+logger = get_logger()
+
+REQUEST_ID_HEADER = "X-Request-ID"
+# Accepted request ids, anything else is replaced to keep the logs clean.
+REQUEST_ID_PATTERN = re.compile(r"[\w.:-]{1,128}")
 
 
 class RateLimitingMiddleware(BaseHTTPMiddleware):
@@ -14,16 +33,21 @@ class RateLimitingMiddleware(BaseHTTPMiddleware):
     """
 
     rate_limit_duration = timedelta(minutes=1)
-    rate_limit_requests = 100
 
-    def __init__(self, *args: Unpack[tuple[Any]], **kwargs: Any):
+    def __init__(
+        self, *args: Unpack[tuple[Any]], rate_limit_requests: int = 100, **kwargs: Any
+    ):
         super().__init__(*args, **kwargs)
+        self.rate_limit_requests = rate_limit_requests
         # Dictionary to store request counts for each IP.
         self.request_counts: dict[str, tuple[int, datetime]] = {}
 
     async def dispatch(
         self, request: Request, call_next: RequestResponseEndpoint
     ) -> Response:
+        if not self.rate_limit_requests:
+            return await call_next(request)
+
         client_ip = request.client.host
 
         request_count, last_request = self.request_counts.get(
@@ -36,6 +60,7 @@ class RateLimitingMiddleware(BaseHTTPMiddleware):
             request_count = 1
         else:
             if request_count >= self.rate_limit_requests:
+                RATE_LIMITED_REQUESTS.inc()
                 return RateLimitExceededException.get_response()
             request_count += 1
 
@@ -43,3 +68,96 @@ class RateLimitingMiddleware(BaseHTTPMiddleware):
 
         response = await call_next(request)
         return response
+
+
+class QueryStatsMiddleware(BaseHTTPMiddleware):
+    """
+    Middleware that reports database usage of every request.
+    """
+
+    async def dispatch(
+        self, request: Request, call_next: RequestResponseEndpoint
+    ) -> Response:
+        with collect_query_stats() as stats:
+            response = await call_next(request)
+            response.headers.append("Server-Timing", stats.server_timing())
+            request_context = get_request_context()
+            logger.debug(
+                "Request finished",
+                method=request.method,
+                path=request.url.path,
+                status_code=response.status_code,
+                handler_ms=_milliseconds(
+                    request_context.handler_duration if request_context else None
+                ),
+                serialization_ms=_milliseconds(
+                    request_context.serialization_duration if request_context else None
+                ),
+                db_slowest_ms=round(stats.slowest_duration * 1000, 2),
+                db_slowest_statement=stats.slowest_statement,
+            )
+        return response
+
+
+class MetricsMiddleware(BaseHTTPMiddleware):
+    """
+    Middleware that records requests latency by route and requests in flight.
+    """
+
+    async def dispatch(
+        self, request: Request, call_next: RequestResponseEndpoint
+    ) -> Response:
+        started_at = time.perf_counter()
+        status_code = 500
+        REQUESTS_IN_FLIGHT.inc()
+        try:
+            response = await call_next(request)
+            status_code = response.status_code
+            return response
+        finally:
+            REQUESTS_IN_FLIGHT.dec()
+            # The route template rather than the path keeps the labels bounded.
+            route = request.scope.get("route")
+            REQUEST_DURATION.labels(
+                method=request.method,
+                route=route.path if route else "unmatched",
+                status=status_code,
+            ).observe(time.perf_counter() - started_at)
+
+
+class RequestContextMiddleware:
+    """
+    Middleware that binds the request context used by the logs.
+
+    The request id is taken from the `X-Request-ID` header or generated, and
+    sent back in the response along with the handler and serialization
+    durations in `Server-Timing`.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = Headers(scope=scope).get(REQUEST_ID_HEADER)
+        if not request_id or not REQUEST_ID_PATTERN.fullmatch(request_id):
+            request_id = uuid.uuid4().hex
+
+        with bind_request_context(request_id=request_id) as context:
+
+            async def send_with_context(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    headers = MutableHeaders(scope=message)
+                    headers.append(REQUEST_ID_HEADER, request_id)
+                    if server_timing := context.server_timing():
+                        headers.append("Server-Timing", server_timing)
+                await send(message)
+
+            await self.app(scope, receive, send_with_context)
+
+
+def _milliseconds(duration: float | None) -> float | None:
+    return round(duration * 1000, 2) if duration is not None else None
@@ -1,6 +1,7 @@
 from fastapi import APIRouter
 
 from conduit.api.routes import (
+    admin,
     article,
     authentication,
     comment,
@@ -23,3 +24,4 @@ router.include_router(router=profile.router, tags=["Profiles"], prefix="/profile
 router.include_router(router=tag.router, tags=["Tags"], prefix="/tags")
 router.include_router(router=article.router, tags=["Articles"], prefix="/articles")
 router.include_router(router=comment.router, tags=["Comments"], prefix="/articles")
+router.include_router(router=admin.router, tags=["Admin"], prefix="/admin")
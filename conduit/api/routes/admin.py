@@ -0,0 +1,162 @@
+import asyncio
+import datetime
+import os
+from collections.abc import AsyncIterator, Callable
+from contextlib import AbstractAsyncContextManager
+
+from fastapi import APIRouter, Query, Request
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.responses import (
+    JSONResponse,
+    PlainTextResponse,
+    Response,
+    StreamingResponse,
+)
+
+from conduit.api.routing import TimedRoute
+from conduit.api.schemas.requests.article import ImportArticleRequest
+from conduit.api.schemas.responses.article import (
+    ArticleResponse,
+    ImportedArticlesResponse,
+)
+from conduit.core.config import get_app_settings
+from conduit.core.dependencies import (
+    CurrentAdminUser,
+    DBSession,
+    DBStreamSessionFactory,
+    IArticleService,
+    ProfilerAdminUser,
+)
+from conduit.core.exceptions import ImportLineValidationException, ProfilerBusyException
+from conduit.core.profiler import (
+    ProfileFormat,
+    SamplingProfiler,
+    collapse_stacks,
+    speedscope_profile,
+)
+from conduit.core.utils.errors import format_errors
+from conduit.core.utils.ndjson import iter_ndjson_lines
+from conduit.domain.dtos.article import ImportArticleDTO
+from conduit.services.article import ArticleService
+
+router = APIRouter(route_class=TimedRoute)
+
+ARTICLES_IMPORT_BATCH_SIZE = 5000
+ARTICLES_EXPORT_CHUNK_SIZE = 1000
+
+# Sampling more often than this mostly profiles the sampler.
+MIN_PROFILE_INTERVAL_MS = 1
+
+_profile_lock = asyncio.Lock()
+
+
+@router.get("/articles/export", response_class=StreamingResponse)
+async def export_articles(
+    stream_session_factory: DBStreamSessionFactory,
+    current_user: CurrentAdminUser,
+    article_service: IArticleService,
+    since: datetime.datetime | None = None,
+) -> StreamingResponse:
+    """
+    Export articles as NDJSON, one article per line, ordered by `updatedAt`.
+
+    With `since` only articles updated at or after it are exported, so the
+    last seen `updatedAt` can be used to pull the changes incrementally.
+    """
+    return StreamingResponse(
+        content=_export_articles(
+            session_factory=stream_session_factory,
+            article_service=article_service,
+            since=since,
+        ),
+        media_type="application/x-ndjson",
+    )
+
+
+@router.post("/articles/import", response_model=ImportedArticlesResponse)
+async def import_articles(
+    request: Request,
+    session: DBSession,
+    current_user: CurrentAdminUser,
+    article_service: IArticleService,
+) -> ImportedArticlesResponse:
+    """
+    Import articles from NDJSON body, one article per line.
+
+    Articles of unknown authors are assigned to the current user.
+    """
+    imported_articles_dto = await article_service.import_articles(
+        session=session,
+        articles=_parse_articles(request=request),
+        current_user=current_user,
+        batch_size=ARTICLES_IMPORT_BATCH_SIZE,
+    )
+    return ImportedArticlesResponse.from_dto(dto=imported_articles_dto)
+
+
+@router.get("/profile", response_class=Response)
+async def profile(
+    current_user: ProfilerAdminUser,
+    duration: float = Query(5, gt=0),
+    interval_ms: float = Query(10, ge=MIN_PROFILE_INTERVAL_MS),
+    format: ProfileFormat = ProfileFormat.collapsed,
+) -> Response:
+    """
+    Profile the worker serving the request by sampling stacks of its threads.
+
+    `duration` is capped by the `profiler_max_duration_seconds` setting and
+    one profile runs at a time per worker. The result is either collapsed
+    stacks for flame graph tools or a speedscope JSON file.
+    """
+    if _profile_lock.locked():
+        raise ProfilerBusyException()
+
+    duration = min(duration, get_app_settings().profiler_max_duration_seconds)
+    profiler = SamplingProfiler(interval=interval_ms / 1000)
+    async with _profile_lock:
+        await profiler.run(duration=duration)
+
+    if format == ProfileFormat.speedscope:
+        return JSONResponse(
+            content=speedscope_profile(
+                samples=profiler.samples,
+                interval=profiler.interval,
+                name=f"conduit worker {os.getpid()}",
+            )
+        )
+    return PlainTextResponse(content=collapse_stacks(samples=profiler.samples))
+
+
+async def _export_articles(
+    session_factory: Callable[[], AbstractAsyncContextManager[AsyncSession]],
+    article_service: ArticleService,
+    since: datetime.datetime | None,
+) -> AsyncIterator[str]:
+    async with session_factory() as session:
+        async for articles in article_service.stream_articles_export(
+            session=session, chunk_size=ARTICLES_EXPORT_CHUNK_SIZE, since=since
+        ):
+            yield "".join(
+                ArticleResponse.from_dto(dto=article).article.model_dump_json(
+                    by_alias=True
+                )
+                + "\n"
+                for article in articles
+            )
+
+
+async def _parse_articles(request: Request) -> AsyncIterator[ImportArticleDTO]:
+    line_number = 0
+    async for line in iter_ndjson_lines(chunks=request.stream()):
+        line_number += 1
+        try:
+            yield ImportArticleRequest.model_validate_json(line).to_dto()
+        except ValidationError as exc:
+            # Not JSON object errors have empty location, report them on the article.
+            errors = [
+                {**error, "loc": ("article", *error["loc"])} for error in exc.errors()
+            ]
+            raise ImportLineValidationException(
+                errors={f"line {line_number}": format_errors(errors=errors)}
+            )
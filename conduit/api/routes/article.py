@@ -1,6 +1,7 @@
 from fastapi import APIRouter
 from starlette import status
 
+from conduit.api.routing import TimedRoute
 from conduit.api.schemas.requests.article import (
     CreateArticleRequest,
     UpdateArticleRequest,
@@ -15,7 +16,7 @@ from conduit.core.dependencies import (
     QueryFilters,
 )
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get("/feed", response_model=ArticlesFeedResponse)
@@ -47,13 +48,21 @@ async def get_global_article_feed(
 ) -> ArticlesFeedResponse:
     """
     Get global article feed.
+
+    Several `tag` parameters match articles with any of the tags, or with all
+    of them when `match=all`.
+
+    With `q` only articles matching the search query are returned, ordered by
+    relevance.
     """
     articles_feed_dto = await article_service.get_articles_by_filters_v2(
         session=session,
         current_user=current_user,
-        tag=articles_filters.tag,
+        tags=articles_filters.tags,
+        tags_match=articles_filters.tags_match,
         author=articles_filters.author,
         favorited=articles_filters.favorited,
+        q=articles_filters.q,
         limit=pagination.limit,
         offset=pagination.offset,
     )
@@ -87,7 +96,7 @@ async def create_article(
     Create new article.
     """
     article_dto = await article_service.create_new_article(
-        session=session, author_id=current_user.id, article_to_create=payload.to_dto()
+        session=session, current_user=current_user, article_to_create=payload.to_dto()
     )
     return ArticleResponse.from_dto(dto=article_dto)
 
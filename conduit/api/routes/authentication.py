@@ -1,5 +1,6 @@
 from fastapi import APIRouter
 
+from conduit.api.routing import TimedRoute
 from conduit.api.schemas.requests.user import UserLoginRequest, UserRegistrationRequest
 from conduit.api.schemas.responses.user import (
     UserLoginResponse,
@@ -7,7 +8,7 @@ from conduit.api.schemas.responses.user import (
 )
 from conduit.core.dependencies import DBSession, IUserAuthService
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.post("", response_model=UserRegistrationResponse)
@@ -1,30 +1,65 @@
+from collections.abc import AsyncIterator, Callable
+from contextlib import AbstractAsyncContextManager
+
 from fastapi import APIRouter, Path
+from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
+from starlette.responses import StreamingResponse
 
+from conduit.api.routing import TimedRoute
 from conduit.api.schemas.requests.comment import CreateCommentRequest
 from conduit.api.schemas.responses.comment import CommentResponse, CommentsListResponse
 from conduit.core.dependencies import (
+    CommentsQueryPagination,
     CurrentOptionalUser,
     CurrentUser,
     DBSession,
+    DBStreamSessionFactory,
     ICommentService,
 )
+from conduit.domain.dtos.user import UserDTO
+from conduit.services.comment import CommentService
+
+router = APIRouter(route_class=TimedRoute)
 
-router = APIRouter()
+COMMENTS_STREAM_CHUNK_SIZE = 500
 
 
 @router.get("/{slug}/comments", response_model=CommentsListResponse)
 async def get_comments(
     slug: str,
+    pagination: CommentsQueryPagination,
     session: DBSession,
+    stream_session_factory: DBStreamSessionFactory,
     current_user: CurrentOptionalUser,
     comment_service: ICommentService,
-) -> CommentsListResponse:
+    stream: bool = False,
+) -> CommentsListResponse | StreamingResponse:
     """
     Get comments for an article.
+
+    With `stream=true` the whole thread is streamed, ignoring pagination.
     """
+    if stream:
+        content = _stream_comments(
+            session_factory=stream_session_factory,
+            comment_service=comment_service,
+            slug=slug,
+            current_user=current_user,
+        )
+        # Resolve the article before sending headers, so errors are still
+        # returned through the exception handlers.
+        first_chunk = await anext(content)
+        return StreamingResponse(
+            content=_prepend(first_chunk, content), media_type="application/json"
+        )
+
     comment_list_dto = await comment_service.get_article_comments(
-        session=session, slug=slug, current_user=current_user
+        session=session,
+        slug=slug,
+        current_user=current_user,
+        limit=pagination.limit,
+        cursor=pagination.cursor,
     )
     return CommentsListResponse.from_dto(dto=comment_list_dto)
 
@@ -63,3 +98,38 @@ async def delete_comment(
     await comment_service.delete_article_comment(
         session=session, slug=slug, comment_id=comment_id, current_user=current_user
     )
+
+
+async def _stream_comments(
+    session_factory: Callable[[], AbstractAsyncContextManager[AsyncSession]],
+    comment_service: CommentService,
+    slug: str,
+    current_user: UserDTO | None,
+) -> AsyncIterator[str]:
+    async with session_factory() as session:
+        comments_count = 0
+        prefix = '{"comments":['
+        async for comments in comment_service.stream_article_comments(
+            session=session,
+            slug=slug,
+            current_user=current_user,
+            chunk_size=COMMENTS_STREAM_CHUNK_SIZE,
+        ):
+            yield prefix + ",".join(
+                CommentResponse.from_dto(dto=comment).comment.model_dump_json(
+                    by_alias=True
+                )
+                for comment in comments
+            )
+            prefix = ","
+            comments_count += len(comments)
+
+        if not comments_count:
+            yield prefix
+        yield f'],"commentsCount":{comments_count}}}'
+
+
+async def _prepend(chunk: str, content: AsyncIterator[str]) -> AsyncIterator[str]:
+    yield chunk
+    async for next_chunk in content:
+        yield next_chunk
@@ -1,10 +1,23 @@
 from fastapi import APIRouter
 
+from conduit.api.routing import TimedRoute
+from conduit.core.exceptions import NotReadyException
+from conduit.core.lifecycle import LifecycleState, lifecycle
 from version import response
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get("")
 async def health_check() -> dict:
     return response
+
+
+@router.get("/ready")
+async def readiness() -> dict:
+    """
+    Succeeds once the worker has warmed up and until it starts shutting down.
+    """
+    if lifecycle.state != LifecycleState.ready:
+        raise NotReadyException(message=f"Service is {lifecycle.state}.")
+    return {"status": lifecycle.state}
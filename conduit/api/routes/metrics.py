@@ -0,0 +1,15 @@
+from fastapi import APIRouter
+from starlette.responses import Response
+
+from conduit.api.routing import TimedRoute
+from conduit.core.metrics import CONTENT_TYPE_LATEST, generate_metrics
+
+router = APIRouter(route_class=TimedRoute)
+
+
+@router.get("", include_in_schema=False)
+def metrics() -> Response:
+    """
+    Application metrics in the Prometheus text format.
+    """
+    return Response(content=generate_metrics(), media_type=CONTENT_TYPE_LATEST)
@@ -1,14 +1,36 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Query
 
-from conduit.api.schemas.responses.profile import ProfileResponse
+from conduit.api.routing import TimedRoute
+from conduit.api.schemas.responses.profile import (
+    ProfileResponse,
+    ProfilesSuggestionsResponse,
+)
 from conduit.core.dependencies import (
     CurrentOptionalUser,
     CurrentUser,
     DBSession,
     IProfileService,
+    SuggestionsLimit,
 )
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
+
+
+# Registered before `/{username}`, which would match it otherwise.
+@router.get("/suggest", response_model=ProfilesSuggestionsResponse)
+async def suggest_profiles(
+    session: DBSession,
+    profile_service: IProfileService,
+    limit: SuggestionsLimit,
+    prefix: str = Query(..., min_length=1),
+) -> ProfilesSuggestionsResponse:
+    """
+    Return profiles with username starting with the prefix, for autocomplete.
+    """
+    profiles = await profile_service.get_profiles_suggestions(
+        session=session, prefix=prefix, limit=limit
+    )
+    return ProfilesSuggestionsResponse.from_dtos(dtos=profiles)
 
 
 @router.get("/{username}", response_model=ProfileResponse)
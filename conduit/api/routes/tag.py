@@ -1,9 +1,10 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Query
 
+from conduit.api.routing import TimedRoute
 from conduit.api.schemas.responses.tag import TagsResponse
-from conduit.core.dependencies import DBSession, ITagService
+from conduit.core.dependencies import DBSession, ITagService, SuggestionsLimit
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get("", response_model=TagsResponse)
@@ -13,3 +14,19 @@ async def get_all_tags(session: DBSession, tag_service: ITagService) -> TagsResp
     """
     tags = await tag_service.get_all_tags(session=session)
     return TagsResponse.from_dtos(dtos=tags)
+
+
+@router.get("/suggest", response_model=TagsResponse)
+async def suggest_tags(
+    session: DBSession,
+    tag_service: ITagService,
+    limit: SuggestionsLimit,
+    prefix: str = Query(..., min_length=1),
+) -> TagsResponse:
+    """
+    Return tags starting with the prefix, for autocomplete.
+    """
+    tags = await tag_service.get_tags_suggestions(
+        session=session, prefix=prefix, limit=limit
+    )
+    return TagsResponse.from_dtos(dtos=tags)
@@ -1,10 +1,11 @@
 from fastapi import APIRouter
 
+from conduit.api.routing import TimedRoute
 from conduit.api.schemas.requests.user import UserUpdateRequest
 from conduit.api.schemas.responses.user import CurrentUserResponse, UpdatedUserResponse
 from conduit.core.dependencies import CurrentUser, DBSession, IUserService, JWTToken
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 
 @router.get("", response_model=CurrentUserResponse)
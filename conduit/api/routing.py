@@ -0,0 +1,70 @@
+import asyncio
+import functools
+import time
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+from fastapi.routing import APIRoute
+from starlette.requests import Request
+from starlette.responses import Response
+
+from conduit.core.request_context import get_request_context
+
+__all__ = ["TimedRoute"]
+
+
+class TimedRoute(APIRoute):
+    """
+    Route recording its template, the endpoint duration and the response
+    serialization duration into the request context.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any):
+        super().__init__(path, _timed_endpoint(endpoint), **kwargs)
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        route_handler = super().get_route_handler()
+        route = self.path_format
+
+        async def timed_route_handler(request: Request) -> Response:
+            if (context := get_request_context()) is None:
+                return await route_handler(request)
+
+            context.route = route
+            response = await route_handler(request)
+            context.finish_serialization()
+            return response
+
+        return timed_route_handler
+
+
+def _timed_endpoint(endpoint: Callable[..., Any]) -> Callable[..., Any]:
+    # Including a router copies its routes, with the already timed endpoints.
+    if getattr(endpoint, "__timed__", False):
+        return endpoint
+
+    # Sync endpoints have to stay sync, FastAPI runs them in a thread.
+    if asyncio.iscoroutinefunction(endpoint):
+
+        @functools.wraps(endpoint)
+        async def timed_endpoint(*args: Any, **kwargs: Any) -> Any:
+            started_at = time.perf_counter()
+            try:
+                return await endpoint(*args, **kwargs)
+            finally:
+                if (context := get_request_context()) is not None:
+                    context.finish_handler(started_at=started_at)
+
+    else:
+
+        @functools.wraps(endpoint)
+        def timed_endpoint(*args: Any, **kwargs: Any) -> Any:
+            started_at = time.perf_counter()
+            try:
+                return endpoint(*args, **kwargs)
+            finally:
+                if (context := get_request_context()) is not None:
+                    context.finish_handler(started_at=started_at)
+
+    timed_endpoint.__timed__ = True  # type: ignore[attr-defined]
+    return timed_endpoint
@@ -1,6 +1,13 @@
+import datetime
+
 from pydantic import BaseModel, Field
 
-from conduit.domain.dtos.article import CreateArticleDTO, UpdateArticleDTO
+from conduit.domain.dtos.article import (
+    CreateArticleDTO,
+    ImportArticleDTO,
+    TagsMatch,
+    UpdateArticleDTO,
+)
 
 
 class ArticlesPagination(BaseModel):
@@ -9,9 +16,11 @@ class ArticlesPagination(BaseModel):
 
 
 class ArticlesFilters(BaseModel):
-    tag: str | None = None
+    tags: list[str] = []
+    tags_match: TagsMatch = TagsMatch.any
     author: str | None = None
     favorited: str | None = None
+    q: str | None = None
 
 
 class CreateArticleData(BaseModel):
@@ -48,3 +57,24 @@ class CreateArticleRequest(BaseModel):
             body=self.article.body,
             tags=self.article.tags,
         )
+
+
+class ImportArticleRequest(BaseModel):
+    """Single line of the articles NDJSON import."""
+
+    title: str = Field(..., min_length=1)
+    description: str = Field("")
+    body: str = Field("")
+    tags: list[str] = Field([], alias="tagList")
+    author: str | None = Field(None)
+    created_at: datetime.datetime | None = Field(None, alias="createdAt")
+
+    def to_dto(self) -> ImportArticleDTO:
+        return ImportArticleDTO(
+            title=self.title,
+            description=self.description,
+            body=self.body,
+            tags=self.tags,
+            author=self.author,
+            created_at=self.created_at,
+        )
@@ -1,6 +1,11 @@
 from pydantic import BaseModel, Field
 
-from conduit.domain.dtos.comment import CreateCommentDTO
+from conduit.domain.dtos.comment import CommentsCursorDTO, CreateCommentDTO
+
+
+class CommentsPagination(BaseModel):
+    limit: int = Field(ge=1)
+    cursor: CommentsCursorDTO | None = None
 
 
 class CreateCommentData(BaseModel):
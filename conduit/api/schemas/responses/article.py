@@ -3,7 +3,7 @@ import datetime
 from pydantic import BaseModel, ConfigDict, Field
 
 from conduit.core.utils.date import convert_datetime_to_realworld
-from conduit.domain.dtos.article import ArticleDTO, ArticlesFeedDTO
+from conduit.domain.dtos.article import ArticleDTO, ArticlesFeedDTO, ImportedArticlesDTO
 
 
 class ArticleAuthorData(BaseModel):
@@ -66,3 +66,11 @@ class ArticlesFeedResponse(BaseModel):
             for article_dto in dto.articles
         ]
         return ArticlesFeedResponse(articles=articles, articlesCount=dto.articles_count)
+
+
+class ImportedArticlesResponse(BaseModel):
+    articles_count: int = Field(alias="articlesCount")
+
+    @classmethod
+    def from_dto(cls, dto: ImportedArticlesDTO) -> "ImportedArticlesResponse":
+        return ImportedArticlesResponse(articlesCount=dto.articles_count)
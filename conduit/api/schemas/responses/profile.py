@@ -23,3 +23,21 @@ class ProfileResponse(BaseModel):
                 following=dto.following,
             )
         )
+
+
+class ProfileSuggestionData(BaseModel):
+    username: str
+    image: str | None
+
+
+class ProfilesSuggestionsResponse(BaseModel):
+    profiles: list[ProfileSuggestionData]
+
+    @classmethod
+    def from_dtos(cls, dtos: list[ProfileDTO]) -> "ProfilesSuggestionsResponse":
+        return ProfilesSuggestionsResponse(
+            profiles=[
+                ProfileSuggestionData(username=dto.username, image=dto.image)
+                for dto in dtos
+            ]
+        )
@@ -1,11 +1,110 @@
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator
+
 from fastapi import FastAPI
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.middleware.cors import CORSMiddleware
+from structlog import get_logger
 
-from conduit.api.middlewares import RateLimitingMiddleware
+from conduit.api.middlewares import (
+    MetricsMiddleware,
+    QueryStatsMiddleware,
+    RateLimitingMiddleware,
+    RequestContextMiddleware,
+)
 from conduit.api.router import router as api_router
+from conduit.api.routes import metrics
 from conduit.core.config import get_app_settings
+from conduit.core.container import container
+from conduit.core.dependencies import DEFAULT_ARTICLES_LIMIT, DEFAULT_ARTICLES_OFFSET
 from conduit.core.exceptions import add_exception_handlers
+from conduit.core.lifecycle import LifecycleState, lifecycle
 from conduit.core.logging import configure_logger
+from conduit.core.loop_watchdog import EventLoopWatchdog
+from conduit.core.metrics import mark_process_dead, monitor_event_loop_lag
+
+logger = get_logger()
+
+
+async def prepare_hot_statements(session: AsyncSession) -> None:
+    """
+    Run the statements of the most frequent requests, so they are prepared.
+    """
+    article_repository = container.article_repository()
+    await article_repository.list_by_filters_v2(
+        session=session,
+        user_id=None,
+        limit=DEFAULT_ARTICLES_LIMIT,
+        offset=DEFAULT_ARTICLES_OFFSET,
+    )
+    await article_repository.count_by_filters(session=session)
+    # Every authorized request loads its user.
+    await container.user_repository().get_or_none(session=session, user_id=0)
+
+
+async def warm_up() -> None:
+    settings = get_app_settings()
+    try:
+        connections = await container.warm_up_pool(
+            connections=settings.db_pool_warmup_connections,
+            prepare=prepare_hot_statements,
+        )
+        logger.info("Database pool warmed up", connections=connections)
+    except (OSError, SQLAlchemyError):
+        # Connections are also opened on demand, so a cold start is only slower.
+        logger.exception("Database pool warm up failed")
+
+    try:
+        async with container.context_session() as session:
+            await container.tags_repository().load_ids(session=session)
+            # The anonymous first page is the most requested one.
+            await container.article_service().get_articles_by_filters_v2(
+                session=session,
+                current_user=None,
+                limit=DEFAULT_ARTICLES_LIMIT,
+                offset=DEFAULT_ARTICLES_OFFSET,
+            )
+    except (OSError, SQLAlchemyError):
+        # Caches are also filled on a miss, so a cold start is only slower.
+        logger.exception("Caches warm up failed")
+
+
+@contextlib.asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    """
+    Warm the pool and caches before reporting ready and run the monitors.
+
+    A shutdown signal switches the readiness to draining first, the pool is
+    closed once the server has finished the in-flight requests.
+    """
+    settings = get_app_settings()
+    lifecycle.state = LifecycleState.starting
+    await warm_up()
+
+    event_loop_monitor = asyncio.create_task(
+        monitor_event_loop_lag(interval=settings.event_loop_lag_interval_seconds)
+    )
+    watchdog = None
+    if settings.event_loop_watchdog_threshold_ms:
+        watchdog = EventLoopWatchdog(
+            interval_ms=settings.event_loop_watchdog_interval_ms,
+            threshold_ms=settings.event_loop_watchdog_threshold_ms,
+        )
+        watchdog.start()
+    lifecycle.state = LifecycleState.ready
+    lifecycle.install_signal_handlers(delay=settings.shutdown_readiness_delay_seconds)
+    try:
+        yield
+    finally:
+        lifecycle.restore_signal_handlers()
+        if watchdog is not None:
+            watchdog.stop()
+        event_loop_monitor.cancel()
+        await container.dispose()
+        mark_process_dead()
+        lifecycle.state = LifecycleState.stopped
 
 
 def create_app() -> FastAPI:
@@ -14,7 +113,7 @@ def create_app() -> FastAPI:
     """
     settings = get_app_settings()
 
-    application = FastAPI(**settings.fastapi_kwargs)
+    application = FastAPI(**settings.fastapi_kwargs, lifespan=lifespan)
 
     application.add_middleware(
         CORSMiddleware,
@@ -23,13 +122,20 @@ def create_app() -> FastAPI:
         allow_methods=["*"],
         allow_headers=["*"],
     )
-    application.add_middleware(RateLimitingMiddleware)
+    application.add_middleware(
+        RateLimitingMiddleware, rate_limit_requests=settings.rate_limit_requests
+    )
+    application.add_middleware(QueryStatsMiddleware)
+    application.add_middleware(MetricsMiddleware)
+    # Outermost, so every response and log line carries the request id.
+    application.add_middleware(RequestContextMiddleware)
 
     application.include_router(api_router, prefix="/api")
+    application.include_router(metrics.router, prefix="/metrics")
 
     add_exception_handlers(app=application)
 
-    configure_logger()
+    configure_logger(json_logs=settings.json_logs)
 
     return application
 
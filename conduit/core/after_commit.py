@@ -0,0 +1,30 @@
+import inspect
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+__all__ = ["call_after_commit", "run_after_commit"]
+
+_CALLBACKS_KEY = "after_commit_callbacks"
+
+AfterCommitCallback = Callable[..., Awaitable[None] | None]
+
+
+def call_after_commit(
+    session: AsyncSession, callback: AfterCommitCallback, *args: Any
+) -> None:
+    """
+    Call `callback(*args)` once the session transaction is committed.
+
+    Process-wide state, like caches, must not see rows of a transaction
+    that may still roll back. The callbacks are dropped with the session
+    when it does.
+    """
+    session.info.setdefault(_CALLBACKS_KEY, []).append((callback, args))
+
+
+async def run_after_commit(session: AsyncSession) -> None:
+    for callback, args in session.info.pop(_CALLBACKS_KEY, []):
+        if inspect.isawaitable(result := callback(*args)):
+            await result
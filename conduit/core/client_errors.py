@@ -0,0 +1,49 @@
+"""
+Expected client errors, like unknown profiles or invalid tokens.
+
+They are counted in the `client_errors` metric and only logged at debug
+level, without tracebacks and with credentials redacted. Repeated events
+are rate limited by the log sampling, so scrapers hitting unknown URLs can
+not make the logging dominate the worker CPU.
+"""
+
+import logging
+import re
+from typing import Any
+
+from structlog import get_logger
+
+from conduit.core.metrics import CLIENT_ERRORS
+
+__all__ = ["log_client_error", "redact"]
+
+logger = get_logger()
+
+REDACTED = "[REDACTED]"
+SENSITIVE_FIELDS = ("token", "password", "secret", "authorization")
+JWT_PATTERN = re.compile(r"eyJ[\w-]*\.[\w-]*\.[\w-]*")
+
+_stdlib_logger = logging.getLogger(__name__)
+
+
+def redact(fields: dict[str, Any]) -> dict[str, Any]:
+    """
+    Hide values of credential fields and tokens found in string values.
+    """
+    redacted = {}
+    for key, value in fields.items():
+        if any(name in key.lower() for name in SENSITIVE_FIELDS):
+            redacted[key] = REDACTED
+        elif isinstance(value, str):
+            redacted[key] = JWT_PATTERN.sub(REDACTED, value)
+        else:
+            redacted[key] = value
+    return redacted
+
+
+def log_client_error(event: str, **fields: Any) -> None:
+    CLIENT_ERRORS.labels(event=event).inc()
+    # Checked first, the processors run even for the filtered out levels.
+    if not _stdlib_logger.isEnabledFor(logging.DEBUG):
+        return
+    logger.debug(event, **redact(fields=fields))
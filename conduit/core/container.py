@@ -1,10 +1,18 @@
+import asyncio
 import contextlib
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Awaitable, Callable
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import QueuePool
 
+from conduit.core.after_commit import run_after_commit
 from conduit.core.config import get_app_settings
+from conduit.core.metrics import MeteredAsyncQueuePool, instrument_pool
+from conduit.core.query_stats import instrument_engine
 from conduit.core.settings.base import BaseAppSettings
+from conduit.core.slow_queries import SlowQueryLogger
+from conduit.domain.cache import ICache, IComputedCache, ITagIdCache
+from conduit.domain.loaders.user import IUserLoader
 from conduit.domain.mapper import IModelMapper
 from conduit.domain.repositories.article import IArticleRepository
 from conduit.domain.repositories.article_tag import IArticleTagRepository
@@ -20,6 +28,12 @@ from conduit.domain.services.comment import ICommentService
 from conduit.domain.services.profile import IProfileService
 from conduit.domain.services.tag import ITagService
 from conduit.domain.services.user import IUserService
+from conduit.infrastructure.caches.instrumented import InstrumentedCache
+from conduit.infrastructure.caches.memory import LRUCache
+from conduit.infrastructure.caches.redis import RedisCache
+from conduit.infrastructure.caches.single_flight import SingleFlightCache
+from conduit.infrastructure.caches.tag_id import TagIdCache
+from conduit.infrastructure.loaders.user import UserLoader
 from conduit.infrastructure.mappers.article import ArticleModelMapper
 from conduit.infrastructure.mappers.comment import CommentModelMapper
 from conduit.infrastructure.mappers.tag import TagModelMapper
@@ -45,8 +59,49 @@ class Container:
 
     def __init__(self, settings: BaseAppSettings) -> None:
         self._settings = settings
-        self._engine = create_async_engine(**settings.sqlalchemy_engine_props)
+        self._engine = create_async_engine(
+            **{"poolclass": MeteredAsyncQueuePool, **settings.sqlalchemy_engine_props}
+        )
+        instrument_engine(engine=self._engine.sync_engine)
+        instrument_pool(engine=self._engine.sync_engine)
+        if settings.slow_query_threshold_ms:
+            SlowQueryLogger(
+                engine=self._engine,
+                threshold_ms=settings.slow_query_threshold_ms,
+                explain_sample_rate=settings.slow_query_explain_sample_rate,
+            )
         self._session = async_sessionmaker(bind=self._engine, expire_on_commit=False)
+        self._cache: ICache = InstrumentedCache(
+            name="article",
+            cache=(
+                RedisCache(
+                    url=settings.cache_redis_url, ttl_seconds=settings.cache_ttl_seconds
+                )
+                if settings.cache_redis_url
+                else LRUCache(
+                    max_size=settings.cache_max_size,
+                    ttl_seconds=settings.cache_ttl_seconds,
+                )
+            ),
+        )
+        self._feed_cache = SingleFlightCache(
+            name="feed",
+            cache=InstrumentedCache(
+                name="feed",
+                cache=LRUCache(
+                    max_size=settings.feed_cache_max_size,
+                    ttl_seconds=settings.feed_cache_ttl_seconds,
+                ),
+            ),
+        )
+        self._suggestions_cache = InstrumentedCache(
+            name="suggestions",
+            cache=LRUCache(
+                max_size=settings.suggestions_cache_max_size,
+                ttl_seconds=settings.suggestions_cache_ttl_seconds,
+            ),
+        )
+        self._tag_id_cache = TagIdCache(max_size=settings.tag_id_cache_max_size)
 
     @contextlib.asynccontextmanager
     async def context_session(self) -> AsyncIterator[AsyncSession]:
@@ -59,6 +114,50 @@ class Container:
             raise
         finally:
             await session.close()
+        await run_after_commit(session)
+
+    @contextlib.asynccontextmanager
+    async def stream_session(self) -> AsyncIterator[AsyncSession]:
+        async with self.context_session() as session:
+            # Server-side cursors require an open transaction even when the
+            # engine runs in autocommit mode. It also gives a streamed result
+            # and follow-up lookups the same snapshot.
+            await session.connection(
+                execution_options={"isolation_level": "REPEATABLE READ"}
+            )
+            yield session
+
+    async def warm_up_pool(
+        self, connections: int, prepare: Callable[[AsyncSession], Awaitable[None]]
+    ) -> int:
+        """
+        Open pool connections at once and run `prepare` on each of them.
+
+        asyncpg introspects types and caches prepared statements per
+        connection, so this spares the first requests on fresh connections.
+        Returns the number of connections opened.
+        """
+        pool = self._engine.pool
+        # Other pools do not keep the connections once they are returned.
+        if not isinstance(pool, QueuePool):
+            return 0
+        connections = min(connections, pool.size())
+
+        async def warm_up_connection() -> None:
+            async with self._engine.connect() as connection:
+                async with AsyncSession(bind=connection) as session:
+                    await prepare(session)
+
+        results = await asyncio.gather(
+            *(warm_up_connection() for _ in range(connections)), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return connections
+
+    async def dispose(self) -> None:
+        await self._engine.dispose()
 
     async def session(self) -> AsyncIterator[AsyncSession]:
         async with self._session() as session:
@@ -70,6 +169,19 @@ class Container:
                 raise
             finally:
                 await session.close()
+        await run_after_commit(session)
+
+    def cache(self) -> ICache:
+        return self._cache
+
+    def feed_cache(self) -> IComputedCache:
+        return self._feed_cache
+
+    def suggestions_cache(self) -> ICache:
+        return self._suggestions_cache
+
+    def tag_id_cache(self) -> ITagIdCache:
+        return self._tag_id_cache
 
     @staticmethod
     def user_model_mapper() -> IModelMapper:
@@ -94,11 +206,25 @@ class Container:
     def follower_repository() -> IFollowerRepository:
         return FollowerRepository()
 
+    def user_loader(self, session: AsyncSession) -> IUserLoader:
+        # Session lives exactly as long as the request, so the loader does too.
+        if (loader := session.info.get("user_loader")) is None:
+            loader = session.info["user_loader"] = UserLoader(
+                session=session, user_repo=self.user_repository()
+            )
+        return loader
+
     def tags_repository(self) -> ITagRepository:
-        return TagRepository(tag_mapper=self.tag_model_mapper())
+        return TagRepository(
+            tag_mapper=self.tag_model_mapper(), tag_id_cache=self.tag_id_cache()
+        )
 
     def article_repository(self) -> IArticleRepository:
-        return ArticleRepository(article_mapper=self.article_model_mapper())
+        return ArticleRepository(
+            article_mapper=self.article_model_mapper(),
+            tag_repo=self.tags_repository(),
+            tag_id_cache=self.tag_id_cache(),
+        )
 
     def article_tag_repository(self) -> IArticleTagRepository:
         return ArticleTagRepository(tag_mapper=self.tag_model_mapper())
@@ -124,29 +250,39 @@ class Container:
         )
 
     def user_service(self) -> IUserService:
-        return UserService(user_repo=self.user_repository())
+        return UserService(
+            user_repo=self.user_repository(),
+            user_loader_factory=self.user_loader,
+            cache=self.cache(),
+        )
 
     def profile_service(self) -> IProfileService:
         return ProfileService(
-            user_service=self.user_service(), follower_repo=self.follower_repository()
+            user_service=self.user_service(),
+            follower_repo=self.follower_repository(),
+            suggestions_cache=self.suggestions_cache(),
         )
 
     def tag_service(self) -> ITagService:
-        return TagService(tag_repo=self.tags_repository())
+        return TagService(
+            tag_repo=self.tags_repository(), suggestions_cache=self.suggestions_cache()
+        )
 
     def article_service(self) -> IArticleService:
         return ArticleService(
             article_repo=self.article_repository(),
             article_tag_repo=self.article_tag_repository(),
             favorite_repo=self.favorite_repository(),
+            follower_repo=self.follower_repository(),
             profile_service=self.profile_service(),
+            cache=self.cache(),
+            feed_cache=self.feed_cache(),
         )
 
     def comment_service(self) -> ICommentService:
         return CommentService(
             article_repo=self.article_repository(),
             comment_repo=self.comment_repository(),
-            profile_service=self.profile_service(),
         )
 
 
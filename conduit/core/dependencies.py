@@ -1,11 +1,26 @@
+import hmac
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
 from typing import Annotated
 
-from fastapi import Depends, Query
+from fastapi import Depends, Header, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from conduit.api.schemas.requests.article import ArticlesFilters, ArticlesPagination
+from conduit.api.schemas.requests.comment import CommentsPagination
+from conduit.core.config import get_app_settings
 from conduit.core.container import container
+from conduit.core.exceptions import (
+    AdminPermissionException,
+    IncorrectProfilerTokenException,
+    InvalidCursorException,
+    ProfilerDisabledException,
+)
+from conduit.core.request_context import bind_request_user
 from conduit.core.security import HTTPTokenHeader
+from conduit.core.utils.cursor import decode_cursor
+from conduit.domain.dtos.article import TagsMatch
+from conduit.domain.dtos.comment import CommentsCursorDTO
 from conduit.domain.dtos.user import UserDTO
 from conduit.services.article import ArticleService
 from conduit.services.auth import UserAuthService
@@ -44,6 +59,18 @@ ICommentService = Annotated[CommentService, Depends(container.comment_service)]
 DEFAULT_ARTICLES_LIMIT = 20
 DEFAULT_ARTICLES_OFFSET = 0
 
+DEFAULT_COMMENTS_LIMIT = 20
+MAX_COMMENTS_LIMIT = 100
+
+DEFAULT_SUGGESTIONS_LIMIT = 10
+
+
+def get_stream_session_factory() -> (
+    Callable[[], AbstractAsyncContextManager[AsyncSession]]
+):
+    # Streamed responses outlive request dependencies, so they open own session.
+    return container.stream_session
+
 
 def get_articles_pagination(
     limit: int = Query(DEFAULT_ARTICLES_LIMIT, ge=1),
@@ -53,10 +80,39 @@ def get_articles_pagination(
     return ArticlesPagination(limit=limit, offset=offset)
 
 
+def get_comments_pagination(
+    limit: int = Query(DEFAULT_COMMENTS_LIMIT, ge=1), cursor: str | None = None
+) -> CommentsPagination:
+    limit = min(limit, MAX_COMMENTS_LIMIT)
+    if not cursor:
+        return CommentsPagination(limit=limit)
+    try:
+        created_at, comment_id = decode_cursor(cursor=cursor)
+    except ValueError:
+        raise InvalidCursorException()
+    return CommentsPagination(
+        limit=limit, cursor=CommentsCursorDTO(created_at=created_at, id=comment_id)
+    )
+
+
+def get_suggestions_limit(limit: int = Query(DEFAULT_SUGGESTIONS_LIMIT, ge=1)) -> int:
+    return min(limit, DEFAULT_SUGGESTIONS_LIMIT)
+
+
 def get_articles_filters(
-    tag: str | None = None, author: str | None = None, favorited: str | None = None
+    tag: list[str] = Query([]),
+    match: TagsMatch = TagsMatch.any,
+    author: str | None = None,
+    favorited: str | None = None,
+    q: str | None = None,
 ) -> ArticlesFilters:
-    return ArticlesFilters(tag=tag, author=author, favorited=favorited)
+    return ArticlesFilters(
+        tags=sorted(set(tag)),
+        tags_match=match,
+        author=author,
+        favorited=favorited,
+        q=q.strip() if q else None,
+    )
 
 
 async def get_current_user_or_none(
@@ -70,6 +126,7 @@ async def get_current_user_or_none(
         current_user_dto = await user_service.get_user_by_id(
             session=session, user_id=jwt_user.user_id
         )
+        bind_request_user(user_id=current_user_dto.id)
         return current_user_dto
 
 
@@ -83,10 +140,47 @@ async def get_current_user(
     current_user_dto = await user_service.get_user_by_id(
         session=session, user_id=jwt_user.user_id
     )
+    bind_request_user(user_id=current_user_dto.id)
     return current_user_dto
 
 
+async def get_current_admin_user(
+    current_user: Annotated[UserDTO, Depends(get_current_user)]
+) -> UserDTO:
+    if current_user.username not in get_app_settings().admin_usernames:
+        raise AdminPermissionException()
+    return current_user
+
+
+async def get_profiler_admin_user(
+    current_user: Annotated[UserDTO, Depends(get_current_admin_user)],
+    x_profiler_token: str | None = Header(None),
+) -> UserDTO:
+    settings = get_app_settings()
+    if not settings.profiler_enabled:
+        raise ProfilerDisabledException()
+    if (
+        not settings.profiler_token
+        or not x_profiler_token
+        or not hmac.compare_digest(
+            x_profiler_token.encode(), settings.profiler_token.encode()
+        )
+    ):
+        raise IncorrectProfilerTokenException()
+    return current_user
+
+
 Pagination = Annotated[ArticlesPagination, Depends(get_articles_pagination)]
 QueryFilters = Annotated[ArticlesFilters, Depends(get_articles_filters)]
+SuggestionsLimit = Annotated[int, Depends(get_suggestions_limit)]
+DBStreamSessionFactory = Annotated[
+    Callable[[], AbstractAsyncContextManager[AsyncSession]],
+    Depends(get_stream_session_factory),
+]
+CommentsQueryPagination = Annotated[
+    CommentsPagination, Depends(get_comments_pagination)
+]
 CurrentOptionalUser = Annotated[UserDTO | None, Depends(get_current_user_or_none)]
 CurrentUser = Annotated[UserDTO, Depends(get_current_user)]
+CurrentAdminUser = Annotated[UserDTO, Depends(get_current_admin_user)]
+ProfilerAdminUser = Annotated[UserDTO, Depends(get_profiler_admin_user)]
@@ -100,6 +100,48 @@ class CommentPermissionException(BaseInternalException):
     _message = "Current user does not have permission to access the comment."
 
 
+class InvalidCursorException(BaseInternalException):
+    """Exception raised when pagination cursor can not be decoded."""
+
+    _status_code = 400
+    _message = "Invalid pagination cursor."
+
+
+class AdminPermissionException(BaseInternalException):
+    """Exception raised when not an admin user accesses the admin endpoints."""
+
+    _status_code = 403
+    _message = "Current user does not have admin permissions."
+
+
+class ProfilerDisabledException(BaseInternalException):
+    """Exception raised when the profiler endpoint is called while disabled."""
+
+    _status_code = 404
+    _message = "Profiler is disabled."
+
+
+class IncorrectProfilerTokenException(BaseInternalException):
+    """Exception raised when profiler token is missing or incorrect."""
+
+    _status_code = 403
+    _message = "Profiler token is missing or incorrect."
+
+
+class ProfilerBusyException(BaseInternalException):
+    """Exception raised when a profile is requested while another one runs."""
+
+    _status_code = 409
+    _message = "Another profile is running. Please try again later."
+
+
+class ImportLineValidationException(BaseInternalException):
+    """Exception raised when a line of imported data is not valid."""
+
+    _status_code = 422
+    _message = "Import data validation error."
+
+
 class EmailAlreadyTakenException(BaseInternalException):
     """Exception raised when email was found in database while registration."""
 
@@ -162,6 +204,13 @@ class ProfileNotFollowedFollowedException(BaseInternalException):
     _message = "Profile was not followed."
 
 
+class NotReadyException(BaseInternalException):
+    """Exception raised when the worker is starting or shutting down."""
+
+    _status_code = 503
+    _message = "Service is not ready to serve requests."
+
+
 class RateLimitExceededException(BaseInternalException):
     """Exception raised when rate limit exceeded during specific time."""
 
@@ -0,0 +1,73 @@
+import asyncio
+import signal
+import threading
+from enum import StrEnum
+from types import FrameType
+from typing import Any
+
+__all__ = ["Lifecycle", "LifecycleState", "lifecycle"]
+
+SHUTDOWN_SIGNALS = (signal.SIGINT, signal.SIGTERM)
+
+
+class LifecycleState(StrEnum):
+    """Stages of a worker, only a ready worker should get traffic."""
+
+    starting = "starting"
+    ready = "ready"
+    draining = "draining"
+    stopped = "stopped"
+
+
+class Lifecycle:
+    """
+    Readiness of the worker.
+
+    The server stops accepting connections as soon as it handles a shutdown
+    signal, before load balancers notice. The signal handlers installed here
+    report `draining` first and pass the signal on to the server after a
+    delay, so traffic moves to other workers while this one still serves.
+    Waiting for the in-flight requests is then left to the server, e.g.
+    uvicorn `--timeout-graceful-shutdown`.
+    """
+
+    def __init__(self) -> None:
+        self.state = LifecycleState.starting
+        self._server_handlers: dict[int, Any] = {}
+
+    def install_signal_handlers(self, delay: float) -> None:
+        # Signal handlers can only be set from the main thread.
+        if threading.current_thread() is not threading.main_thread():
+            return
+
+        loop = asyncio.get_running_loop()
+        for signum in SHUTDOWN_SIGNALS:
+            server_handler = signal.getsignal(signum)
+            if not callable(server_handler):
+                continue
+            self._server_handlers[signum] = server_handler
+
+            def handle_shutdown(
+                signum: int,
+                frame: FrameType | None,
+                server_handler: Any = server_handler,
+            ) -> None:
+                # A repeated signal is passed on at once, to force the exit.
+                if self.state == LifecycleState.draining:
+                    server_handler(signum, frame)
+                    return
+                self.state = LifecycleState.draining
+                # Wakes the loop up, it may be waiting for I/O.
+                loop.call_soon_threadsafe(
+                    loop.call_later, delay, server_handler, signum, frame
+                )
+
+            signal.signal(signum, handle_shutdown)
+
+    def restore_signal_handlers(self) -> None:
+        for signum, server_handler in self._server_handlers.items():
+            signal.signal(signum, server_handler)
+        self._server_handlers.clear()
+
+
+lifecycle = Lifecycle()
@@ -1,16 +1,27 @@
+import atexit
 import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from logging.handlers import QueueHandler, QueueListener
 
 import structlog
 from structlog.typing import EventDict, Processor
 
 from conduit.core.config import get_app_settings
+from conduit.core.metrics import LOG_RECORDS_DROPPED
+from conduit.core.query_stats import get_query_stats
+from conduit.core.request_context import get_request_context
 
-__all__ = ["configure_logger"]
+__all__ = ["DroppingQueueHandler", "EventSampler", "configure_logger"]
 
 DEFAULT_LOGGER_NAME = "conduit-api"
 
 settings = get_app_settings()
 
+_listener: QueueListener | None = None
+
 
 def rename_event_key(_: logging.Logger, __: str, event_dict: EventDict) -> EventDict:
     """
@@ -32,11 +43,119 @@ def drop_color_message_key(
     return event_dict
 
 
+def add_request_context(_: logging.Logger, __: str, event_dict: EventDict) -> EventDict:
+    """
+    Add the id, route and user of the request being served.
+    """
+    if (context := get_request_context()) is not None:
+        event_dict["request_id"] = context.request_id
+        if context.route is not None:
+            event_dict["route"] = context.route
+        if context.user_id is not None:
+            event_dict["user_id"] = context.user_id
+    return event_dict
+
+
+def add_query_stats(_: logging.Logger, __: str, event_dict: EventDict) -> EventDict:
+    """
+    Add database usage of the current request, when collected.
+    """
+    if (stats := get_query_stats()) is not None:
+        event_dict["db_queries"] = stats.count
+        event_dict["db_duration_ms"] = round(stats.duration * 1000, 2)
+    return event_dict
+
+
+@dataclass(slots=True)
+class _SamplingWindow:
+    started_at: float
+    seen: int = 1
+    dropped: int = 0
+
+
+class EventSampler:
+    """
+    Drop events repeated more than `burst` times within `window_seconds`.
+
+    Events are told apart by their level and message, so a burst of failed
+    logins is logged `burst` times per window. The first event passed in a
+    new window carries the number of the dropped ones in `sampled_out`.
+    """
+
+    # Above this many tracked events the expired windows are forgotten.
+    _max_events = 1024
+
+    def __init__(self, burst: int, window_seconds: float) -> None:
+        self._burst = burst
+        self._window_seconds = window_seconds
+        self._windows: dict[tuple[str, str], _SamplingWindow] = {}
+        # Records are also logged from the threads of the thread pool.
+        self._lock = threading.Lock()
+
+    def __call__(
+        self, _: logging.Logger, method_name: str, event_dict: EventDict
+    ) -> EventDict:
+        key = (method_name, str(event_dict.get("event")))
+        now = time.monotonic()
+        with self._lock:
+            window = self._windows.get(key)
+            if window is None or now - window.started_at >= self._window_seconds:
+                if len(self._windows) >= self._max_events:
+                    self._forget_expired(now=now)
+                self._windows[key] = _SamplingWindow(started_at=now)
+                if window is not None and window.dropped:
+                    event_dict["sampled_out"] = window.dropped
+                return event_dict
+
+            window.seen += 1
+            if window.seen <= self._burst:
+                return event_dict
+            window.dropped += 1
+        LOG_RECORDS_DROPPED.labels(reason="sampled").inc()
+        raise structlog.DropEvent
+
+    def _forget_expired(self, now: float) -> None:
+        self._windows = {
+            key: window
+            for key, window in self._windows.items()
+            if now - window.started_at < self._window_seconds
+        }
+
+
+class DroppingQueueHandler(QueueHandler):
+    """
+    Queue handler dropping records when the bounded queue is full.
+
+    Records are rendered by the caller, only the writing is left to the
+    listener thread, so the request context is still available.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.enqueue(self.prepare(record))
+        except queue.Full:
+            LOG_RECORDS_DROPPED.labels(reason="queue_full").inc()
+        except Exception:
+            self.handleError(record)
+
+
 def configure_logger(json_logs: bool = False) -> None:
     timestamper = structlog.processors.TimeStamper(fmt="%Y-%m-%d %H:%M:%S")
 
+    pre_processors: list[Processor] = []
+    if settings.log_sampling_burst:
+        # First, so the dropped events are not processed any further.
+        pre_processors.append(
+            EventSampler(
+                burst=settings.log_sampling_burst,
+                window_seconds=settings.log_sampling_window_seconds,
+            )
+        )
+
     shared_processors: list[Processor] = [
         structlog.contextvars.merge_contextvars,
+        add_request_context,
+        add_query_stats,
         structlog.stdlib.add_logger_name,
         structlog.stdlib.add_log_level,
         structlog.stdlib.PositionalArgumentsFormatter(),
@@ -54,7 +173,8 @@ def configure_logger(json_logs: bool = False) -> None:
         shared_processors.append(structlog.processors.format_exc_info)
 
     structlog.configure(
-        processors=shared_processors
+        processors=pre_processors
+        + shared_processors
         + [structlog.stdlib.ProcessorFormatter.wrap_for_formatter],
         logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
@@ -82,9 +202,19 @@ def _configure_default_logging_by_custom(
         ],
     )
 
-    handler = logging.StreamHandler()
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+
+    # Writing to the stream may block, so it is done in the listener thread.
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(
+        maxsize=settings.logging_queue_size
+    )
+    handler = DroppingQueueHandler(log_queue)
     # Use structlog `ProcessorFormatter` to format all `logging` entries.
     handler.setFormatter(formatter)
+    _listener = QueueListener(log_queue, logging.StreamHandler())
+    _listener.start()
 
     # Disable the `passlib` logger.
     logging.getLogger("passlib").setLevel(logging.ERROR)
@@ -92,6 +222,9 @@ def _configure_default_logging_by_custom(
 
     # Set logging level.
     root_logger = logging.getLogger()
+    for _handler in root_logger.handlers[:]:
+        if isinstance(_handler, DroppingQueueHandler):
+            root_logger.removeHandler(_handler)
     root_logger.addHandler(handler)
     root_logger.setLevel(settings.logging_level)
 
@@ -101,3 +234,10 @@ def _configure_default_logging_by_custom(
         # by structlog.
         logging.getLogger(_log).handlers.clear()
         logging.getLogger(_log).propagate = True
+
+
+@atexit.register
+def _stop_listener() -> None:
+    # Write the records left in the queue.
+    if _listener is not None:
+        _listener.stop()
@@ -0,0 +1,74 @@
+import asyncio
+import sys
+import threading
+import time
+import traceback
+
+from structlog import get_logger
+
+__all__ = ["EventLoopWatchdog"]
+
+logger = get_logger()
+
+
+class EventLoopWatchdog:
+    """
+    Detect callbacks blocking the event loop and log what they are running.
+
+    A task on the loop bumps a heartbeat every `interval_ms`. A separate
+    thread checks the heartbeat at the same pace, and when it goes stale for
+    longer than `threshold_ms` it samples the loop thread stack, which still
+    runs the blocking callback at that moment.
+    """
+
+    def __init__(self, interval_ms: float, threshold_ms: float) -> None:
+        self._interval = interval_ms / 1000
+        self._threshold = threshold_ms / 1000
+        self._heartbeat = time.monotonic()
+        self._stopped = threading.Event()
+        self._heartbeat_task: asyncio.Task[None] | None = None
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """
+        Start watching the running event loop.
+        """
+        self._heartbeat = time.monotonic()
+        self._heartbeat_task = asyncio.get_running_loop().create_task(self._beat())
+        self._thread = threading.Thread(
+            target=self._watch,
+            args=(threading.get_ident(),),
+            name="event-loop-watchdog",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+        if self._thread is not None:
+            self._thread.join()
+
+    async def _beat(self) -> None:
+        while True:
+            self._heartbeat = time.monotonic()
+            await asyncio.sleep(self._interval)
+
+    def _watch(self, loop_thread_id: int) -> None:
+        reported_heartbeat = None
+        while not self._stopped.wait(self._interval):
+            heartbeat = self._heartbeat
+            blocked = time.monotonic() - heartbeat - self._interval
+            # One report per blocking callback, until the heartbeat moves on.
+            if blocked < self._threshold or heartbeat == reported_heartbeat:
+                continue
+
+            reported_heartbeat = heartbeat
+            if (frame := sys._current_frames().get(loop_thread_id)) is None:
+                continue
+            logger.warning(
+                "Event loop blocked",
+                blocked_ms=round(blocked * 1000, 2),
+                stack="".join(traceback.format_stack(frame)),
+            )
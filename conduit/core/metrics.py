@@ -0,0 +1,129 @@
+"""
+Prometheus metrics of the application.
+
+With several worker processes set `PROMETHEUS_MULTIPROC_DIR` to an empty
+directory shared by the workers, every worker then writes its samples there
+and the `/metrics` endpoint aggregates them.
+"""
+
+import asyncio
+import os
+import time
+from typing import Any
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP requests latency by route.",
+    ["method", "route", "status"],
+)
+REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "HTTP requests being served.",
+    multiprocess_mode="livesum",
+)
+RATE_LIMITED_REQUESTS = Counter(
+    "http_rate_limited_requests", "HTTP requests rejected by the rate limiter."
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out_connections",
+    "Database connections in use.",
+    multiprocess_mode="livesum",
+)
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow_connections",
+    "Database connections opened above the pool size.",
+    multiprocess_mode="livesum",
+)
+DB_POOL_WAIT = Histogram(
+    "db_pool_wait_seconds",
+    "Time spent waiting for a database connection.",
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 5, 30),
+)
+CACHE_REQUESTS = Counter(
+    "cache_requests",
+    "Cache lookups by result, coalesced misses waited for another computation.",
+    ["cache", "result"],
+)
+CLIENT_ERRORS = Counter("client_errors", "Expected client errors by event.", ["event"])
+LOG_RECORDS_DROPPED = Counter(
+    "log_records_dropped",
+    "Log records not written, sampled out or over the queue size.",
+    ["reason"],
+)
+EVENT_LOOP_LAG = Histogram(
+    "event_loop_lag_seconds",
+    "Delay of event loop callbacks past their schedule.",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
+)
+
+
+class MeteredAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    Connection pool recording how long checkouts wait for a connection.
+    """
+
+    def _do_get(self) -> Any:
+        started_at = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_WAIT.observe(time.perf_counter() - started_at)
+
+
+def instrument_pool(engine: Engine) -> None:
+    """
+    Track connections in use, for the pools that keep count of them.
+    """
+    if not isinstance(engine.pool, AsyncAdaptedQueuePool):
+        return
+
+    def on_change(*_: Any) -> None:
+        # A disposed engine replaces its pool, the listeners carry over.
+        pool = engine.pool
+        DB_POOL_CHECKED_OUT.set(pool.checkedout())
+        DB_POOL_OVERFLOW.set(max(pool.overflow(), 0))
+
+    event.listen(engine.pool, "checkout", on_change)
+    event.listen(engine.pool, "checkin", on_change)
+
+
+async def monitor_event_loop_lag(interval: float) -> None:
+    """
+    Measure how late the event loop wakes up a task sleeping for `interval`.
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        started_at = loop.time()
+        await asyncio.sleep(interval)
+        EVENT_LOOP_LAG.observe(max(loop.time() - started_at - interval, 0))
+
+
+def generate_metrics() -> bytes:
+    if "PROMETHEUS_MULTIPROC_DIR" not in os.environ:
+        return generate_latest(REGISTRY)
+
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return generate_latest(registry)
+
+
+def mark_process_dead() -> None:
+    """
+    Drop live gauges of the current worker from the multiprocess files.
+    """
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        multiprocess.mark_process_dead(os.getpid())
@@ -0,0 +1,140 @@
+import asyncio
+import sys
+import threading
+from collections import Counter
+from enum import StrEnum
+from types import FrameType
+from typing import Any
+
+__all__ = ["ProfileFormat", "SamplingProfiler", "collapse_stacks", "speedscope_profile"]
+
+# Function name, file name and first line, so lines of a function add up.
+Frame = tuple[str, str, int]
+# Outermost frame first.
+Stack = tuple[Frame, ...]
+
+
+class ProfileFormat(StrEnum):
+    """Output formats of a profile."""
+
+    collapsed = "collapsed"
+    speedscope = "speedscope"
+
+
+class SamplingProfiler:
+    """
+    Statistical profiler of the current process.
+
+    A thread wakes up every `interval` seconds and records the stacks of all
+    other threads, the event loop thread included, so coroutines show up
+    with the frames they are running. Only the standard library is used and
+    the profiled code is not slowed down apart from the sampling itself.
+    """
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self.samples: Counter[tuple[str, Stack]] = Counter()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(
+            target=self._sample, name="sampling-profiler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    async def run(self, duration: float) -> None:
+        """
+        Sample for `duration` seconds without blocking the event loop.
+        """
+        self.start()
+        try:
+            await asyncio.sleep(duration)
+        finally:
+            await asyncio.to_thread(self.stop)
+
+    def _sample(self) -> None:
+        own_thread_id = threading.get_ident()
+        while not self._stopped.wait(self.interval):
+            thread_names = {
+                thread.ident: thread.name for thread in threading.enumerate()
+            }
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_thread_id:
+                    continue
+                thread_name = thread_names.get(thread_id, str(thread_id))
+                self.samples[(thread_name, _extract_stack(frame))] += 1
+
+
+def _extract_stack(frame: FrameType | None) -> Stack:
+    stack = []
+    while frame is not None:
+        code = frame.f_code
+        stack.append((code.co_qualname, code.co_filename, code.co_firstlineno))
+        frame = frame.f_back
+    return tuple(reversed(stack))
+
+
+def collapse_stacks(samples: Counter[tuple[str, Stack]]) -> str:
+    """
+    Render samples as collapsed stacks, the input of `flamegraph.pl`.
+
+    Every line holds the thread name and the frames separated with `;`,
+    followed by the number of samples.
+    """
+    lines = []
+    for (thread_name, stack), count in samples.most_common():
+        frames = ";".join(
+            f"{name} ({filename}:{line})" for name, filename, line in stack
+        )
+        lines.append(f"{thread_name};{frames} {count}")
+    return "".join(f"{line}\n" for line in lines)
+
+
+def speedscope_profile(
+    samples: Counter[tuple[str, Stack]], interval: float, name: str
+) -> dict[str, Any]:
+    """
+    Render samples in the speedscope file format, one profile per thread.
+    """
+    frames: list[dict[str, Any]] = []
+    frame_indexes: dict[Frame, int] = {}
+    profiles: dict[str, dict[str, Any]] = {}
+    for (thread_name, stack), count in samples.items():
+        if thread_name not in profiles:
+            profiles[thread_name] = {
+                "type": "sampled",
+                "name": thread_name,
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": 0,
+                "samples": [],
+                "weights": [],
+            }
+        profile = profiles[thread_name]
+
+        indexes = []
+        for frame in stack:
+            if frame not in frame_indexes:
+                frame_indexes[frame] = len(frames)
+                function_name, filename, line = frame
+                frames.append({"name": function_name, "file": filename, "line": line})
+            indexes.append(frame_indexes[frame])
+
+        weight = count * interval
+        profile["samples"].append(indexes)
+        profile["weights"].append(weight)
+        profile["endValue"] += weight
+
+    return {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "name": name,
+        "exporter": "conduit",
+        "shared": {"frames": frames},
+        "profiles": list(profiles.values()),
+    }
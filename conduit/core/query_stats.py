@@ -0,0 +1,105 @@
+import contextlib
+import time
+from collections.abc import Iterator
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+__all__ = [
+    "QueryStats",
+    "collect_query_stats",
+    "detach_query_stats",
+    "get_query_stats",
+    "instrument_engine",
+]
+
+_query_stats: ContextVar["QueryStats | None"] = ContextVar("query_stats", default=None)
+
+
+@dataclass
+class QueryStats:
+    """
+    Statements executed within a unit of work, usually one request.
+    """
+
+    count: int = 0
+    duration: float = 0.0
+    slowest_duration: float = 0.0
+    slowest_statement: str | None = None
+
+    def add(self, statement: str, duration: float) -> None:
+        self.count += 1
+        self.duration += duration
+        if duration >= self.slowest_duration:
+            self.slowest_duration = duration
+            self.slowest_statement = statement
+
+    def merge(self, other: "QueryStats") -> None:
+        self.count += other.count
+        self.duration += other.duration
+        if other.slowest_statement and other.slowest_duration >= self.slowest_duration:
+            self.slowest_duration = other.slowest_duration
+            self.slowest_statement = other.slowest_statement
+
+    def server_timing(self) -> str:
+        """
+        Render the stats as a `Server-Timing` header value.
+        """
+        return (
+            f'db;dur={self.duration * 1000:.2f};desc="{self.count} queries", '
+            f"db-slowest;dur={self.slowest_duration * 1000:.2f}"
+        )
+
+
+def get_query_stats() -> QueryStats | None:
+    return _query_stats.get()
+
+
+@contextlib.contextmanager
+def collect_query_stats() -> Iterator[QueryStats]:
+    """
+    Record statements executed in the current context and the tasks it spawns.
+
+    Nested collections are also added to the enclosing one.
+    """
+    parent = _query_stats.get()
+    stats = QueryStats()
+    token = _query_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _query_stats.reset(token)
+        if parent is not None:
+            parent.merge(stats)
+
+
+def detach_query_stats() -> None:
+    """
+    Stop recording statements of the current context in the stats it inherited.
+
+    Background tasks spawned by a request copy its context, but their
+    statements are not part of the request.
+    """
+    _query_stats.set(None)
+
+
+def instrument_engine(engine: Engine) -> None:
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def _before_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, *_: Any
+) -> None:
+    context.query_started_at = time.perf_counter()
+
+
+def _after_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, *_: Any
+) -> None:
+    if (stats := _query_stats.get()) is not None:
+        duration = time.perf_counter() - context.query_started_at
+        stats.add(statement=statement, duration=duration)
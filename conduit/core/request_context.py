@@ -0,0 +1,75 @@
+import contextlib
+import time
+from collections.abc import Iterator
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+__all__ = [
+    "RequestContext",
+    "bind_request_context",
+    "bind_request_user",
+    "get_request_context",
+]
+
+_request_context: ContextVar["RequestContext | None"] = ContextVar(
+    "request_context", default=None
+)
+
+
+@dataclass
+class RequestContext:
+    """
+    Request being served, attached to the logs emitted while serving it.
+
+    The context is filled in as the request goes through routing and
+    dependencies, which run in tasks and threads of their own, so it is
+    shared as one mutable object rather than separate context variables.
+    """
+
+    request_id: str
+    route: str | None = None
+    user_id: int | None = None
+    handler_duration: float | None = None
+    serialization_duration: float | None = None
+    handler_finished_at: float | None = None
+
+    def finish_handler(self, started_at: float) -> None:
+        self.handler_finished_at = time.perf_counter()
+        self.handler_duration = self.handler_finished_at - started_at
+
+    def finish_serialization(self) -> None:
+        if self.handler_finished_at is not None:
+            self.serialization_duration = time.perf_counter() - self.handler_finished_at
+
+    def server_timing(self) -> str | None:
+        """
+        Render the durations as a `Server-Timing` header value, when measured.
+        """
+        timings = [
+            f"{name};dur={duration * 1000:.2f}"
+            for name, duration in (
+                ("handler", self.handler_duration),
+                ("serialization", self.serialization_duration),
+            )
+            if duration is not None
+        ]
+        return ", ".join(timings) or None
+
+
+def get_request_context() -> RequestContext | None:
+    return _request_context.get()
+
+
+@contextlib.contextmanager
+def bind_request_context(request_id: str) -> Iterator[RequestContext]:
+    context = RequestContext(request_id=request_id)
+    token = _request_context.set(context)
+    try:
+        yield context
+    finally:
+        _request_context.reset(token)
+
+
+def bind_request_user(user_id: int) -> None:
+    if (context := _request_context.get()) is not None:
+        context.user_id = user_id
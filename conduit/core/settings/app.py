@@ -25,6 +25,15 @@ class AppSettings(BaseAppSettings):
     allowed_hosts: list[str] = ["*"]
 
     logging_level: int = logging.INFO
+    # Render logs as JSON lines instead of the colored console output.
+    json_logs: bool = False
+    # Records waiting to be written by the logging thread, further records
+    # are dropped.
+    logging_queue_size: int = 10000
+    # Events repeated more than the burst within the window are dropped,
+    # 0 disables the sampling.
+    log_sampling_burst: int = 20
+    log_sampling_window_seconds: float = 10
 
     class Config:
         validate_assignment = True
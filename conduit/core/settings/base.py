@@ -30,6 +30,53 @@ class BaseAppSettings(BaseSettings):
     jwt_token_expiration_minutes: int = 60 * 24 * 7  # one week.
     jwt_algorithm: str = "HS256"
 
+    # Requests a client IP can make per minute, 0 disables the limit.
+    rate_limit_requests: int = 100
+
+    # Statements slower than this are logged, 0 disables the log.
+    slow_query_threshold_ms: float = 0
+    # Share of the slow `SELECT` statements explained with `EXPLAIN ANALYZE`.
+    slow_query_explain_sample_rate: float = 0.0
+
+    # How often the event loop lag is sampled for the metrics.
+    event_loop_lag_interval_seconds: float = 0.5
+    # Callbacks blocking the loop longer than this are logged with their
+    # stack, 0 disables the watchdog.
+    event_loop_watchdog_threshold_ms: float = 0
+    event_loop_watchdog_interval_ms: float = 20
+
+    # Pool connections opened at startup, with the hot statements prepared
+    # on each, before the worker reports ready. Capped by the pool size.
+    db_pool_warmup_connections: int = 5
+    # How long the readiness reports draining on a shutdown signal before the
+    # server stops accepting connections. Set it above the time load balancers
+    # take to notice, e.g. the readiness probe period times its threshold.
+    shutdown_readiness_delay_seconds: float = 0
+
+    # Users allowed to call the `/admin` endpoints.
+    admin_usernames: list[str] = []
+
+    # The `/admin/profile` endpoint also requires the token in the
+    # `X-Profiler-Token` header.
+    profiler_enabled: bool = False
+    profiler_token: str | None = None
+    profiler_max_duration_seconds: float = 30
+
+    cache_max_size: int = 1024
+    cache_ttl_seconds: int = 60
+    # Shared cache backend, e.g. `redis://localhost:6379/0`. Without it every
+    # worker caches in its own memory, so workers only agree with themselves
+    # and an entry another worker changed is served stale until its TTL ends.
+    cache_redis_url: str | None = None
+    # Anonymous global feed responses.
+    feed_cache_max_size: int = 256
+    feed_cache_ttl_seconds: int = 5
+    # Tags & profiles autocomplete responses.
+    suggestions_cache_max_size: int = 4096
+    suggestions_cache_ttl_seconds: int = 30
+    # Interned tag name to id pairs, tags are never removed.
+    tag_id_cache_max_size: int = 65536
+
     class Config:
         env_file = ".env"
         extra = Extra.ignore
@@ -17,6 +17,18 @@ class TestAppSettings(AppSettings):
 
     logging_level: int = logging.DEBUG
 
+    # One application serves the whole test session, from the same client IP.
+    rate_limit_requests: int = 0
+
+    # Tables are recreated for every test, so cached ids would go stale.
+    cache_max_size: int = 0
+    feed_cache_max_size: int = 0
+    suggestions_cache_max_size: int = 0
+    tag_id_cache_max_size: int = 0
+
+    # Connections are not pooled in tests.
+    db_pool_warmup_connections: int = 0
+
     class Config(AppSettings.Config):
         env_file = ".env.test"
 
@@ -0,0 +1,111 @@
+import asyncio
+import random
+import time
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from structlog import get_logger
+
+from conduit.core.query_stats import detach_query_stats
+
+__all__ = ["SlowQueryLogger", "parameters_shape"]
+
+logger = get_logger()
+
+# Statements run by the logger itself are never reported again.
+SKIP_OPTION = "skip_slow_query_log"
+
+
+def parameters_shape(parameters: Any, executemany: bool = False) -> Any:
+    """
+    Describe bound parameters by their types, values may be sensitive.
+    """
+    if executemany:
+        return {
+            "rows": len(parameters),
+            "row": parameters_shape(parameters[0]) if parameters else None,
+        }
+    if isinstance(parameters, dict):
+        return {key: type(value).__name__ for key, value in parameters.items()}
+    if isinstance(parameters, list | tuple):
+        return [type(value).__name__ for value in parameters]
+    return type(parameters).__name__
+
+
+class SlowQueryLogger:
+    """
+    Log statements slower than the threshold.
+
+    A sampled share of the slow `SELECT` statements is explained with
+    `EXPLAIN (ANALYZE, BUFFERS)` on a separate connection in the background,
+    one at a time and inside a rolled back transaction.
+    """
+
+    def __init__(
+        self, engine: AsyncEngine, threshold_ms: float, explain_sample_rate: float
+    ) -> None:
+        self._engine = engine
+        self._threshold = threshold_ms / 1000
+        self._explain_sample_rate = explain_sample_rate
+        self._explain_task: asyncio.Task[None] | None = None
+
+        event.listen(engine.sync_engine, "before_cursor_execute", self._before_execute)
+        event.listen(engine.sync_engine, "after_cursor_execute", self._after_execute)
+
+    @staticmethod
+    def _before_execute(
+        conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, *_: Any
+    ) -> None:
+        context.slow_query_started_at = time.perf_counter()
+
+    def _after_execute(
+        self,
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        duration = time.perf_counter() - context.slow_query_started_at
+        if duration < self._threshold or conn.get_execution_options().get(SKIP_OPTION):
+            return
+
+        logger.warning(
+            "Slow query",
+            statement=statement,
+            parameters=parameters_shape(parameters, executemany=executemany),
+            duration_ms=round(duration * 1000, 2),
+        )
+        if (
+            not executemany
+            and statement.lstrip()[:6].upper() == "SELECT"
+            and random.random() < self._explain_sample_rate
+            and (self._explain_task is None or self._explain_task.done())
+        ):
+            # Listeners run inside the event loop thread, under a greenlet.
+            self._explain_task = asyncio.get_running_loop().create_task(
+                self._explain(statement=statement, parameters=parameters)
+            )
+
+    async def _explain(self, statement: str, parameters: Any) -> None:
+        # The task copied the request context, keep its log fields only.
+        detach_query_stats()
+        try:
+            async with self._engine.connect() as conn:
+                conn = await conn.execution_options(**{SKIP_OPTION: True})
+                async with conn.begin() as transaction:
+                    result = await conn.exec_driver_sql(
+                        f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {statement}",
+                        parameters,
+                    )
+                    plan = result.scalar()
+                    # ANALYZE runs the statement, nothing it did is kept.
+                    await transaction.rollback()
+        except (OSError, SQLAlchemyError):
+            logger.exception("Slow query explain failed", statement=statement)
+            return
+
+        logger.warning("Slow query plan", statement=statement, plan=plan)
@@ -0,0 +1,29 @@
+import base64
+import datetime
+
+
+def encode_cursor(created_at: datetime.datetime, id: int) -> str:
+    """
+    Encode keyset pagination position into an opaque cursor.
+
+    Example:
+        encode_cursor(datetime.datetime(2024, 4, 15, 21, 23, 56), 42)
+        "MjAyNC0wNC0xNVQyMToyMzo1Nnw0Mg"
+    """
+    raw = f"{created_at.isoformat()}|{id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime.datetime, int]:
+    """
+    Decode an opaque cursor created by `encode_cursor`.
+
+    Raises `ValueError` if the cursor is malformed.
+    """
+    padding = "=" * (-len(cursor) % 4)
+    try:
+        raw = base64.urlsafe_b64decode(cursor + padding).decode()
+        created_at, id = raw.rsplit("|", 1)
+        return datetime.datetime.fromisoformat(created_at), int(id)
+    except (UnicodeDecodeError, ValueError) as err:
+        raise ValueError(f"Invalid cursor: {cursor}") from err
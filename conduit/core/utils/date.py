@@ -3,3 +3,12 @@ import datetime
 
 def convert_datetime_to_realworld(dt: datetime.datetime) -> str:
     return dt.replace(tzinfo=datetime.UTC).isoformat().replace("+00:00", "Z")
+
+
+def convert_datetime_to_naive_utc(dt: datetime.datetime) -> datetime.datetime:
+    """
+    Convert aware datetime to naive UTC, as timestamps are stored in the database.
+    """
+    if dt.tzinfo is None:
+        return dt
+    return dt.astimezone(datetime.UTC).replace(tzinfo=None)
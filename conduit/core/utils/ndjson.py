@@ -0,0 +1,16 @@
+from collections.abc import AsyncIterable, AsyncIterator
+
+
+async def iter_ndjson_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+    """
+    Split a stream of bytes chunks into non-empty NDJSON lines.
+    """
+    buffer = b""
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield line
+    if buffer.strip():
+        yield buffer
@@ -0,0 +1,67 @@
+import abc
+import json
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from typing import Any
+
+from conduit.domain.dtos.article import TagsMatch
+
+
+def article_cache_key(slug: str) -> str:
+    return f"article:{slug}"
+
+
+def author_cache_key(user_id: int) -> str:
+    return f"author:{user_id}"
+
+
+def articles_feed_cache_key(
+    limit: int,
+    offset: int,
+    tags: list[str] | None = None,
+    tags_match: TagsMatch = TagsMatch.any,
+    author: str | None = None,
+    favorited: str | None = None,
+    q: str | None = None,
+) -> str:
+    filters = json.dumps([tags, tags_match, author, favorited, q, limit, offset])
+    return f"articles_feed:{filters}"
+
+
+def tags_suggestions_cache_key(prefix: str, limit: int) -> str:
+    return f"tags_suggestions:{limit}:{prefix}"
+
+
+def profiles_suggestions_cache_key(prefix: str, limit: int) -> str:
+    return f"profiles_suggestions:{limit}:{prefix}"
+
+
+class ICache(abc.ABC):
+    """Key-value cache interface."""
+
+    @abc.abstractmethod
+    async def get(self, key: str) -> Any | None: ...
+
+    @abc.abstractmethod
+    async def set(self, key: str, value: Any) -> None: ...
+
+    @abc.abstractmethod
+    async def delete(self, *keys: str) -> None: ...
+
+
+class IComputedCache(abc.ABC):
+    """Cache filled on a miss by a computation shared between concurrent callers."""
+
+    @abc.abstractmethod
+    async def get_or_set(
+        self, key: str, factory: Callable[[], Awaitable[Any]]
+    ) -> Any: ...
+
+
+class ITagIdCache(abc.ABC):
+    """Process-wide tag name to id interning map."""
+
+    @abc.abstractmethod
+    def get_many(self, tags: Iterable[str]) -> dict[str, int]: ...
+
+    @abc.abstractmethod
+    def set_many(self, tag_ids: Mapping[str, int]) -> None: ...
@@ -1,9 +1,17 @@
 import datetime
 from dataclasses import dataclass, replace
+from enum import StrEnum
 
 from conduit.domain.dtos.profile import ProfileDTO
 
 
+class TagsMatch(StrEnum):
+    """How articles are matched when filtering by several tags."""
+
+    any = "any"
+    all = "all"
+
+
 @dataclass(frozen=True)
 class ArticleRecordDTO:
     id: int
@@ -47,6 +55,15 @@ class ArticleDTO:
         return replace(dto, **updated_fields)
 
 
+@dataclass(frozen=True)
+class CachedArticleDTO:
+    """Viewer independent part of the article."""
+
+    article: ArticleRecordDTO
+    tags: list[str]
+    favorites_count: int
+
+
 @dataclass(frozen=True)
 class ArticlesFeedDTO:
     articles: list[ArticleDTO]
@@ -61,6 +78,22 @@ class CreateArticleDTO:
     tags: list[str]
 
 
+@dataclass(frozen=True)
+class ImportArticleDTO:
+    title: str
+    description: str
+    body: str
+    tags: list[str]
+    # Username of the author, falls back to the importing user.
+    author: str | None = None
+    created_at: datetime.datetime | None = None
+
+
+@dataclass(frozen=True)
+class ImportedArticlesDTO:
+    articles_count: int
+
+
 @dataclass(frozen=True)
 class UpdateArticleDTO:
     title: str | None
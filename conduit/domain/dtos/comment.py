@@ -27,6 +27,13 @@ class CommentDTO:
 class CommentsListDTO:
     comments: list[CommentDTO]
     comments_count: int
+    next_cursor: str | None = None
+
+
+@dataclass(frozen=True)
+class CommentsCursorDTO:
+    created_at: datetime.datetime
+    id: int
 
 
 @dataclass(frozen=True)
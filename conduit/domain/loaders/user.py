@@ -0,0 +1,20 @@
+import abc
+from collections.abc import Collection
+
+from conduit.domain.dtos.user import UserDTO
+
+
+class IUserLoader(abc.ABC):
+    """Request scoped batching & caching users loader interface."""
+
+    @abc.abstractmethod
+    async def load(self, user_id: int) -> UserDTO: ...
+
+    @abc.abstractmethod
+    async def load_many(self, user_ids: Collection[int]) -> list[UserDTO]: ...
+
+    @abc.abstractmethod
+    async def load_by_username(self, username: str) -> UserDTO: ...
+
+    @abc.abstractmethod
+    def prime(self, user: UserDTO) -> None: ...
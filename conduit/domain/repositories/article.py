@@ -1,10 +1,14 @@
 import abc
+import datetime
+from collections.abc import AsyncIterator, Sequence
 from typing import Any
 
 from conduit.domain.dtos.article import (
     ArticleDTO,
     ArticleRecordDTO,
     CreateArticleDTO,
+    ImportArticleDTO,
+    TagsMatch,
     UpdateArticleDTO,
 )
 
@@ -17,6 +21,16 @@ class IArticleRepository(abc.ABC):
         self, session: Any, author_id: int, create_item: CreateArticleDTO
     ) -> ArticleRecordDTO: ...
 
+    @abc.abstractmethod
+    async def add_with_tags(
+        self, session: Any, author_id: int, create_item: CreateArticleDTO
+    ) -> ArticleRecordDTO: ...
+
+    @abc.abstractmethod
+    async def add_many(
+        self, session: Any, author_id: int, create_items: Sequence[ImportArticleDTO]
+    ) -> int: ...
+
     @abc.abstractmethod
     async def get_by_slug_or_none(
         self, session: Any, slug: str
@@ -25,6 +39,9 @@ class IArticleRepository(abc.ABC):
     @abc.abstractmethod
     async def get_by_slug(self, session: Any, slug: str) -> ArticleRecordDTO: ...
 
+    @abc.abstractmethod
+    async def get_id_by_slug(self, session: Any, slug: str) -> int: ...
+
     @abc.abstractmethod
     async def delete_by_slug(self, session: Any, slug: str) -> None: ...
 
@@ -33,6 +50,16 @@ class IArticleRepository(abc.ABC):
         self, session: Any, slug: str, update_item: UpdateArticleDTO
     ) -> ArticleRecordDTO: ...
 
+    @abc.abstractmethod
+    async def favorite_by_slug(
+        self, session: Any, slug: str, user_id: int
+    ) -> ArticleDTO: ...
+
+    @abc.abstractmethod
+    async def unfavorite_by_slug(
+        self, session: Any, slug: str, user_id: int
+    ) -> ArticleDTO: ...
+
     @abc.abstractmethod
     async def list_by_followings(
         self, session: Any, user_id: int, limit: int, offset: int
@@ -49,7 +76,8 @@ class IArticleRepository(abc.ABC):
         session: Any,
         limit: int,
         offset: int,
-        tag: str | None = None,
+        tags: list[str] | None = None,
+        tags_match: TagsMatch = TagsMatch.any,
         author: str | None = None,
         favorited: str | None = None,
     ) -> list[ArticleRecordDTO]: ...
@@ -61,11 +89,18 @@ class IArticleRepository(abc.ABC):
         user_id: int | None,
         limit: int,
         offset: int,
-        tag: str | None = None,
+        tags: list[str] | None = None,
+        tags_match: TagsMatch = TagsMatch.any,
         author: str | None = None,
         favorited: str | None = None,
+        q: str | None = None,
     ) -> list[ArticleDTO]: ...
 
+    @abc.abstractmethod
+    def stream_by_updated_since(
+        self, session: Any, chunk_size: int, since: datetime.datetime | None = None
+    ) -> AsyncIterator[list[ArticleDTO]]: ...
+
     @abc.abstractmethod
     async def count_by_followings(self, session: Any, user_id: int) -> int: ...
 
@@ -73,7 +108,9 @@ class IArticleRepository(abc.ABC):
     async def count_by_filters(
         self,
         session: Any,
-        tag: str | None = None,
+        tags: list[str] | None = None,
+        tags_match: TagsMatch = TagsMatch.any,
         author: str | None = None,
         favorited: str | None = None,
+        q: str | None = None,
     ) -> int: ...
@@ -1,19 +1,22 @@
 import abc
+from collections.abc import AsyncIterator
 from typing import Any
 
-from conduit.domain.dtos.comment import CommentRecordDTO, CreateCommentDTO
+from conduit.domain.dtos.comment import (
+    CommentDTO,
+    CommentRecordDTO,
+    CommentsCursorDTO,
+    CommentsListDTO,
+    CreateCommentDTO,
+)
 
 
 class ICommentRepository(abc.ABC):
     """Comment repository interface."""
 
     @abc.abstractmethod
-    async def add(
-        self,
-        session: Any,
-        author_id: int,
-        article_id: int,
-        create_item: CreateCommentDTO,
+    async def add_by_slug(
+        self, session: Any, author_id: int, slug: str, create_item: CreateCommentDTO
     ) -> CommentRecordDTO: ...
 
     @abc.abstractmethod
@@ -25,10 +28,21 @@ class ICommentRepository(abc.ABC):
     async def get(self, session: Any, comment_id: int) -> CommentRecordDTO: ...
 
     @abc.abstractmethod
-    async def list(self, session: Any, article_id: int) -> list[CommentRecordDTO]: ...
+    def stream(
+        self, session: Any, article_id: int, user_id: int | None, chunk_size: int
+    ) -> AsyncIterator[list[CommentDTO]]: ...
 
     @abc.abstractmethod
-    async def delete(self, session: Any, comment_id: int) -> None: ...
+    async def list_by_slug(
+        self,
+        session: Any,
+        slug: str,
+        user_id: int | None,
+        limit: int | None = None,
+        cursor: CommentsCursorDTO | None = None,
+    ) -> CommentsListDTO: ...
 
     @abc.abstractmethod
-    async def count(self, session: Any, article_id: int) -> int: ...
+    async def delete_by_slug(
+        self, session: Any, slug: str, comment_id: int, author_id: int
+    ) -> None: ...
@@ -1,4 +1,5 @@
 import abc
+from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -7,5 +8,21 @@ from conduit.domain.dtos.tag import TagDTO
 
 class ITagRepository(abc.ABC):
 
+    @abc.abstractmethod
+    async def get_ids(
+        self, session: AsyncSession, tags: list[str]
+    ) -> dict[str, int]: ...
+
+    @abc.abstractmethod
+    def ids_query(self, tags: list[str]) -> Any: ...
+
+    @abc.abstractmethod
+    async def load_ids(self, session: AsyncSession) -> None: ...
+
+    @abc.abstractmethod
+    async def list_by_prefix(
+        self, session: AsyncSession, prefix: str, limit: int
+    ) -> list[TagDTO]: ...
+
     @abc.abstractmethod
     async def list(self, session: AsyncSession) -> list[TagDTO]: ...
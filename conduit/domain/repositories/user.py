@@ -30,6 +30,16 @@ class IUserRepository(abc.ABC):
         self, session: Any, user_ids: Collection[int]
     ) -> list[UserDTO]: ...
 
+    @abc.abstractmethod
+    async def list_by_username_prefix(
+        self, session: Any, prefix: str, limit: int
+    ) -> list[UserDTO]: ...
+
+    @abc.abstractmethod
+    async def list_by_usernames(
+        self, session: Any, usernames: Collection[str]
+    ) -> list[UserDTO]: ...
+
     @abc.abstractmethod
     async def get_by_username_or_none(
         self, session: Any, username: str
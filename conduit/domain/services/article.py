@@ -1,10 +1,15 @@
 import abc
+import datetime
+from collections.abc import AsyncIterable, AsyncIterator
 from typing import Any
 
 from conduit.domain.dtos.article import (
     ArticleDTO,
     ArticlesFeedDTO,
     CreateArticleDTO,
+    ImportArticleDTO,
+    ImportedArticlesDTO,
+    TagsMatch,
     UpdateArticleDTO,
 )
 from conduit.domain.dtos.user import UserDTO
@@ -14,9 +19,18 @@ class IArticleService(abc.ABC):
 
     @abc.abstractmethod
     async def create_new_article(
-        self, session: Any, author_id: int, article_to_create: CreateArticleDTO
+        self, session: Any, current_user: UserDTO, article_to_create: CreateArticleDTO
     ) -> ArticleDTO: ...
 
+    @abc.abstractmethod
+    async def import_articles(
+        self,
+        session: Any,
+        articles: AsyncIterable[ImportArticleDTO],
+        current_user: UserDTO,
+        batch_size: int,
+    ) -> ImportedArticlesDTO: ...
+
     @abc.abstractmethod
     async def get_article_by_slug(
         self, session: Any, slug: str, current_user: UserDTO | None
@@ -44,7 +58,8 @@ class IArticleService(abc.ABC):
         current_user: UserDTO | None,
         limit: int,
         offset: int,
-        tag: str | None = None,
+        tags: list[str] | None = None,
+        tags_match: TagsMatch = TagsMatch.any,
         author: str | None = None,
         favorited: str | None = None,
     ) -> ArticlesFeedDTO: ...
@@ -56,11 +71,18 @@ class IArticleService(abc.ABC):
         current_user: UserDTO | None,
         limit: int,
         offset: int,
-        tag: str | None = None,
+        tags: list[str] | None = None,
+        tags_match: TagsMatch = TagsMatch.any,
         author: str | None = None,
         favorited: str | None = None,
+        q: str | None = None,
     ) -> ArticlesFeedDTO: ...
 
+    @abc.abstractmethod
+    def stream_articles_export(
+        self, session: Any, chunk_size: int, since: datetime.datetime | None = None
+    ) -> AsyncIterator[list[ArticleDTO]]: ...
+
     @abc.abstractmethod
     async def update_article_by_slug(
         self,
@@ -1,7 +1,13 @@
 import abc
+from collections.abc import AsyncIterator
 from typing import Any
 
-from conduit.domain.dtos.comment import CommentDTO, CommentsListDTO, CreateCommentDTO
+from conduit.domain.dtos.comment import (
+    CommentDTO,
+    CommentsCursorDTO,
+    CommentsListDTO,
+    CreateCommentDTO,
+)
 from conduit.domain.dtos.user import UserDTO
 
 
@@ -18,9 +24,19 @@ class ICommentService(abc.ABC):
 
     @abc.abstractmethod
     async def get_article_comments(
-        self, session: Any, slug: str, current_user: UserDTO | None
+        self,
+        session: Any,
+        slug: str,
+        current_user: UserDTO | None,
+        limit: int | None = None,
+        cursor: CommentsCursorDTO | None = None,
     ) -> CommentsListDTO: ...
 
+    @abc.abstractmethod
+    def stream_article_comments(
+        self, session: Any, slug: str, current_user: UserDTO | None, chunk_size: int
+    ) -> AsyncIterator[list[CommentDTO]]: ...
+
     @abc.abstractmethod
     async def delete_article_comment(
         self, session: Any, slug: str, comment_id: int, current_user: UserDTO
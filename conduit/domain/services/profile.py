@@ -17,6 +17,11 @@ class IProfileService(abc.ABC):
         self, session: Any, user_id: int, current_user: UserDTO | None = None
     ) -> ProfileDTO: ...
 
+    @abc.abstractmethod
+    async def get_profiles_suggestions(
+        self, session: Any, prefix: str, limit: int
+    ) -> list[ProfileDTO]: ...
+
     @abc.abstractmethod
     async def get_profiles_by_user_ids(
         self, session: Any, user_ids: list[int], current_user: UserDTO | None
@@ -8,3 +8,8 @@ class ITagService(abc.ABC):
 
     @abc.abstractmethod
     async def get_all_tags(self, session: Any) -> list[TagDTO]: ...
+
+    @abc.abstractmethod
+    async def get_tags_suggestions(
+        self, session: Any, prefix: str, limit: int
+    ) -> list[TagDTO]: ...
@@ -26,6 +26,11 @@ class IUserService(abc.ABC):
     @abc.abstractmethod
     async def get_user_by_username(self, session: Any, username: str) -> UserDTO: ...
 
+    @abc.abstractmethod
+    async def get_users_by_username_prefix(
+        self, session: Any, prefix: str, limit: int
+    ) -> list[UserDTO]: ...
+
     @abc.abstractmethod
     async def get_users_by_ids(
         self, session: Any, user_ids: Collection[int]
@@ -0,0 +1,45 @@
+"""add comments pagination
+
+Revision ID: 3b7d1f0c9a2e
+Revises: 666cc53a93be
+Create Date: 2026-10-19 10:12:31.402771
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "3b7d1f0c9a2e"
+down_revision: str | None = "666cc53a93be"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "article",
+        sa.Column("comments_count", sa.Integer(), server_default="0", nullable=False),
+    )
+    op.execute(
+        """
+        UPDATE article
+        SET comments_count = counts.total
+        FROM (
+            SELECT article_id, count(*) AS total FROM comment GROUP BY article_id
+        ) AS counts
+        WHERE article.id = counts.article_id
+        """
+    )
+    op.create_index(
+        "ix_comment_article_id_created_at_id",
+        "comment",
+        ["article_id", "created_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_comment_article_id_created_at_id", table_name="comment")
+    op.drop_column("article", "comments_count")
@@ -0,0 +1,49 @@
+"""add article search vector
+
+Revision ID: 5e8a1c3f7b92
+Revises: 9c4e2a7b5d18
+Create Date: 2026-10-19 19:31:47.209356
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "5e8a1c3f7b92"
+down_revision: str | None = "9c4e2a7b5d18"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "article",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "setweight(to_tsvector('english', title), 'A') || "
+                "setweight(to_tsvector('english', description), 'B') || "
+                "setweight(to_tsvector('english', body), 'C')",
+                persisted=True,
+            ),
+            nullable=False,
+        ),
+    )
+    op.create_index(
+        "ix_article_search_vector",
+        "article",
+        ["search_vector"],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_article_search_vector", table_name="article", postgresql_using="gin"
+    )
+    op.drop_column("article", "search_vector")
@@ -0,0 +1,29 @@
+"""add article_tag tag_id index
+
+Revision ID: 7a3c9e1d5f24
+Revises: d2f6b8e4a1c3
+Create Date: 2026-10-19 20:21:39.046817
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "7a3c9e1d5f24"
+down_revision: str | None = "d2f6b8e4a1c3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_article_tag_tag_id_article_id",
+        "article_tag",
+        ["tag_id", "article_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_article_tag_tag_id_article_id", table_name="article_tag")
@@ -0,0 +1,26 @@
+"""add article updated_at index
+
+Revision ID: 9c4e2a7b5d18
+Revises: 3b7d1f0c9a2e
+Create Date: 2026-10-19 19:04:12.518204
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "9c4e2a7b5d18"
+down_revision: str | None = "3b7d1f0c9a2e"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_article_updated_at_id", "article", ["updated_at", "id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_article_updated_at_id", table_name="article")
@@ -0,0 +1,38 @@
+"""add autocomplete indexes
+
+Revision ID: d2f6b8e4a1c3
+Revises: 5e8a1c3f7b92
+Create Date: 2026-10-19 19:58:03.734118
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "d2f6b8e4a1c3"
+down_revision: str | None = "5e8a1c3f7b92"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_user_username_pattern",
+        "user",
+        ["username"],
+        unique=False,
+        postgresql_ops={"username": "text_pattern_ops"},
+    )
+    op.create_index(
+        "ix_tag_tag_pattern",
+        "tag",
+        ["tag"],
+        unique=False,
+        postgresql_ops={"tag": "text_pattern_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tag_tag_pattern", table_name="tag")
+    op.drop_index("ix_user_username_pattern", table_name="user")
@@ -0,0 +1,24 @@
+from typing import Any
+
+from conduit.core.metrics import CACHE_REQUESTS
+from conduit.domain.cache import ICache
+
+
+class InstrumentedCache(ICache):
+    """Cache counting hits and misses of the wrapped one."""
+
+    def __init__(self, name: str, cache: ICache) -> None:
+        self._cache = cache
+        self._hits = CACHE_REQUESTS.labels(cache=name, result="hit")
+        self._misses = CACHE_REQUESTS.labels(cache=name, result="miss")
+
+    async def get(self, key: str) -> Any | None:
+        value = await self._cache.get(key)
+        (self._misses if value is None else self._hits).inc()
+        return value
+
+    async def set(self, key: str, value: Any) -> None:
+        await self._cache.set(key, value)
+
+    async def delete(self, *keys: str) -> None:
+        await self._cache.delete(*keys)
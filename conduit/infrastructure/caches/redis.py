@@ -0,0 +1,35 @@
+import pickle
+from typing import Any
+
+from conduit.domain.cache import ICache
+
+try:
+    from redis.asyncio import Redis
+except ImportError:  # pragma: no cover
+    Redis = None
+
+
+class RedisCache(ICache):
+    """Cache shared between workers, backed by Redis."""
+
+    def __init__(self, url: str, ttl_seconds: int, prefix: str = "conduit:") -> None:
+        if Redis is None:
+            raise RuntimeError("`redis` package is required for the shared cache.")
+
+        self._client = Redis.from_url(url)
+        self._ttl_seconds = ttl_seconds
+        self._prefix = prefix
+
+    async def get(self, key: str) -> Any | None:
+        if (value := await self._client.get(self._prefix + key)) is None:
+            return None
+        return pickle.loads(value)
+
+    async def set(self, key: str, value: Any) -> None:
+        await self._client.set(
+            self._prefix + key, pickle.dumps(value), ex=self._ttl_seconds
+        )
+
+    async def delete(self, *keys: str) -> None:
+        if keys:
+            await self._client.delete(*(self._prefix + key for key in keys))
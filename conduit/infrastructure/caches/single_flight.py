@@ -0,0 +1,55 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from conduit.core.metrics import CACHE_REQUESTS
+from conduit.domain.cache import ICache, IComputedCache
+
+
+class SingleFlightCache(IComputedCache):
+    """
+    Cache that runs at most one computation per key at a time.
+
+    Concurrent misses for the same key wait for the computation already in
+    flight instead of starting their own, they are counted as `coalesced`
+    cache requests of `name`.
+    """
+
+    def __init__(self, name: str, cache: ICache) -> None:
+        self._cache = cache
+        self._in_flight: dict[str, asyncio.Future[Any]] = {}
+        self._coalesced = CACHE_REQUESTS.labels(cache=name, result="coalesced")
+
+    async def get_or_set(self, key: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+        if (value := await self._cache.get(key)) is not None:
+            return value
+
+        while (future := self._in_flight.get(key)) is not None:
+            self._coalesced.inc()
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # Only the caller computing the value was cancelled, one of the
+                # waiting callers takes the computation over.
+                task = asyncio.current_task()
+                if not future.cancelled() or (task is not None and task.cancelling()):
+                    raise
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            value = await factory()
+            await self._cache.set(key, value)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            # Mark the exception as retrieved when nobody is waiting for it.
+            future.exception()
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            del self._in_flight[key]
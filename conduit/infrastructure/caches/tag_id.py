@@ -0,0 +1,26 @@
+from collections.abc import Iterable, Mapping
+
+from conduit.domain.cache import ITagIdCache
+
+
+class TagIdCache(ITagIdCache):
+    """
+    In-process tag name to id map.
+
+    Tag rows are never updated or deleted, so entries never go stale and
+    need no expiry. Once the map is full new names are simply not interned
+    and keep resolving from the database.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self._max_size = max_size
+        self._tag_ids: dict[str, int] = {}
+
+    def get_many(self, tags: Iterable[str]) -> dict[str, int]:
+        return {tag: self._tag_ids[tag] for tag in tags if tag in self._tag_ids}
+
+    def set_many(self, tag_ids: Mapping[str, int]) -> None:
+        for tag, tag_id in tag_ids.items():
+            if len(self._tag_ids) >= self._max_size:
+                return
+            self._tag_ids[tag] = tag_id
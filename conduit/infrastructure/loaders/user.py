@@ -0,0 +1,142 @@
+import asyncio
+from collections.abc import Collection, Hashable
+from typing import TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from conduit.core.exceptions import UserNotFoundException
+from conduit.domain.dtos.user import UserDTO
+from conduit.domain.loaders.user import IUserLoader
+from conduit.domain.repositories.user import IUserRepository
+
+KeyT = TypeVar("KeyT", bound=Hashable)
+
+
+class UserLoader(IUserLoader):
+    """
+    Loader for users bound to a single session.
+
+    Lookups issued in the same event loop tick are collected and resolved
+    with one `IN` query per key kind, loaded users are kept until the
+    session is gone.
+    """
+
+    def __init__(self, session: AsyncSession, user_repo: IUserRepository) -> None:
+        self._session = session
+        self._user_repo = user_repo
+        self._by_id: dict[int, asyncio.Future[UserDTO | None]] = {}
+        self._by_username: dict[str, asyncio.Future[UserDTO | None]] = {}
+        self._pending_ids: list[int] = []
+        self._pending_usernames: list[str] = []
+        self._dispatch_task: asyncio.Task[None] | None = None
+
+    async def load(self, user_id: int) -> UserDTO:
+        future = self._get_or_enqueue(self._by_id, self._pending_ids, user_id)
+        if not (user := await asyncio.shield(future)):
+            raise UserNotFoundException()
+        return user
+
+    async def load_many(self, user_ids: Collection[int]) -> list[UserDTO]:
+        futures = [
+            self._get_or_enqueue(self._by_id, self._pending_ids, user_id)
+            for user_id in dict.fromkeys(user_ids)
+        ]
+        users = await asyncio.shield(asyncio.gather(*futures))
+        return [user for user in users if user]
+
+    async def load_by_username(self, username: str) -> UserDTO:
+        future = self._get_or_enqueue(
+            self._by_username, self._pending_usernames, username
+        )
+        if not (user := await asyncio.shield(future)):
+            raise UserNotFoundException()
+        return user
+
+    def prime(self, user: UserDTO) -> None:
+        # Username could be changed, drop entries pointing to the old one.
+        for username, future in list(self._by_username.items()):
+            if self._resolved_id(future) == user.id:
+                del self._by_username[username]
+        self._resolve(self._by_id, user.id, user)
+        self._resolve(self._by_username, user.username, user)
+
+    def _get_or_enqueue(
+        self,
+        futures: dict[KeyT, asyncio.Future[UserDTO | None]],
+        pending: list[KeyT],
+        key: KeyT,
+    ) -> asyncio.Future[UserDTO | None]:
+        if (future := futures.get(key)) is None:
+            future = futures[key] = asyncio.get_running_loop().create_future()
+            pending.append(key)
+            if self._dispatch_task is None:
+                self._dispatch_task = asyncio.create_task(self._dispatch())
+        return future
+
+    async def _dispatch(self) -> None:
+        user_ids, self._pending_ids = self._pending_ids, []
+        usernames, self._pending_usernames = self._pending_usernames, []
+        self._dispatch_task = None
+        try:
+            users = []
+            if user_ids:
+                users += await self._user_repo.list_by_users(
+                    session=self._session, user_ids=user_ids
+                )
+            if usernames:
+                users += await self._user_repo.list_by_usernames(
+                    session=self._session, usernames=usernames
+                )
+        except BaseException as exc:
+            # Awaiting loads would hang on futures left pending.
+            self._reject(self._by_id, user_ids, exc)
+            self._reject(self._by_username, usernames, exc)
+            if not isinstance(exc, Exception):
+                raise
+            return
+
+        for user in users:
+            self._resolve(self._by_id, user.id, user)
+            self._resolve(self._by_username, user.username, user)
+        for user_id in user_ids:
+            self._resolve_missing(self._by_id, user_id)
+        for username in usernames:
+            self._resolve_missing(self._by_username, username)
+
+    @staticmethod
+    def _resolve(
+        futures: dict[KeyT, asyncio.Future[UserDTO | None]], key: KeyT, user: UserDTO
+    ) -> None:
+        future = futures.get(key)
+        if future is None or future.done():
+            future = futures[key] = asyncio.get_running_loop().create_future()
+        future.set_result(user)
+
+    @staticmethod
+    def _resolve_missing(
+        futures: dict[KeyT, asyncio.Future[UserDTO | None]], key: KeyT
+    ) -> None:
+        if not (future := futures[key]).done():
+            future.set_result(None)
+
+    @staticmethod
+    def _reject(
+        futures: dict[KeyT, asyncio.Future[UserDTO | None]],
+        keys: list[KeyT],
+        exc: BaseException,
+    ) -> None:
+        # Failed lookups are not cached, next load will query them again.
+        for key in keys:
+            future = futures.pop(key)
+            if future.done():
+                continue
+            if isinstance(exc, Exception):
+                future.set_exception(exc)
+            else:
+                future.cancel()
+
+    @staticmethod
+    def _resolved_id(future: asyncio.Future[UserDTO | None]) -> int | None:
+        if future.done() and not future.exception() and (user := future.result()):
+            return user.id
+        return None
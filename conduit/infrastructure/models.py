@@ -1,7 +1,8 @@
 from datetime import datetime
 from functools import partial
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import Computed, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
@@ -11,9 +12,20 @@ class Base(DeclarativeBase):
 
 relationship = partial(relationship, lazy="raise")
 
+# Text search configuration of the articles search vector.
+ARTICLE_SEARCH_CONFIG = "english"
+
 
 class User(Base):
     __tablename__ = "user"
+    __table_args__ = (
+        # Username prefix autocomplete, `LIKE 'prefix%'` regardless of collation.
+        Index(
+            "ix_user_username_pattern",
+            "username",
+            postgresql_ops={"username": "text_pattern_ops"},
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     username: Mapped[str] = mapped_column(unique=True)
@@ -37,6 +49,11 @@ class Follower(Base):
 
 class Article(Base):
     __tablename__ = "article"
+    __table_args__ = (
+        # Incremental articles export ordered by the last update.
+        Index("ix_article_updated_at_id", "updated_at", "id"),
+        Index("ix_article_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     author_id: Mapped[int] = mapped_column(ForeignKey("user.id"), nullable=False)
@@ -44,12 +61,29 @@ class Article(Base):
     title: Mapped[str]
     description: Mapped[str]
     body: Mapped[str]
+    # Denormalized counter, maintained by the comment repository.
+    comments_count: Mapped[int] = mapped_column(default=0, server_default="0")
+    # Weighted full text search document, maintained by the database.
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(
+            f"setweight(to_tsvector('{ARTICLE_SEARCH_CONFIG}', title), 'A') || "
+            f"setweight(to_tsvector('{ARTICLE_SEARCH_CONFIG}', description), 'B') || "
+            f"setweight(to_tsvector('{ARTICLE_SEARCH_CONFIG}', body), 'C')",
+            persisted=True,
+        ),
+        deferred=True,
+    )
     created_at: Mapped[datetime]
     updated_at: Mapped[datetime] = mapped_column(nullable=True)
 
 
 class Tag(Base):
     __tablename__ = "tag"
+    __table_args__ = (
+        # Tag prefix autocomplete, `LIKE 'prefix%'` regardless of collation.
+        Index("ix_tag_tag_pattern", "tag", postgresql_ops={"tag": "text_pattern_ops"}),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     tag: Mapped[str] = mapped_column(nullable=False, unique=True)
@@ -58,6 +92,10 @@ class Tag(Base):
 
 class ArticleTag(Base):
     __tablename__ = "article_tag"
+    __table_args__ = (
+        # Articles lookup by tags, primary key leads with `article_id`.
+        Index("ix_article_tag_tag_id_article_id", "tag_id", "article_id"),
+    )
 
     article_id: Mapped[int] = mapped_column(
         ForeignKey("article.id", ondelete="CASCADE"), primary_key=True
@@ -78,6 +116,10 @@ class Favorite(Base):
 
 class Comment(Base):
     __tablename__ = "comment"
+    __table_args__ = (
+        # Keyset pagination over an article comments thread.
+        Index("ix_comment_article_id_created_at_id", "article_id", "created_at", "id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     article_id: Mapped[int] = mapped_column(
@@ -1,27 +1,62 @@
+from collections.abc import AsyncIterator, Sequence
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import case, delete, exists, func, insert, select, true, update
+from sqlalchemy import (
+    ARRAY,
+    CTE,
+    JSON,
+    Column,
+    DateTime,
+    Integer,
+    MetaData,
+    Select,
+    String,
+    Table,
+    any_,
+    case,
+    delete,
+    exists,
+    func,
+    insert,
+    literal,
+    select,
+    true,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import aliased
+from sqlalchemy.schema import CreateTable
 from sqlalchemy.sql.functions import count
 
-from conduit.core.exceptions import ArticleNotFoundException
+from conduit.core.after_commit import call_after_commit
+from conduit.core.exceptions import (
+    ArticleAlreadyFavoritedException,
+    ArticleNotFavoritedException,
+    ArticleNotFoundException,
+)
+from conduit.core.utils.date import convert_datetime_to_naive_utc
 from conduit.core.utils.slug import (
     get_slug_unique_part,
     make_slug_from_title,
     make_slug_from_title_and_code,
 )
+from conduit.domain.cache import ITagIdCache
 from conduit.domain.dtos.article import (
     ArticleAuthorDTO,
     ArticleDTO,
     ArticleRecordDTO,
     CreateArticleDTO,
+    ImportArticleDTO,
+    TagsMatch,
     UpdateArticleDTO,
 )
 from conduit.domain.mapper import IModelMapper
 from conduit.domain.repositories.article import IArticleRepository
+from conduit.domain.repositories.tag import ITagRepository
 from conduit.infrastructure.models import (
+    ARTICLE_SEARCH_CONFIG,
     Article,
     ArticleTag,
     Favorite,
@@ -33,11 +68,40 @@ from conduit.infrastructure.models import (
 # Aliases for the models if needed.
 FavoriteAlias = aliased(Favorite)
 
+# Session local staging tables for the bulk import, filled with COPY.
+staging_metadata = MetaData()
+ImportArticle = Table(
+    "import_article",
+    staging_metadata,
+    Column("ord", Integer),
+    Column("slug", String),
+    Column("title", String),
+    Column("description", String),
+    Column("body", String),
+    Column("author", String),
+    Column("created_at", DateTime),
+    prefixes=["TEMPORARY"],
+)
+ImportArticleTag = Table(
+    "import_article_tag",
+    staging_metadata,
+    Column("ord", Integer),
+    Column("tag", String),
+    prefixes=["TEMPORARY"],
+)
+
 
 class ArticleRepository(IArticleRepository):
 
-    def __init__(self, article_mapper: IModelMapper[Article, ArticleRecordDTO]):
+    def __init__(
+        self,
+        article_mapper: IModelMapper[Article, ArticleRecordDTO],
+        tag_repo: ITagRepository,
+        tag_id_cache: ITagIdCache,
+    ):
         self._article_mapper = article_mapper
+        self._tag_repo = tag_repo
+        self._tag_id_cache = tag_id_cache
 
     async def add(
         self, session: AsyncSession, author_id: int, create_item: CreateArticleDTO
@@ -58,6 +122,164 @@ class ArticleRepository(IArticleRepository):
         result = await session.execute(query)
         return self._article_mapper.to_dto(result.scalar())
 
+    async def add_with_tags(
+        self, session: AsyncSession, author_id: int, create_item: CreateArticleDTO
+    ) -> ArticleRecordDTO:
+        """
+        Insert the article, its missing tags and the links in one statement.
+        """
+        now = datetime.now()
+        new_article = (
+            insert(Article)
+            .values(
+                author_id=author_id,
+                slug=make_slug_from_title(title=create_item.title),
+                title=create_item.title,
+                description=create_item.description,
+                body=create_item.body,
+                # Python side defaults are not applied to an insert in a CTE.
+                comments_count=0,
+                created_at=now,
+                updated_at=now,
+            )
+            .returning(*Article.__table__.c)
+            .cte("new_article")
+        )
+        query = select(aliased(Article, new_article))
+        if not create_item.tags:
+            article = await session.scalar(query)
+            return self._article_mapper.to_dto(article)
+
+        tag_ids = self._tag_repo.ids_query(tags=create_item.tags).cte("tag_ids")
+        new_article_tags = (
+            pg_insert(ArticleTag)
+            .from_select(
+                ["article_id", "tag_id", "created_at"],
+                select(new_article.c.id, tag_ids.c.id, literal(now)).select_from(
+                    new_article.join(tag_ids, true())
+                ),
+            )
+            .on_conflict_do_nothing()
+            .cte("new_article_tag")
+        )
+        query = query.add_columns(
+            select(func.json_object_agg(tag_ids.c.tag, tag_ids.c.id, type_=JSON))
+            .scalar_subquery()
+            .label("tag_ids")
+        ).add_cte(new_article_tags)
+        article, resolved_tag_ids = (await session.execute(query)).one()
+        call_after_commit(session, self._tag_id_cache.set_many, resolved_tag_ids)
+        return self._article_mapper.to_dto(article)
+
+    async def add_many(
+        self,
+        session: AsyncSession,
+        author_id: int,
+        create_items: Sequence[ImportArticleDTO],
+    ) -> int:
+        now = datetime.now()
+        article_records: list[tuple[int, str, str, str, str, str | None, datetime]] = []
+        tag_records: list[tuple[int, str]] = []
+        for ord_, item in enumerate(create_items):
+            created_at = item.created_at or now
+            article_records.append(
+                (
+                    ord_,
+                    make_slug_from_title(title=item.title),
+                    item.title,
+                    item.description,
+                    item.body,
+                    item.author,
+                    convert_datetime_to_naive_utc(dt=created_at),
+                )
+            )
+            tag_records.extend((ord_, tag) for tag in dict.fromkeys(item.tags))
+
+        for table in (ImportArticle, ImportArticleTag):
+            await session.execute(CreateTable(table, if_not_exists=True))
+            await session.execute(delete(table))
+
+        connection = await session.connection()
+        raw_connection = await connection.get_raw_connection()
+        for table, records in (
+            (ImportArticle, article_records),
+            (ImportArticleTag, tag_records),
+        ):
+            await raw_connection.driver_connection.copy_records_to_table(
+                table.name, records=records, columns=list(table.c.keys())
+            )
+
+        inserted_articles = (
+            pg_insert(Article)
+            .from_select(
+                [
+                    "author_id",
+                    "slug",
+                    "title",
+                    "description",
+                    "body",
+                    "comments_count",
+                    "created_at",
+                    "updated_at",
+                ],
+                # Python side defaults are not applied to an insert in a CTE.
+                select(
+                    func.coalesce(User.id, author_id),
+                    ImportArticle.c.slug,
+                    ImportArticle.c.title,
+                    ImportArticle.c.description,
+                    ImportArticle.c.body,
+                    literal(0),
+                    ImportArticle.c.created_at,
+                    literal(now),
+                )
+                .outerjoin(User, User.username == ImportArticle.c.author)
+                .order_by(ImportArticle.c.ord),
+            )
+            .on_conflict_do_nothing(index_elements=[Article.slug])
+            .returning(Article.id, Article.slug)
+            .cte("inserted_articles")
+        )
+        inserted_tags = (
+            pg_insert(Tag)
+            .from_select(
+                ["tag", "created_at"],
+                select(ImportArticleTag.c.tag, literal(now)).distinct(),
+            )
+            .on_conflict_do_nothing(index_elements=[Tag.tag])
+            .returning(Tag.id, Tag.tag)
+            .cte("inserted_tags")
+        )
+        # Tags inserted above are not visible to the `tag` table scan of the
+        # same statement, so the existing and the new ones are combined.
+        import_tags = (
+            select(Tag.id, Tag.tag)
+            .where(Tag.tag.in_(select(ImportArticleTag.c.tag)))
+            .union_all(select(inserted_tags.c.id, inserted_tags.c.tag))
+            .cte("import_tags")
+        )
+        inserted_article_tags = (
+            insert(ArticleTag)
+            .from_select(
+                ["article_id", "tag_id", "created_at"],
+                select(inserted_articles.c.id, import_tags.c.id, literal(now))
+                .join(ImportArticle, ImportArticle.c.slug == inserted_articles.c.slug)
+                .join(ImportArticleTag, ImportArticleTag.c.ord == ImportArticle.c.ord)
+                .join(import_tags, import_tags.c.tag == ImportArticleTag.c.tag),
+            )
+            .cte("inserted_article_tags")
+        )
+        query = (
+            select(count())
+            .select_from(inserted_articles)
+            .add_cte(inserted_article_tags)
+        )
+        articles_count = await session.scalar(query)
+
+        for table in (ImportArticle, ImportArticleTag):
+            await session.execute(delete(table))
+        return articles_count
+
     async def get_by_slug_or_none(
         self, session: AsyncSession, slug: str
     ) -> ArticleRecordDTO | None:
@@ -77,6 +299,12 @@ class ArticleRepository(IArticleRepository):
             raise ArticleNotFoundException()
         return self._article_mapper.to_dto(article)
 
+    async def get_id_by_slug(self, session: AsyncSession, slug: str) -> int:
+        query = select(Article.id).where(Article.slug == slug)
+        if not (article_id := await session.scalar(query)):
+            raise ArticleNotFoundException()
+        return article_id
+
     async def delete_by_slug(self, session: AsyncSession, slug: str) -> None:
         query = delete(Article).where(Article.slug == slug)
         await session.execute(query)
@@ -103,6 +331,51 @@ class ArticleRepository(IArticleRepository):
         article = await session.scalar(query)
         return self._article_mapper.to_dto(article)
 
+    async def favorite_by_slug(
+        self, session: AsyncSession, slug: str, user_id: int
+    ) -> ArticleDTO:
+        target = select(Article.id).where(Article.slug == slug).cte("target")
+        changed = (
+            pg_insert(Favorite)
+            .from_select(
+                ["user_id", "article_id", "created_at"],
+                select(literal(user_id), target.c.id, literal(datetime.now())),
+            )
+            .on_conflict_do_nothing()
+            .returning(Favorite.article_id)
+            .cte("changed")
+        )
+        query = self._favorite_toggle_query(
+            target=target, changed=changed, user_id=user_id, favorited=True
+        )
+        if not (article := (await session.execute(query)).first()):
+            raise ArticleNotFoundException()
+        if not article.changed:
+            raise ArticleAlreadyFavoritedException()
+        return self._to_article_dto(article)
+
+    async def unfavorite_by_slug(
+        self, session: AsyncSession, slug: str, user_id: int
+    ) -> ArticleDTO:
+        target = select(Article.id).where(Article.slug == slug).cte("target")
+        changed = (
+            delete(Favorite)
+            .where(
+                Favorite.user_id == user_id,
+                Favorite.article_id == select(target.c.id).scalar_subquery(),
+            )
+            .returning(Favorite.article_id)
+            .cte("changed")
+        )
+        query = self._favorite_toggle_query(
+            target=target, changed=changed, user_id=user_id, favorited=False
+        )
+        if not (article := (await session.execute(query)).first()):
+            raise ArticleNotFoundException()
+        if not article.changed:
+            raise ArticleNotFavoritedException()
+        return self._to_article_dto(article)
+
     async def list_by_followings(
         self, session: AsyncSession, user_id: int, limit: int, offset: int
     ) -> list[ArticleRecordDTO]:
@@ -205,7 +478,8 @@ class ArticleRepository(IArticleRepository):
         session: AsyncSession,
         limit: int,
         offset: int,
-        tag: str | None = None,
+        tags: list[str] | None = None,
+        tags_match: TagsMatch = TagsMatch.any,
         author: str | None = None,
         favorited: str | None = None,
     ) -> list[ArticleRecordDTO]:
@@ -222,17 +496,14 @@ class ArticleRepository(IArticleRepository):
             )
         ).order_by(Article.created_at)
 
-        if tag:
-            # fmt: off
-            query = query.join(
-                ArticleTag,
-                (Article.id == ArticleTag.article_id),
-            ).where(
-                ArticleTag.tag_id == select(Tag.id).where(
-                    Tag.tag == tag
-                ).scalar_subquery()
+        if tags:
+            query = query.where(
+                Article.id.in_(
+                    await self._tagged_articles_query(
+                        session=session, tags=tags, tags_match=tags_match
+                    )
+                )
             )
-            # fmt: on
 
         if author:
             # fmt: off
@@ -266,9 +537,11 @@ class ArticleRepository(IArticleRepository):
         user_id: int | None,
         limit: int,
         offset: int,
-        tag: str | None = None,
+        tags: list[str] | None = None,
+        tags_match: TagsMatch = TagsMatch.any,
         author: str | None = None,
         favorited: str | None = None,
+        q: str | None = None,
     ) -> list[ArticleDTO]:
         query = (
             # fmt: off
@@ -315,8 +588,6 @@ class ArticleRepository(IArticleRepository):
             .filter(
                 # Filter by author username if provided.
                 case((author is not None, User.username == author), else_=True),
-                # Filter by tag if provided.
-                case((tag is not None, Tag.tag == tag), else_=True),
                 # Filter by "favorited by" username if provided.
                 case(
                     (
@@ -346,10 +617,67 @@ class ArticleRepository(IArticleRepository):
             # fmt: on
         )
 
+        if tags:
+            query = query.where(
+                Article.id.in_(
+                    await self._tagged_articles_query(
+                        session=session, tags=tags, tags_match=tags_match
+                    )
+                )
+            )
+
+        if q:
+            search_query = func.websearch_to_tsquery(ARTICLE_SEARCH_CONFIG, q)
+            query = query.where(Article.search_vector.bool_op("@@")(search_query))
+            query = query.order_by(
+                func.ts_rank(Article.search_vector, search_query).desc(), Article.id
+            )
+
         query = query.limit(limit).offset(offset)
         articles = await session.execute(query)
         return [self._to_article_dto(article) for article in articles]
 
+    async def stream_by_updated_since(
+        self, session: AsyncSession, chunk_size: int, since: datetime | None = None
+    ) -> AsyncIterator[list[ArticleDTO]]:
+        query = (
+            select(
+                Article.id,
+                Article.author_id,
+                Article.slug,
+                Article.title,
+                Article.description,
+                Article.body,
+                Article.created_at,
+                Article.updated_at,
+                User.username,
+                User.bio,
+                User.image_url,
+                select(func.string_agg(Tag.tag, ", "))
+                .join(ArticleTag, Tag.id == ArticleTag.tag_id)
+                .where(ArticleTag.article_id == Article.id)
+                .scalar_subquery()
+                .label("tags"),
+                select(count(Favorite.user_id))
+                .where(Favorite.article_id == Article.id)
+                .scalar_subquery()
+                .label("favorites_count"),
+                literal(False).label("favorited"),
+                literal(False).label("following"),
+            )
+            .join(User, User.id == Article.author_id)
+            .order_by(Article.updated_at, Article.id)
+            .execution_options(yield_per=chunk_size)
+        )
+        if since:
+            query = query.where(
+                Article.updated_at >= convert_datetime_to_naive_utc(dt=since)
+            )
+
+        articles = await session.stream(query)
+        async for partition in articles.partitions():
+            yield [self._to_article_dto(article) for article in partition]
+
     async def count_by_followings(self, session: AsyncSession, user_id: int) -> int:
         query = select(count(Article.id)).join(
             Follower,
@@ -364,23 +692,22 @@ class ArticleRepository(IArticleRepository):
     async def count_by_filters(
         self,
         session: AsyncSession,
-        tag: str | None = None,
+        tags: list[str] | None = None,
+        tags_match: TagsMatch = TagsMatch.any,
         author: str | None = None,
         favorited: str | None = None,
+        q: str | None = None,
     ) -> int:
         query = select(count(Article.id))
 
-        if tag:
-            # fmt: off
-            query = query.join(
-                ArticleTag,
-                (Article.id == ArticleTag.article_id),
-            ).where(
-                ArticleTag.tag_id == select(Tag.id).where(
-                    Tag.tag == tag
-                ).scalar_subquery()
+        if tags:
+            query = query.where(
+                Article.id.in_(
+                    await self._tagged_articles_query(
+                        session=session, tags=tags, tags_match=tags_match
+                    )
+                )
             )
-            # fmt: on
 
         if author:
             # fmt: off
@@ -404,9 +731,84 @@ class ArticleRepository(IArticleRepository):
             )
             # fmt: on
 
+        if q:
+            query = query.where(
+                Article.search_vector.bool_op("@@")(
+                    func.websearch_to_tsquery(ARTICLE_SEARCH_CONFIG, q)
+                )
+            )
+
         result = await session.execute(query)
         return result.scalar()
 
+    async def _tagged_articles_query(
+        self, session: AsyncSession, tags: list[str], tags_match: TagsMatch
+    ) -> Select:
+        """
+        Query ids of articles tagged with any or all of the tags.
+        """
+        tags = list(dict.fromkeys(tags))
+        tag_ids = await self._tag_repo.get_ids(session=session, tags=tags)
+        query = select(ArticleTag.article_id).where(
+            ArticleTag.tag_id == any_(literal(list(tag_ids.values()), ARRAY(Integer)))
+        )
+        if tags_match == TagsMatch.all:
+            query = query.group_by(ArticleTag.article_id).having(count() == len(tags))
+        return query
+
+    @staticmethod
+    def _favorite_toggle_query(
+        target: CTE, changed: CTE, user_id: int, favorited: bool
+    ) -> Any:
+        # Data-modifying CTEs share the statement snapshot, so the row
+        # inserted or deleted by `changed` is not visible to the count below
+        # and has to be applied on top of it.
+        changed_count = select(func.count()).select_from(changed).scalar_subquery()
+        favorites_count = (
+            select(func.count(Favorite.article_id))
+            .where(Favorite.article_id == Article.id)
+            .scalar_subquery()
+        )
+        return (
+            # fmt: off
+            select(
+                Article.id.label("id"),
+                Article.author_id.label("author_id"),
+                Article.slug.label("slug"),
+                Article.title.label("title"),
+                Article.description.label("description"),
+                Article.body.label("body"),
+                Article.created_at.label("created_at"),
+                Article.updated_at.label("updated_at"),
+                User.username.label("username"),
+                User.bio.label("bio"),
+                User.image_url.label("image_url"),
+                exists()
+                .where(
+                    (Follower.follower_id == user_id) &
+                    (Follower.following_id == Article.author_id)
+                )
+                .label("following"),
+                (
+                    favorites_count + changed_count
+                    if favorited
+                    else favorites_count - changed_count
+                ).label("favorites_count"),
+                literal(favorited).label("favorited"),
+                # Concatenate tags.
+                select(func.string_agg(Tag.tag, ", "))
+                .join(ArticleTag, Tag.id == ArticleTag.tag_id)
+                .where(ArticleTag.article_id == Article.id)
+                .scalar_subquery()
+                .label("tags"),
+                (changed_count > 0).label("changed"),
+            )
+            .select_from(target)
+            .join(Article, Article.id == target.c.id)
+            .join(User, Article.author_id == User.id)
+            # fmt: on
+        )
+
     @staticmethod
     def _to_article_dto(res: Any) -> ArticleDTO:
         return ArticleDTO(
@@ -1,7 +1,4 @@
-from datetime import datetime
-
 from sqlalchemy import select
-from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from conduit.domain.dtos.tag import TagDTO
@@ -16,36 +13,6 @@ class ArticleTagRepository(IArticleTagRepository):
     def __init__(self, tag_mapper: IModelMapper[Tag, TagDTO]):
         self._tag_mapper = tag_mapper
 
-    async def add_many(
-        self, session: AsyncSession, article_id: int, tags: list[str]
-    ) -> list[TagDTO]:
-        insert_query = (
-            insert(Tag)
-            .on_conflict_do_nothing()
-            .values([dict(tag=tag, created_at=datetime.now()) for tag in tags])
-        )
-        await session.execute(insert_query)
-
-        select_query = select(Tag).where(Tag.tag.in_(tags))
-        tags = await session.scalars(select_query)
-        tags = [self._tag_mapper.to_dto(tag) for tag in tags]
-
-        link_query = (
-            insert(ArticleTag)
-            .on_conflict_do_nothing()
-            .values(
-                [
-                    dict(
-                        article_id=article_id, tag_id=tag.id, created_at=datetime.now()
-                    )
-                    for tag in tags
-                ]
-            )
-        )
-        await session.execute(link_query)
-
-        return tags
-
     async def list(self, session: AsyncSession, article_id: int) -> list[TagDTO]:
         query = (
             select(Tag, ArticleTag)
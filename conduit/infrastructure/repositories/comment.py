@@ -1,14 +1,26 @@
+from collections.abc import AsyncIterator
 from datetime import datetime
+from typing import Any
 
-from sqlalchemy import delete, insert, select
+from sqlalchemy import delete, exists, insert, literal, select, true, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.sql.functions import count
 
-from conduit.core.exceptions import CommentNotFoundException
-from conduit.domain.dtos.comment import CommentRecordDTO, CreateCommentDTO
+from conduit.core.exceptions import (
+    ArticleNotFoundException,
+    CommentNotFoundException,
+    CommentPermissionException,
+)
+from conduit.domain.dtos.comment import (
+    CommentDTO,
+    CommentRecordDTO,
+    CommentsCursorDTO,
+    CommentsListDTO,
+    CreateCommentDTO,
+)
+from conduit.domain.dtos.profile import ProfileDTO
 from conduit.domain.mapper import IModelMapper
 from conduit.domain.repositories.comment import ICommentRepository
-from conduit.infrastructure.models import Comment
+from conduit.infrastructure.models import Article, Comment, Follower, User
 
 
 class CommentRepository(ICommentRepository):
@@ -16,26 +28,40 @@ class CommentRepository(ICommentRepository):
     def __init__(self, comment_mapper: IModelMapper[Comment, CommentRecordDTO]):
         self._comment_mapper = comment_mapper
 
-    async def add(
+    async def add_by_slug(
         self,
         session: AsyncSession,
         author_id: int,
-        article_id: int,
+        slug: str,
         create_item: CreateCommentDTO,
     ) -> CommentRecordDTO:
-        query = (
+        now = datetime.now()
+        target = select(Article.id).where(Article.slug == slug).cte("target")
+        inserted = (
             insert(Comment)
-            .values(
-                author_id=author_id,
-                article_id=article_id,
-                body=create_item.body,
-                created_at=datetime.now(),
-                updated_at=datetime.now(),
+            .from_select(
+                ["author_id", "article_id", "body", "created_at", "updated_at"],
+                select(
+                    literal(author_id),
+                    target.c.id,
+                    literal(create_item.body),
+                    literal(now),
+                    literal(now),
+                ),
             )
             .returning(Comment)
+            .cte("inserted")
         )
-        result = await session.execute(query)
-        return self._comment_mapper.to_dto(result.scalar())
+        counter = (
+            update(Article)
+            .where(Article.id.in_(select(inserted.c.article_id)))
+            .values(comments_count=Article.comments_count + 1)
+            .cte("counter")
+        )
+        result = await session.execute(select(inserted).add_cte(counter))
+        if not (comment := result.first()):
+            raise ArticleNotFoundException()
+        return self._comment_mapper.to_dto(comment)
 
     async def get_or_none(
         self, session: AsyncSession, comment_id: int
@@ -50,18 +76,139 @@ class CommentRepository(ICommentRepository):
             raise CommentNotFoundException()
         return self._comment_mapper.to_dto(comment)
 
-    async def list(
-        self, session: AsyncSession, article_id: int
-    ) -> list[CommentRecordDTO]:
-        query = select(Comment).where(Comment.article_id == article_id)
-        comments = await session.scalars(query)
-        return [self._comment_mapper.to_dto(comment) for comment in comments]
-
-    async def delete(self, session: AsyncSession, comment_id: int) -> None:
-        query = delete(Comment).where(Comment.id == comment_id)
-        await session.execute(query)
-
-    async def count(self, session: AsyncSession, article_id: int) -> int:
-        query = select(count(Comment.id)).where(Comment.article_id == article_id)
-        result = await session.execute(query)
-        return result.scalar()
+    async def stream(
+        self,
+        session: AsyncSession,
+        article_id: int,
+        user_id: int | None,
+        chunk_size: int,
+    ) -> AsyncIterator[list[CommentDTO]]:
+        # Authors come with every row, so nothing is kept between chunks.
+        query = (
+            select(*self._comment_columns(user_id=user_id))
+            .join(User, User.id == Comment.author_id)
+            .where(Comment.article_id == article_id)
+            .order_by(Comment.created_at, Comment.id)
+            .execution_options(yield_per=chunk_size)
+        )
+        rows = await session.stream(query)
+        async for partition in rows.partitions():
+            yield [self._to_comment_dto(row) for row in partition]
+
+    async def list_by_slug(
+        self,
+        session: AsyncSession,
+        slug: str,
+        user_id: int | None,
+        limit: int | None = None,
+        cursor: CommentsCursorDTO | None = None,
+    ) -> CommentsListDTO:
+        # Comments are outer joined to the article, so the article row is
+        # returned even when the page is empty, which tells an empty page
+        # apart from a missing article.
+        keyset_clause = (
+            tuple_(Comment.created_at, Comment.id)
+            > tuple_(cursor.created_at, cursor.id)
+            if cursor
+            else true()
+        )
+        query = (
+            # fmt: off
+            select(
+                Article.comments_count.label("comments_count"),
+                *self._comment_columns(user_id=user_id),
+            )
+            .outerjoin(
+                Comment, (Comment.article_id == Article.id) & keyset_clause
+            )
+            .outerjoin(User, User.id == Comment.author_id)
+            .where(Article.slug == slug)
+            .order_by(Comment.created_at, Comment.id)
+            # fmt: on
+        )
+        if limit is not None:
+            query = query.limit(limit)
+
+        rows = (await session.execute(query)).all()
+        if not rows:
+            raise ArticleNotFoundException()
+
+        return CommentsListDTO(
+            comments=[self._to_comment_dto(row) for row in rows if row.id is not None],
+            comments_count=rows[0].comments_count,
+        )
+
+    async def delete_by_slug(
+        self, session: AsyncSession, slug: str, comment_id: int, author_id: int
+    ) -> None:
+        target = select(Article.id).where(Article.slug == slug).cte("target")
+        target_id = select(target.c.id).scalar_subquery()
+        deleted = (
+            delete(Comment)
+            .where(
+                Comment.id == comment_id,
+                Comment.author_id == author_id,
+                Comment.article_id == target_id,
+            )
+            .returning(Comment.article_id)
+            .cte("deleted")
+        )
+        counter = (
+            update(Article)
+            .where(Article.id.in_(select(deleted.c.article_id)))
+            .values(comments_count=Article.comments_count - 1)
+            .cte("counter")
+        )
+        # Sub-selects run against the snapshot taken before the delete, so the
+        # comment author is still visible when the comment was not deleted.
+        query = select(
+            target_id.label("article_id"),
+            exists(select(deleted.c.article_id)).label("deleted"),
+            select(Comment.author_id)
+            .where(Comment.id == comment_id, Comment.article_id == target_id)
+            .scalar_subquery()
+            .label("author_id"),
+        ).add_cte(counter)
+        result = (await session.execute(query)).one()
+
+        if result.article_id is None:
+            raise ArticleNotFoundException()
+        if result.author_id is None:
+            raise CommentNotFoundException()
+        if not result.deleted:
+            raise CommentPermissionException()
+
+    @staticmethod
+    def _comment_columns(user_id: int | None) -> tuple[Any, ...]:
+        return (
+            Comment.id.label("id"),
+            Comment.body.label("body"),
+            Comment.created_at.label("created_at"),
+            Comment.updated_at.label("updated_at"),
+            User.id.label("user_id"),
+            User.username.label("username"),
+            User.bio.label("bio"),
+            User.image_url.label("image_url"),
+            exists()
+            .where(
+                (Follower.follower_id == user_id)
+                & (Follower.following_id == Comment.author_id)
+            )
+            .label("following"),
+        )
+
+    @staticmethod
+    def _to_comment_dto(res: Any) -> CommentDTO:
+        return CommentDTO(
+            id=res.id,
+            body=res.body,
+            author=ProfileDTO(
+                user_id=res.user_id,
+                username=res.username,
+                bio=res.bio,
+                image=res.image_url,
+                following=res.following,
+            ),
+            created_at=res.created_at,
+            updated_at=res.updated_at,
+        )
@@ -1,6 +1,21 @@
-from sqlalchemy import select
+from datetime import datetime
+
+from sqlalchemy import (
+    ARRAY,
+    CompoundSelect,
+    Integer,
+    Select,
+    String,
+    func,
+    literal,
+    select,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from conduit.core.after_commit import call_after_commit
+from conduit.domain.cache import ITagIdCache
 from conduit.domain.dtos.tag import TagDTO
 from conduit.domain.mapper import IModelMapper
 from conduit.domain.repositories.tag import ITagRepository
@@ -10,8 +25,62 @@ from conduit.infrastructure.models import Tag
 class TagRepository(ITagRepository):
     """Repository for Tag model."""
 
-    def __init__(self, tag_mapper: IModelMapper[Tag, TagDTO]):
+    def __init__(
+        self, tag_mapper: IModelMapper[Tag, TagDTO], tag_id_cache: ITagIdCache
+    ):
         self._tag_mapper = tag_mapper
+        self._tag_id_cache = tag_id_cache
+
+    async def get_ids(self, session: AsyncSession, tags: list[str]) -> dict[str, int]:
+        tag_ids = self._tag_id_cache.get_many(tags)
+        if missing := [tag for tag in dict.fromkeys(tags) if tag not in tag_ids]:
+            query = select(Tag.tag, Tag.id).where(Tag.tag.in_(missing))
+            result = await session.execute(query)
+            resolved = dict(result.tuples().all())
+            call_after_commit(session, self._tag_id_cache.set_many, resolved)
+            tag_ids.update(resolved)
+        return tag_ids
+
+    def ids_query(self, tags: list[str]) -> Select | CompoundSelect:
+        """
+        Query names and ids of the tags, inserting the ones that do not exist yet.
+        """
+        tag_ids = self._tag_id_cache.get_many(tags)
+        query = select(
+            func.unnest(literal(list(tag_ids), ARRAY(String))).label("tag"),
+            func.unnest(literal(list(tag_ids.values()), ARRAY(Integer))).label("id"),
+        )
+        if missing := [tag for tag in dict.fromkeys(tags) if tag not in tag_ids]:
+            upsert_query = insert(Tag).values(
+                [dict(tag=tag, created_at=datetime.now()) for tag in missing]
+            )
+            # A no-op update returns the id of an existing row as well, even
+            # one committed concurrently, where `DO NOTHING` returns nothing.
+            upserted = (
+                upsert_query.on_conflict_do_update(
+                    index_elements=[Tag.tag], set_=dict(tag=upsert_query.excluded.tag)
+                )
+                .returning(Tag.tag, Tag.id)
+                .cte("upserted_tag")
+            )
+            return union_all(query, select(upserted.c.tag, upserted.c.id))
+        return query
+
+    async def load_ids(self, session: AsyncSession) -> None:
+        result = await session.execute(select(Tag.tag, Tag.id))
+        self._tag_id_cache.set_many(dict(result.tuples().all()))
+
+    async def list_by_prefix(
+        self, session: AsyncSession, prefix: str, limit: int
+    ) -> list[TagDTO]:
+        query = (
+            select(Tag)
+            .where(Tag.tag.startswith(prefix, autoescape=True))
+            .order_by(Tag.tag)
+            .limit(limit)
+        )
+        tags = await session.scalars(query)
+        return [self._tag_mapper.to_dto(tag) for tag in tags]
 
     async def list(self, session: AsyncSession) -> list[TagDTO]:
         query = select(Tag)
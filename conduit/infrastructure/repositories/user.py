@@ -65,6 +65,25 @@ class UserRepository(IUserRepository):
         users = await session.scalars(query)
         return [self._user_mapper.to_dto(user) for user in users]
 
+    async def list_by_username_prefix(
+        self, session: AsyncSession, prefix: str, limit: int
+    ) -> list[UserDTO]:
+        query = (
+            select(User)
+            .where(User.username.startswith(prefix, autoescape=True))
+            .order_by(User.username)
+            .limit(limit)
+        )
+        users = await session.scalars(query)
+        return [self._user_mapper.to_dto(user) for user in users]
+
+    async def list_by_usernames(
+        self, session: AsyncSession, usernames: Collection[str]
+    ) -> list[UserDTO]:
+        query = select(User).where(User.username.in_(usernames))
+        users = await session.scalars(query)
+        return [self._user_mapper.to_dto(user) for user in users]
+
     async def get_by_username_or_none(
         self, session: AsyncSession, username: str
     ) -> UserDTO | None:
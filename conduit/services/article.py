@@ -1,18 +1,28 @@
-from dataclasses import asdict
+import datetime
+from collections.abc import AsyncIterable, AsyncIterator
+from dataclasses import asdict, replace
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from conduit.core.exceptions import (
-    ArticleAlreadyFavoritedException,
-    ArticleNotFavoritedException,
-    ArticlePermissionException,
+from conduit.core.after_commit import call_after_commit
+from conduit.core.exceptions import ArticlePermissionException
+from conduit.domain.cache import (
+    ICache,
+    IComputedCache,
+    article_cache_key,
+    articles_feed_cache_key,
+    author_cache_key,
 )
 from conduit.domain.dtos.article import (
     ArticleAuthorDTO,
     ArticleDTO,
     ArticleRecordDTO,
     ArticlesFeedDTO,
+    CachedArticleDTO,
     CreateArticleDTO,
+    ImportArticleDTO,
+    ImportedArticlesDTO,
+    TagsMatch,
     UpdateArticleDTO,
 )
 from conduit.domain.dtos.profile import ProfileDTO
@@ -20,6 +30,7 @@ from conduit.domain.dtos.user import UserDTO
 from conduit.domain.repositories.article import IArticleRepository
 from conduit.domain.repositories.article_tag import IArticleTagRepository
 from conduit.domain.repositories.favorite import IFavoriteRepository
+from conduit.domain.repositories.follower import IFollowerRepository
 from conduit.domain.services.article import IArticleService
 from conduit.domain.services.profile import IProfileService
 
@@ -32,51 +43,90 @@ class ArticleService(IArticleService):
         article_repo: IArticleRepository,
         article_tag_repo: IArticleTagRepository,
         favorite_repo: IFavoriteRepository,
+        follower_repo: IFollowerRepository,
         profile_service: IProfileService,
+        cache: ICache,
+        feed_cache: IComputedCache,
     ) -> None:
         self._article_repo = article_repo
         self._article_tag_repo = article_tag_repo
         self._favorite_repo = favorite_repo
+        self._follower_repo = follower_repo
         self._profile_service = profile_service
+        self._cache = cache
+        self._feed_cache = feed_cache
 
     async def create_new_article(
-        self, session: AsyncSession, author_id: int, article_to_create: CreateArticleDTO
+        self,
+        session: AsyncSession,
+        current_user: UserDTO,
+        article_to_create: CreateArticleDTO,
     ) -> ArticleDTO:
-        article = await self._article_repo.add(
-            session=session, author_id=author_id, create_item=article_to_create
-        )
-        profile = await self._profile_service.get_profile_by_user_id(
-            session=session, user_id=author_id
+        article = await self._article_repo.add_with_tags(
+            session=session, author_id=current_user.id, create_item=article_to_create
         )
-        if article_to_create.tags:
-            await self._article_tag_repo.add_many(
-                session=session, article_id=article.id, tags=article_to_create.tags
-            )
         return ArticleDTO(
             **asdict(article),
             author=ArticleAuthorDTO(
-                username=profile.username,
-                bio=profile.bio,
-                image=profile.image,
-                following=profile.following,
+                username=current_user.username,
+                bio=current_user.bio,
+                image=current_user.image_url,
             ),
             tags=article_to_create.tags,
             favorited=False,
             favorites_count=0,
         )
 
+    async def import_articles(
+        self,
+        session: AsyncSession,
+        articles: AsyncIterable[ImportArticleDTO],
+        current_user: UserDTO,
+        batch_size: int,
+    ) -> ImportedArticlesDTO:
+        articles_count = 0
+        batch: list[ImportArticleDTO] = []
+        async for article in articles:
+            batch.append(article)
+            if len(batch) < batch_size:
+                continue
+            articles_count += await self._article_repo.add_many(
+                session=session, author_id=current_user.id, create_items=batch
+            )
+            batch = []
+        if batch:
+            articles_count += await self._article_repo.add_many(
+                session=session, author_id=current_user.id, create_items=batch
+            )
+        return ImportedArticlesDTO(articles_count=articles_count)
+
     async def get_article_by_slug(
         self, session: AsyncSession, slug: str, current_user: UserDTO | None
     ) -> ArticleDTO:
-        article = await self._article_repo.get_by_slug(session=session, slug=slug)
-        profile = await self._profile_service.get_profile_by_user_id(
-            session=session, user_id=article.author_id, current_user=current_user
+        cached = await self._get_cached_article(session=session, slug=slug)
+        article = cached.article
+        author = await self._get_cached_author(
+            session=session, user_id=article.author_id
         )
-        return await self._get_article_info(
-            session=session,
-            article=article,
-            profile=profile,
-            user_id=current_user.id if current_user else None,
+        favorited = False
+        if current_user:
+            favorited = await self._favorite_repo.exists(
+                session=session, author_id=current_user.id, article_id=article.id
+            )
+            author = replace(
+                author,
+                following=await self._follower_repo.exists(
+                    session=session,
+                    follower_id=current_user.id,
+                    following_id=article.author_id,
+                ),
+            )
+        return ArticleDTO(
+            **asdict(article),
+            author=author,
+            tags=list(cached.tags),
+            favorited=favorited,
+            favorites_count=cached.favorites_count,
         )
 
     async def delete_article_by_slug(
@@ -88,6 +138,9 @@ class ArticleService(IArticleService):
             raise ArticlePermissionException()
 
         await self._article_repo.delete_by_slug(session=session, slug=slug)
+        await self._invalidate(
+            session, article_cache_key(slug=slug), article_cache_key(slug=article.slug)
+        )
 
     async def update_article_by_slug(
         self,
@@ -101,9 +154,16 @@ class ArticleService(IArticleService):
         if article.author_id != current_user.id:
             raise ArticlePermissionException()
 
+        old_slug = article.slug
         article = await self._article_repo.update_by_slug(
             session=session, slug=slug, update_item=article_to_update
         )
+        await self._invalidate(
+            session,
+            article_cache_key(slug=slug),
+            article_cache_key(slug=old_slug),
+            article_cache_key(slug=article.slug),
+        )
         profile = await self._profile_service.get_profile_by_user_id(
             session=session, user_id=article.author_id, current_user=current_user
         )
@@ -117,7 +177,8 @@ class ArticleService(IArticleService):
         current_user: UserDTO | None,
         limit: int,
         offset: int,
-        tag: str | None = None,
+        tags: list[str] | None = None,
+        tags_match: TagsMatch = TagsMatch.any,
         author: str | None = None,
         favorited: str | None = None,
     ) -> ArticlesFeedDTO:
@@ -125,7 +186,8 @@ class ArticleService(IArticleService):
             session=session,
             limit=limit,
             offset=offset,
-            tag=tag,
+            tags=tags,
+            tags_match=tags_match,
             author=author,
             favorited=favorited,
         )
@@ -142,7 +204,11 @@ class ArticleService(IArticleService):
             for article in articles
         ]
         articles_count = await self._article_repo.count_by_filters(
-            session=session, tag=tag, author=author, favorited=favorited
+            session=session,
+            tags=tags,
+            tags_match=tags_match,
+            author=author,
+            favorited=favorited,
         )
         return ArticlesFeedDTO(
             articles=articles_with_extra, articles_count=articles_count
@@ -154,23 +220,58 @@ class ArticleService(IArticleService):
         current_user: UserDTO | None,
         limit: int,
         offset: int,
-        tag: str | None = None,
+        tags: list[str] | None = None,
+        tags_match: TagsMatch = TagsMatch.any,
         author: str | None = None,
         favorited: str | None = None,
+        q: str | None = None,
     ) -> ArticlesFeedDTO:
-        articles = await self._article_repo.list_by_filters_v2(
+        if current_user is None:
+            # Anonymous responses are identical for every visitor, share them.
+            return await self._feed_cache.get_or_set(
+                key=articles_feed_cache_key(
+                    limit=limit,
+                    offset=offset,
+                    tags=tags,
+                    tags_match=tags_match,
+                    author=author,
+                    favorited=favorited,
+                    q=q,
+                ),
+                factory=lambda: self._list_articles_by_filters_v2(
+                    session=session,
+                    user_id=None,
+                    limit=limit,
+                    offset=offset,
+                    tags=tags,
+                    tags_match=tags_match,
+                    author=author,
+                    favorited=favorited,
+                    q=q,
+                ),
+            )
+        return await self._list_articles_by_filters_v2(
             session=session,
-            user_id=current_user.id if current_user else None,
+            user_id=current_user.id,
             limit=limit,
             offset=offset,
-            tag=tag,
+            tags=tags,
+            tags_match=tags_match,
             author=author,
             favorited=favorited,
+            q=q,
         )
-        articles_count = await self._article_repo.count_by_filters(
-            session=session, tag=tag, author=author, favorited=favorited
-        )
-        return ArticlesFeedDTO(articles=articles, articles_count=articles_count)
+
+    async def stream_articles_export(
+        self,
+        session: AsyncSession,
+        chunk_size: int,
+        since: datetime.datetime | None = None,
+    ) -> AsyncIterator[list[ArticleDTO]]:
+        async for articles in self._article_repo.stream_by_updated_since(
+            session=session, chunk_size=chunk_size, since=since
+        ):
+            yield articles
 
     async def get_articles_feed(
         self, session: AsyncSession, current_user: UserDTO, limit: int, offset: int
@@ -211,40 +312,104 @@ class ArticleService(IArticleService):
     async def add_article_into_favorites(
         self, session: AsyncSession, slug: str, current_user: UserDTO
     ) -> ArticleDTO:
-        article = await self.get_article_by_slug(
-            session=session, slug=slug, current_user=current_user
-        )
-        if article.favorited:
-            raise ArticleAlreadyFavoritedException()
-
-        await self._favorite_repo.create(
-            session=session, article_id=article.id, user_id=current_user.id
+        article = await self._article_repo.favorite_by_slug(
+            session=session, slug=slug, user_id=current_user.id
         )
-        return ArticleDTO.with_updated_fields(
-            dto=article,
-            updated_fields=dict(
-                favorited=True, favorites_count=article.favorites_count + 1
-            ),
+        await self._invalidate(
+            session, article_cache_key(slug=slug), article_cache_key(slug=article.slug)
         )
+        return article
 
     async def remove_article_from_favorites(
         self, session: AsyncSession, slug: str, current_user: UserDTO
     ) -> ArticleDTO:
-        article = await self.get_article_by_slug(
-            session=session, slug=slug, current_user=current_user
+        article = await self._article_repo.unfavorite_by_slug(
+            session=session, slug=slug, user_id=current_user.id
+        )
+        await self._invalidate(
+            session, article_cache_key(slug=slug), article_cache_key(slug=article.slug)
         )
-        if not article.favorited:
-            raise ArticleNotFavoritedException()
+        return article
+
+    async def _invalidate(self, session: AsyncSession, *keys: str) -> None:
+        # Concurrent readers see the old row until the commit and may cache it
+        # again, so the keys are deleted once more after the commit.
+        await self._cache.delete(*keys)
+        call_after_commit(session, self._cache.delete, *keys)
 
-        await self._favorite_repo.delete(
-            session=session, article_id=article.id, user_id=current_user.id
+    async def _list_articles_by_filters_v2(
+        self,
+        session: AsyncSession,
+        user_id: int | None,
+        limit: int,
+        offset: int,
+        tags: list[str] | None = None,
+        tags_match: TagsMatch = TagsMatch.any,
+        author: str | None = None,
+        favorited: str | None = None,
+        q: str | None = None,
+    ) -> ArticlesFeedDTO:
+        articles = await self._article_repo.list_by_filters_v2(
+            session=session,
+            user_id=user_id,
+            limit=limit,
+            offset=offset,
+            tags=tags,
+            tags_match=tags_match,
+            author=author,
+            favorited=favorited,
+            q=q,
         )
-        return ArticleDTO.with_updated_fields(
-            dto=article,
-            updated_fields=dict(
-                favorited=False, favorites_count=article.favorites_count - 1
+        articles_count = await self._article_repo.count_by_filters(
+            session=session,
+            tags=tags,
+            tags_match=tags_match,
+            author=author,
+            favorited=favorited,
+            q=q,
+        )
+        return ArticlesFeedDTO(articles=articles, articles_count=articles_count)
+
+    async def _get_cached_article(
+        self, session: AsyncSession, slug: str
+    ) -> CachedArticleDTO:
+        key = article_cache_key(slug=slug)
+        if cached := await self._cache.get(key):
+            return cached
+
+        article = await self._article_repo.get_by_slug(session=session, slug=slug)
+        cached = CachedArticleDTO(
+            article=article,
+            tags=[
+                tag.tag
+                for tag in await self._article_tag_repo.list(
+                    session=session, article_id=article.id
+                )
+            ],
+            favorites_count=await self._favorite_repo.count(
+                session=session, article_id=article.id
             ),
         )
+        # Slug lookup also matches partially, cache exact hits only.
+        if article.slug == slug:
+            await self._cache.set(key, cached)
+        return cached
+
+    async def _get_cached_author(
+        self, session: AsyncSession, user_id: int
+    ) -> ArticleAuthorDTO:
+        key = author_cache_key(user_id=user_id)
+        if cached := await self._cache.get(key):
+            return cached
+
+        profile = await self._profile_service.get_profile_by_user_id(
+            session=session, user_id=user_id
+        )
+        author = ArticleAuthorDTO(
+            username=profile.username, bio=profile.bio, image=profile.image, id=user_id
+        )
+        await self._cache.set(key, author)
+        return author
 
     async def _get_article_info(
         self,
@@ -1,6 +1,6 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from structlog import get_logger
 
+from conduit.core.client_errors import log_client_error
 from conduit.core.exceptions import IncorrectLoginInputException, UserNotFoundException
 from conduit.domain.dtos.user import (
     CreatedUserDTO,
@@ -13,8 +13,6 @@ from conduit.domain.services.auth_token import IAuthTokenService
 from conduit.domain.services.user import IUserService
 from conduit.services.password import verify_password
 
-logger = get_logger()
-
 
 class UserAuthService(IUserAuthService):
     """Service to handle users auth logic."""
@@ -49,13 +47,13 @@ class UserAuthService(IUserAuthService):
                 session=session, email=user_to_login.email
             )
         except UserNotFoundException:
-            logger.error("User not found", email=user_to_login.email)
+            log_client_error("User not found", email=user_to_login.email)
             raise IncorrectLoginInputException()
 
         if not verify_password(
             plain_password=user_to_login.password, hashed_password=user.password_hash
         ):
-            logger.error("Incorrect password", user_id=user_to_login.email)
+            log_client_error("Incorrect password", email=user_to_login.email)
             raise IncorrectLoginInputException()
 
         jwt_token = self._auth_token_service.generate_jwt_token(user=user)
@@ -1,15 +1,13 @@
 from datetime import datetime, timedelta
 
 import jwt
-from structlog import get_logger
 
+from conduit.core.client_errors import log_client_error
 from conduit.core.exceptions import IncorrectJWTTokenException
 from conduit.domain.dtos.auth_token import TokenPayloadDTO
 from conduit.domain.dtos.user import UserDTO
 from conduit.domain.services.auth_token import IAuthTokenService
 
-logger = get_logger()
-
 
 class AuthTokenService(IAuthTokenService):
     """Service to handle JWT tokens."""
@@ -30,7 +28,7 @@ class AuthTokenService(IAuthTokenService):
         try:
             payload = jwt.decode(token, self._secret_key, algorithms=[self._algorithm])
         except jwt.InvalidTokenError as err:
-            logger.error("Invalid JWT token", token=token, error=err)
+            log_client_error("Invalid JWT token", error=str(err))
             raise IncorrectJWTTokenException()
 
         return TokenPayloadDTO(user_id=payload["user_id"], username=payload["username"])
@@ -1,9 +1,11 @@
+from collections.abc import AsyncIterator
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from conduit.core.exceptions import CommentPermissionException
+from conduit.core.utils.cursor import encode_cursor
 from conduit.domain.dtos.comment import (
     CommentDTO,
-    CommentRecordDTO,
+    CommentsCursorDTO,
     CommentsListDTO,
     CreateCommentDTO,
 )
@@ -12,20 +14,15 @@ from conduit.domain.dtos.user import UserDTO
 from conduit.domain.repositories.article import IArticleRepository
 from conduit.domain.repositories.comment import ICommentRepository
 from conduit.domain.services.comment import ICommentService
-from conduit.domain.services.profile import IProfileService
 
 
 class CommentService(ICommentService):
 
     def __init__(
-        self,
-        article_repo: IArticleRepository,
-        comment_repo: ICommentRepository,
-        profile_service: IProfileService,
+        self, article_repo: IArticleRepository, comment_repo: ICommentRepository
     ) -> None:
         self._article_repo = article_repo
         self._comment_repo = comment_repo
-        self._profile_service = profile_service
 
     async def create_article_comment(
         self,
@@ -34,7 +31,6 @@ class CommentService(ICommentService):
         comment_to_create: CreateCommentDTO,
         current_user: UserDTO,
     ) -> CommentDTO:
-        article = await self._article_repo.get_by_slug(session=session, slug=slug)
         profile = ProfileDTO(
             user_id=current_user.id,
             username=current_user.username,
@@ -42,10 +38,10 @@ class CommentService(ICommentService):
             image=current_user.image_url,
             following=False,
         )
-        comment_record_dto = await self._comment_repo.add(
+        comment_record_dto = await self._comment_repo.add_by_slug(
             session=session,
             author_id=current_user.id,
-            article_id=article.id,
+            slug=slug,
             create_item=comment_to_create,
         )
         return CommentDTO(
@@ -57,51 +53,53 @@ class CommentService(ICommentService):
         )
 
     async def get_article_comments(
-        self, session: AsyncSession, slug: str, current_user: UserDTO | None = None
+        self,
+        session: AsyncSession,
+        slug: str,
+        current_user: UserDTO | None = None,
+        limit: int | None = None,
+        cursor: CommentsCursorDTO | None = None,
     ) -> CommentsListDTO:
-        article = await self._article_repo.get_by_slug(session=session, slug=slug)
-        comment_records = await self._comment_repo.list(
-            session=session, article_id=article.id
-        )
-        profiles_map = await self._get_profiles_mapping(
-            session=session, comments=comment_records, current_user=current_user
+        # Fetch one extra comment to know whether there is a next page.
+        comments_list = await self._comment_repo.list_by_slug(
+            session=session,
+            slug=slug,
+            user_id=current_user.id if current_user else None,
+            limit=limit + 1 if limit is not None else None,
+            cursor=cursor,
         )
-        comments = [
-            CommentDTO(
-                id=comment_record_dto.id,
-                body=comment_record_dto.body,
-                author=profiles_map[comment_record_dto.author_id],
-                created_at=comment_record_dto.created_at,
-                updated_at=comment_record_dto.updated_at,
+        comments = comments_list.comments
+        next_cursor = None
+        if limit is not None and len(comments) > limit:
+            comments = comments[:limit]
+            next_cursor = encode_cursor(
+                created_at=comments[-1].created_at, id=comments[-1].id
             )
-            for comment_record_dto in comment_records
-        ]
-        comments_count = await self._comment_repo.count(
-            session=session, article_id=article.id
+        return CommentsListDTO(
+            comments=comments,
+            comments_count=comments_list.comments_count,
+            next_cursor=next_cursor,
         )
-        return CommentsListDTO(comments=comments, comments_count=comments_count)
-
-    async def delete_article_comment(
-        self, session: AsyncSession, slug: str, comment_id: int, current_user: UserDTO
-    ) -> None:
-        # Check if article exists before deleting the comment.
-        await self._article_repo.get_by_slug(session=session, slug=slug)
-
-        comment = await self._comment_repo.get(session=session, comment_id=comment_id)
-        if comment.author_id != current_user.id:
-            raise CommentPermissionException()
 
-        await self._comment_repo.delete(session=session, comment_id=comment_id)
-
-    async def _get_profiles_mapping(
+    async def stream_article_comments(
         self,
         session: AsyncSession,
-        comments: list[CommentRecordDTO],
+        slug: str,
         current_user: UserDTO | None,
-    ) -> dict[int, ProfileDTO]:
-        comments_profiles = await self._profile_service.get_profiles_by_user_ids(
+        chunk_size: int,
+    ) -> AsyncIterator[list[CommentDTO]]:
+        article_id = await self._article_repo.get_id_by_slug(session=session, slug=slug)
+        async for comments in self._comment_repo.stream(
             session=session,
-            user_ids=list({comment.author_id for comment in comments}),
-            current_user=current_user,
+            article_id=article_id,
+            user_id=current_user.id if current_user else None,
+            chunk_size=chunk_size,
+        ):
+            yield comments
+
+    async def delete_article_comment(
+        self, session: AsyncSession, slug: str, comment_id: int, current_user: UserDTO
+    ) -> None:
+        await self._comment_repo.delete_by_slug(
+            session=session, slug=slug, comment_id=comment_id, author_id=current_user.id
         )
-        return {profile.user_id: profile for profile in comments_profiles}
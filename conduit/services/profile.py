@@ -1,6 +1,6 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from structlog import get_logger
 
+from conduit.core.client_errors import log_client_error
 from conduit.core.exceptions import (
     OwnProfileFollowingException,
     ProfileAlreadyFollowedException,
@@ -8,21 +8,26 @@ from conduit.core.exceptions import (
     ProfileNotFoundException,
     UserNotFoundException,
 )
+from conduit.domain.cache import ICache, profiles_suggestions_cache_key
 from conduit.domain.dtos.profile import ProfileDTO
 from conduit.domain.dtos.user import UserDTO
 from conduit.domain.repositories.follower import IFollowerRepository
 from conduit.domain.services.profile import IProfileService
 from conduit.domain.services.user import IUserService
 
-logger = get_logger()
-
 
 class ProfileService(IProfileService):
     """Service to handle user profiles and following logic."""
 
-    def __init__(self, user_service: IUserService, follower_repo: IFollowerRepository):
+    def __init__(
+        self,
+        user_service: IUserService,
+        follower_repo: IFollowerRepository,
+        suggestions_cache: ICache,
+    ):
         self._user_service = user_service
         self._follower_repo = follower_repo
+        self._suggestions_cache = suggestions_cache
 
     async def get_profile_by_username(
         self, session: AsyncSession, username: str, current_user: UserDTO | None = None
@@ -32,7 +37,7 @@ class ProfileService(IProfileService):
                 session=session, username=username
             )
         except UserNotFoundException:
-            logger.exception("Profile not found", username=username)
+            log_client_error("Profile not found", username=username)
             raise ProfileNotFoundException()
 
         profile = ProfileDTO(
@@ -69,6 +74,26 @@ class ProfileService(IProfileService):
             )
         return profile
 
+    async def get_profiles_suggestions(
+        self, session: AsyncSession, prefix: str, limit: int
+    ) -> list[ProfileDTO]:
+        key = profiles_suggestions_cache_key(prefix=prefix, limit=limit)
+        if (profiles := await self._suggestions_cache.get(key)) is None:
+            users = await self._user_service.get_users_by_username_prefix(
+                session=session, prefix=prefix, limit=limit
+            )
+            profiles = [
+                ProfileDTO(
+                    user_id=user.id,
+                    username=user.username,
+                    bio=user.bio,
+                    image=user.image_url,
+                )
+                for user in users
+            ]
+            await self._suggestions_cache.set(key, profiles)
+        return profiles
+
     async def get_profiles_by_user_ids(
         self, session: AsyncSession, user_ids: list[int], current_user: UserDTO | None
     ) -> list[ProfileDTO]:
@@ -125,7 +150,7 @@ class ProfileService(IProfileService):
         if not await self._follower_repo.exists(
             session, follower_id=current_user.id, following_id=target_user.id
         ):
-            logger.exception("User not followed", username=username)
+            log_client_error("User not followed", username=username)
             raise ProfileNotFollowedFollowedException()
 
         await self._follower_repo.delete(
@@ -1,5 +1,6 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from conduit.domain.cache import ICache, tags_suggestions_cache_key
 from conduit.domain.dtos.tag import TagDTO
 from conduit.domain.repositories.tag import ITagRepository
 from conduit.domain.services.tag import ITagService
@@ -8,8 +9,20 @@ from conduit.domain.services.tag import ITagService
 class TagService(ITagService):
     """Service to handle article tags logic."""
 
-    def __init__(self, tag_repo: ITagRepository):
+    def __init__(self, tag_repo: ITagRepository, suggestions_cache: ICache):
         self._tag_repo = tag_repo
+        self._suggestions_cache = suggestions_cache
 
     async def get_all_tags(self, session: AsyncSession) -> list[TagDTO]:
         return await self._tag_repo.list(session=session)
+
+    async def get_tags_suggestions(
+        self, session: AsyncSession, prefix: str, limit: int
+    ) -> list[TagDTO]:
+        key = tags_suggestions_cache_key(prefix=prefix, limit=limit)
+        if (tags := await self._suggestions_cache.get(key)) is None:
+            tags = await self._tag_repo.list_by_prefix(
+                session=session, prefix=prefix, limit=limit
+            )
+            await self._suggestions_cache.set(key, tags)
+        return tags
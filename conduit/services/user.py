@@ -1,17 +1,20 @@
-from collections.abc import Collection
+from collections.abc import Callable, Collection
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from conduit.core.after_commit import call_after_commit
 from conduit.core.exceptions import (
     EmailAlreadyTakenException,
     UserNameAlreadyTakenException,
 )
+from conduit.domain.cache import ICache, author_cache_key
 from conduit.domain.dtos.user import (
     CreateUserDTO,
     UpdatedUserDTO,
     UpdateUserDTO,
     UserDTO,
 )
+from conduit.domain.loaders.user import IUserLoader
 from conduit.domain.repositories.user import IUserRepository
 from conduit.domain.services.user import IUserService
 
@@ -19,8 +22,15 @@ from conduit.domain.services.user import IUserService
 class UserService(IUserService):
     """Service to handle user get & update logic."""
 
-    def __init__(self, user_repo: IUserRepository) -> None:
+    def __init__(
+        self,
+        user_repo: IUserRepository,
+        user_loader_factory: Callable[[AsyncSession], IUserLoader],
+        cache: ICache,
+    ) -> None:
         self._user_repo = user_repo
+        self._user_loader_factory = user_loader_factory
+        self._cache = cache
 
     async def create_user(
         self, session: AsyncSession, user_to_create: CreateUserDTO
@@ -35,10 +45,12 @@ class UserService(IUserService):
         ):
             raise UserNameAlreadyTakenException()
 
-        return await self._user_repo.add(session=session, create_item=user_to_create)
+        user = await self._user_repo.add(session=session, create_item=user_to_create)
+        self._user_loader_factory(session).prime(user)
+        return user
 
     async def get_user_by_id(self, session: AsyncSession, user_id: int) -> UserDTO:
-        return await self._user_repo.get(session=session, user_id=user_id)
+        return await self._user_loader_factory(session).load(user_id=user_id)
 
     async def get_user_by_email(self, session: AsyncSession, email: str) -> UserDTO:
         return await self._user_repo.get_by_email(session=session, email=email)
@@ -46,12 +58,21 @@ class UserService(IUserService):
     async def get_user_by_username(
         self, session: AsyncSession, username: str
     ) -> UserDTO:
-        return await self._user_repo.get_by_username(session=session, username=username)
+        return await self._user_loader_factory(session).load_by_username(
+            username=username
+        )
+
+    async def get_users_by_username_prefix(
+        self, session: AsyncSession, prefix: str, limit: int
+    ) -> list[UserDTO]:
+        return await self._user_repo.list_by_username_prefix(
+            session=session, prefix=prefix, limit=limit
+        )
 
     async def get_users_by_ids(
         self, session: AsyncSession, user_ids: Collection[int]
     ) -> list[UserDTO]:
-        return await self._user_repo.list_by_users(session=session, user_ids=user_ids)
+        return await self._user_loader_factory(session).load_many(user_ids=user_ids)
 
     async def update_user(
         self,
@@ -74,6 +95,12 @@ class UserService(IUserService):
         updated_user = await self._user_repo.update(
             session=session, user_id=current_user.id, update_item=user_to_update
         )
+        self._user_loader_factory(session).prime(updated_user)
+        # Deleted again after the commit, a concurrent reader may cache the old
+        # profile meanwhile.
+        key = author_cache_key(user_id=current_user.id)
+        await self._cache.delete(key)
+        call_after_commit(session, self._cache.delete, key)
         return UpdatedUserDTO(
             id=updated_user.id,
             email=updated_user.email,
@@ -0,0 +1,168 @@
+import json
+
+import pytest
+from httpx import AsyncClient
+
+from conduit.core.settings.base import BaseAppSettings
+from conduit.domain.dtos.article import ArticleDTO
+from conduit.domain.dtos.user import UserDTO
+
+
+@pytest.fixture
+def admin_user(
+    monkeypatch: pytest.MonkeyPatch, settings: BaseAppSettings, test_user: UserDTO
+) -> UserDTO:
+    monkeypatch.setattr(settings, "admin_usernames", [test_user.username])
+    return test_user
+
+
+def to_ndjson(*articles: dict) -> str:
+    return "\n".join(json.dumps(article) for article in articles) + "\n"
+
+
+@pytest.mark.anyio
+async def test_not_admin_user_can_not_import_articles(
+    authorized_test_client: AsyncClient,
+) -> None:
+    response = await authorized_test_client.post(
+        url="/admin/articles/import", content=to_ndjson({"title": "Title"})
+    )
+    assert response.status_code == 403
+
+
+@pytest.mark.anyio
+async def test_admin_user_can_import_articles(
+    authorized_test_client: AsyncClient, admin_user: UserDTO, test_article: ArticleDTO
+) -> None:
+    content = to_ndjson(
+        {
+            "title": "Imported Article",
+            "description": "Imported Description",
+            "body": "Imported Body",
+            "tagList": ["imported", "tag1", "imported"],
+        },
+        {"title": "Another Imported Article", "author": "unknown"},
+    )
+    response = await authorized_test_client.post(
+        url="/admin/articles/import", content=content
+    )
+    assert response.status_code == 200
+    assert response.json() == {"articlesCount": 2}
+
+    response = await authorized_test_client.get(url="/articles?tag=tag1")
+    articles = response.json()["articles"]
+    assert response.json()["articlesCount"] == 2
+    assert {article["title"] for article in articles} == {
+        test_article.title,
+        "Imported Article",
+    }
+    imported_article = next(
+        article for article in articles if article["title"] == "Imported Article"
+    )
+    assert sorted(imported_article["tagList"]) == ["imported", "tag1"]
+    assert imported_article["author"]["username"] == admin_user.username
+
+
+@pytest.mark.anyio
+async def test_import_with_invalid_line_returns_error(
+    authorized_test_client: AsyncClient, admin_user: UserDTO
+) -> None:
+    content = to_ndjson({"title": "Imported Article"}) + "{not json}\n"
+    response = await authorized_test_client.post(
+        url="/admin/articles/import", content=content
+    )
+    assert response.status_code == 422
+    assert "line 2" in response.json()["errors"]
+
+    response = await authorized_test_client.get(url="/articles")
+    assert response.json()["articlesCount"] == 0
+
+
+@pytest.mark.anyio
+async def test_not_admin_user_can_not_export_articles(
+    authorized_test_client: AsyncClient,
+) -> None:
+    response = await authorized_test_client.get(url="/admin/articles/export")
+    assert response.status_code == 403
+
+
+@pytest.mark.anyio
+async def test_admin_user_can_export_articles(
+    authorized_test_client: AsyncClient, admin_user: UserDTO, test_article: ArticleDTO
+) -> None:
+    response = await authorized_test_client.get(url="/admin/articles/export")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+
+    articles = [json.loads(line) for line in response.text.splitlines()]
+    assert len(articles) == 1
+    assert articles[0]["slug"] == test_article.slug
+    assert sorted(articles[0]["tagList"]) == sorted(test_article.tags)
+    assert articles[0]["author"]["username"] == admin_user.username
+
+
+@pytest.mark.anyio
+async def test_admin_user_can_export_articles_updated_since(
+    authorized_test_client: AsyncClient, admin_user: UserDTO, test_article: ArticleDTO
+) -> None:
+    response = await authorized_test_client.get(url="/admin/articles/export")
+    updated_at = json.loads(response.text)["updatedAt"]
+
+    response = await authorized_test_client.get(
+        url="/admin/articles/export", params={"since": updated_at}
+    )
+    assert len(response.text.splitlines()) == 1
+
+    response = await authorized_test_client.get(
+        url="/admin/articles/export", params={"since": "2999-01-01T00:00:00Z"}
+    )
+    assert response.text == ""
+
+
+@pytest.fixture
+def profiler_token(monkeypatch: pytest.MonkeyPatch, settings: BaseAppSettings) -> str:
+    monkeypatch.setattr(settings, "profiler_enabled", True)
+    monkeypatch.setattr(settings, "profiler_token", "profiler-token")
+    return settings.profiler_token
+
+
+@pytest.mark.anyio
+async def test_profiler_is_not_found_when_disabled(
+    authorized_test_client: AsyncClient, admin_user: UserDTO
+) -> None:
+    response = await authorized_test_client.get(
+        url="/admin/profile", headers={"X-Profiler-Token": "profiler-token"}
+    )
+    assert response.status_code == 404
+
+
+@pytest.mark.anyio
+async def test_profiler_requires_token(
+    authorized_test_client: AsyncClient, admin_user: UserDTO, profiler_token: str
+) -> None:
+    response = await authorized_test_client.get(
+        url="/admin/profile", headers={"X-Profiler-Token": "wrong-token"}
+    )
+    assert response.status_code == 403
+
+
+@pytest.mark.anyio
+async def test_admin_user_can_profile_worker(
+    authorized_test_client: AsyncClient, admin_user: UserDTO, profiler_token: str
+) -> None:
+    response = await authorized_test_client.get(
+        url="/admin/profile",
+        params={"duration": 0.1, "interval_ms": 5},
+        headers={"X-Profiler-Token": profiler_token},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "MainThread;" in response.text
+
+    response = await authorized_test_client.get(
+        url="/admin/profile",
+        params={"duration": 0.1, "interval_ms": 5, "format": "speedscope"},
+        headers={"X-Profiler-Token": profiler_token},
+    )
+    assert response.status_code == 200
+    assert response.json()["profiles"]
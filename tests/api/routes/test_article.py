@@ -1,9 +1,15 @@
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+
 import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from conduit.api.schemas.responses.article import ArticleResponse
-from conduit.domain.dtos.article import ArticleDTO
+from conduit.core.dependencies import IArticleService
+from conduit.core.query_stats import QueryStats
+from conduit.domain.dtos.article import ArticleDTO, CreateArticleDTO
+from conduit.domain.dtos.user import UserDTO
 from conduit.infrastructure.repositories.article import ArticleRepository
 from conduit.infrastructure.repositories.user import UserRepository
 from tests.utils import create_another_test_article, create_another_test_user
@@ -159,3 +165,173 @@ async def test_user_can_delete_own_article(
 
     response = await authorized_test_client.get(url=f"/articles/{test_article.slug}")
     assert response.status_code == 404
+
+
+@pytest.mark.anyio
+async def test_user_can_favorite_article(
+    authorized_test_client: AsyncClient,
+    test_article: ArticleDTO,
+    query_budget: Callable[[int], AbstractContextManager[QueryStats]],
+) -> None:
+    # The current user lookup and the toggle.
+    with query_budget(2):
+        response = await authorized_test_client.post(
+            url=f"/articles/{test_article.slug}/favorite"
+        )
+    assert response.status_code == 200
+
+    article = ArticleResponse(**response.json())
+    assert article.article.favorited is True
+    assert article.article.favorites_count == 1
+    assert set(article.article.tags) == set(test_article.tags)
+
+
+@pytest.mark.anyio
+async def test_user_can_not_favorite_already_favorited_article(
+    authorized_test_client: AsyncClient, test_article: ArticleDTO
+) -> None:
+    response = await authorized_test_client.post(
+        url=f"/articles/{test_article.slug}/favorite"
+    )
+    assert response.status_code == 200
+
+    response = await authorized_test_client.post(
+        url=f"/articles/{test_article.slug}/favorite"
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.anyio
+async def test_user_can_unfavorite_favorited_article(
+    authorized_test_client: AsyncClient,
+    test_article: ArticleDTO,
+    query_budget: Callable[[int], AbstractContextManager[QueryStats]],
+) -> None:
+    response = await authorized_test_client.post(
+        url=f"/articles/{test_article.slug}/favorite"
+    )
+    assert response.status_code == 200
+
+    # The current user lookup and the toggle.
+    with query_budget(2):
+        response = await authorized_test_client.delete(
+            url=f"/articles/{test_article.slug}/favorite"
+        )
+    article = ArticleResponse(**response.json())
+    assert article.article.favorited is False
+    assert article.article.favorites_count == 0
+
+
+@pytest.mark.anyio
+async def test_user_can_not_unfavorite_not_favorited_article(
+    authorized_test_client: AsyncClient, test_article: ArticleDTO
+) -> None:
+    response = await authorized_test_client.delete(
+        url=f"/articles/{test_article.slug}/favorite"
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize("api_method", ("POST", "DELETE"))
+@pytest.mark.anyio
+async def test_user_can_not_favorite_not_existing_article(
+    authorized_test_client: AsyncClient, api_method: str
+) -> None:
+    response = await authorized_test_client.request(
+        method=api_method, url="/articles/not-existing-article-slug/favorite"
+    )
+    assert response.status_code == 404
+
+
+@pytest.mark.anyio
+async def test_user_can_search_articles(
+    authorized_test_client: AsyncClient,
+    test_article: ArticleDTO,
+    session: AsyncSession,
+    article_repository: ArticleRepository,
+) -> None:
+    await article_repository.add(
+        session=session,
+        author_id=test_article.author_id,
+        create_item=CreateArticleDTO(
+            title="Postgres indexes",
+            description="How GIN indexes work",
+            body="Searching articles in postgres",
+            tags=[],
+        ),
+    )
+    response = await authorized_test_client.get(url="/articles?q=indexes")
+    assert response.json()["articlesCount"] == 1
+    assert response.json()["articles"][0]["title"] == "Postgres indexes"
+
+    response = await authorized_test_client.get(url="/articles?q=test&tag=tag1")
+    assert response.json()["articlesCount"] == 1
+    assert response.json()["articles"][0]["slug"] == test_article.slug
+
+    response = await authorized_test_client.get(url="/articles?q=missing")
+    assert response.json() == {"articles": [], "articlesCount": 0}
+
+
+@pytest.mark.anyio
+async def test_user_can_filter_articles_by_several_tags(
+    authorized_test_client: AsyncClient,
+    test_article: ArticleDTO,
+    test_user: UserDTO,
+    session: AsyncSession,
+    article_service: IArticleService,
+) -> None:
+    await article_service.create_new_article(
+        session=session,
+        current_user=test_user,
+        article_to_create=CreateArticleDTO(
+            title="Another Article",
+            description="Another Description",
+            body="Another Body",
+            tags=["tag2", "tag3"],
+        ),
+    )
+    response = await authorized_test_client.get(url="/articles?tag=tag1&tag=tag3")
+    assert response.json()["articlesCount"] == 2
+    assert len(response.json()["articles"]) == 2
+
+    response = await authorized_test_client.get(
+        url="/articles?tag=tag1&tag=tag3&match=all"
+    )
+    assert response.json() == {"articles": [], "articlesCount": 0}
+
+    response = await authorized_test_client.get(
+        url="/articles?tag=tag2&tag=tag3&match=all"
+    )
+    assert response.json()["articlesCount"] == 1
+    assert sorted(response.json()["articles"][0]["tagList"]) == ["tag2", "tag3"]
+
+
+@pytest.mark.anyio
+async def test_user_can_not_filter_articles_with_unknown_tags_match(
+    authorized_test_client: AsyncClient,
+) -> None:
+    response = await authorized_test_client.get(url="/articles?tag=tag1&match=some")
+    assert response.status_code == 422
+
+
+@pytest.mark.anyio
+async def test_user_article_feed_fits_query_budget(
+    authorized_test_client: AsyncClient,
+    test_article: ArticleDTO,
+    query_budget: Callable[[int], AbstractContextManager[QueryStats]],
+) -> None:
+    with query_budget(3):
+        response = await authorized_test_client.get(url="/articles/feed")
+    assert response.status_code == 200
+    assert response.headers["Server-Timing"].startswith("db;dur=")
+
+
+@pytest.mark.anyio
+async def test_anonymous_global_feed_fits_query_budget(
+    test_client: AsyncClient,
+    test_article: ArticleDTO,
+    query_budget: Callable[[int], AbstractContextManager[QueryStats]],
+) -> None:
+    with query_budget(2):
+        response = await test_client.get(url="/articles")
+    assert response.json()["articlesCount"] == 1
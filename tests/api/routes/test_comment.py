@@ -0,0 +1,283 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from conduit.domain.dtos.article import ArticleDTO
+from conduit.domain.dtos.comment import CreateCommentDTO
+from conduit.infrastructure.repositories.comment import CommentRepository
+from conduit.infrastructure.repositories.user import UserRepository
+from tests.utils import create_another_test_user
+
+
+async def create_comments(client: AsyncClient, slug: str, count: int) -> list[dict]:
+    comments = []
+    for index in range(count):
+        response = await client.post(
+            url=f"/articles/{slug}/comments",
+            json={"comment": {"body": f"Test comment {index}"}},
+        )
+        assert response.status_code == 200
+        comments.append(response.json()["comment"])
+    return comments
+
+
+@pytest.mark.anyio
+async def test_user_can_create_comment(
+    authorized_test_client: AsyncClient, test_article: ArticleDTO
+) -> None:
+    response = await authorized_test_client.post(
+        url=f"/articles/{test_article.slug}/comments",
+        json={"comment": {"body": "Test comment"}},
+    )
+    assert response.status_code == 200
+    assert response.json()["comment"]["body"] == "Test comment"
+
+
+@pytest.mark.anyio
+async def test_user_can_list_comments(
+    test_client: AsyncClient,
+    authorized_test_client: AsyncClient,
+    test_article: ArticleDTO,
+) -> None:
+    await create_comments(
+        client=authorized_test_client, slug=test_article.slug, count=3
+    )
+    response = await test_client.get(url=f"/articles/{test_article.slug}/comments")
+    assert response.status_code == 200
+
+    payload = response.json()
+    assert payload["commentsCount"] == 3
+    assert payload["nextCursor"] is None
+    assert [comment["body"] for comment in payload["comments"]] == [
+        "Test comment 0",
+        "Test comment 1",
+        "Test comment 2",
+    ]
+
+
+@pytest.mark.anyio
+async def test_user_can_list_comments_of_article_without_comments(
+    test_client: AsyncClient, test_article: ArticleDTO
+) -> None:
+    response = await test_client.get(url=f"/articles/{test_article.slug}/comments")
+    assert response.status_code == 200
+    assert response.json() == {"comments": [], "commentsCount": 0, "nextCursor": None}
+
+
+@pytest.mark.anyio
+async def test_user_can_see_followed_comment_authors(
+    test_client: AsyncClient,
+    authorized_test_client: AsyncClient,
+    test_article: ArticleDTO,
+    session: AsyncSession,
+    user_repository: UserRepository,
+    comment_repository: CommentRepository,
+) -> None:
+    new_user = await create_another_test_user(
+        session=session, user_repository=user_repository
+    )
+    await comment_repository.add_by_slug(
+        session=session,
+        author_id=new_user.id,
+        slug=test_article.slug,
+        create_item=CreateCommentDTO(body="Foreign comment"),
+    )
+    await create_comments(
+        client=authorized_test_client, slug=test_article.slug, count=1
+    )
+    url = f"/articles/{test_article.slug}/comments"
+
+    response = await authorized_test_client.get(url=url)
+    assert [
+        (comment["author"]["username"], comment["author"]["following"])
+        for comment in response.json()["comments"]
+    ] == [(new_user.username, False), (test_article.author.username, False)]
+
+    response = await authorized_test_client.post(
+        url=f"/profiles/{new_user.username}/follow"
+    )
+    assert response.status_code == 200
+
+    response = await authorized_test_client.get(url=url)
+    assert [
+        (comment["author"]["username"], comment["author"]["following"])
+        for comment in response.json()["comments"]
+    ] == [(new_user.username, True), (test_article.author.username, False)]
+
+    # Anonymous viewers follow nobody.
+    response = await test_client.get(url=url)
+    assert [
+        comment["author"]["following"] for comment in response.json()["comments"]
+    ] == [False, False]
+
+
+@pytest.mark.anyio
+async def test_user_can_paginate_comments_with_cursor(
+    authorized_test_client: AsyncClient, test_article: ArticleDTO
+) -> None:
+    created = await create_comments(
+        client=authorized_test_client, slug=test_article.slug, count=5
+    )
+    url = f"/articles/{test_article.slug}/comments"
+
+    response = await authorized_test_client.get(url=url, params={"limit": 2})
+    first_page = response.json()
+    assert first_page["commentsCount"] == 5
+    assert first_page["nextCursor"] is not None
+
+    response = await authorized_test_client.get(
+        url=url, params={"limit": 3, "cursor": first_page["nextCursor"]}
+    )
+    second_page = response.json()
+    assert second_page["nextCursor"] is None
+
+    received_ids = [
+        comment["id"] for comment in first_page["comments"] + second_page["comments"]
+    ]
+    assert received_ids == [comment["id"] for comment in created]
+
+
+@pytest.mark.anyio
+async def test_user_can_not_paginate_comments_with_invalid_cursor(
+    test_client: AsyncClient, test_article: ArticleDTO
+) -> None:
+    response = await test_client.get(
+        url=f"/articles/{test_article.slug}/comments", params={"cursor": "not-a-cursor"}
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.anyio
+async def test_user_can_delete_own_comment(
+    authorized_test_client: AsyncClient, test_article: ArticleDTO
+) -> None:
+    [comment] = await create_comments(
+        client=authorized_test_client, slug=test_article.slug, count=1
+    )
+    response = await authorized_test_client.delete(
+        url=f"/articles/{test_article.slug}/comments/{comment['id']}"
+    )
+    assert response.status_code == 204
+
+    response = await authorized_test_client.get(
+        url=f"/articles/{test_article.slug}/comments"
+    )
+    assert response.json()["comments"] == []
+    assert response.json()["commentsCount"] == 0
+
+
+@pytest.mark.anyio
+async def test_user_can_not_delete_not_existing_comment(
+    authorized_test_client: AsyncClient, test_article: ArticleDTO
+) -> None:
+    response = await authorized_test_client.delete(
+        url=f"/articles/{test_article.slug}/comments/9999"
+    )
+    assert response.status_code == 404
+
+
+@pytest.mark.anyio
+async def test_user_can_not_delete_foreign_comment(
+    authorized_test_client: AsyncClient,
+    test_article: ArticleDTO,
+    session: AsyncSession,
+    user_repository: UserRepository,
+    comment_repository: CommentRepository,
+) -> None:
+    new_user = await create_another_test_user(
+        session=session, user_repository=user_repository
+    )
+    comment = await comment_repository.add_by_slug(
+        session=session,
+        author_id=new_user.id,
+        slug=test_article.slug,
+        create_item=CreateCommentDTO(body="Foreign comment"),
+    )
+    response = await authorized_test_client.delete(
+        url=f"/articles/{test_article.slug}/comments/{comment.id}"
+    )
+    assert response.status_code == 403
+
+
+@pytest.mark.anyio
+async def test_user_can_not_create_comment_for_not_existing_article(
+    authorized_test_client: AsyncClient,
+) -> None:
+    response = await authorized_test_client.post(
+        url="/articles/not-existing-article-slug/comments",
+        json={"comment": {"body": "Test comment"}},
+    )
+    assert response.status_code == 404
+
+
+@pytest.mark.anyio
+async def test_user_can_not_list_comments_of_not_existing_article(
+    test_client: AsyncClient,
+) -> None:
+    response = await test_client.get(url="/articles/not-existing-article-slug/comments")
+    assert response.status_code == 404
+
+
+@pytest.mark.anyio
+async def test_user_can_stream_all_comments(
+    authorized_test_client: AsyncClient, test_article: ArticleDTO
+) -> None:
+    created = await create_comments(
+        client=authorized_test_client, slug=test_article.slug, count=3
+    )
+    response = await authorized_test_client.get(
+        url=f"/articles/{test_article.slug}/comments",
+        params={"stream": True, "limit": 1},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+
+    payload = response.json()
+    assert payload["commentsCount"] == 3
+    assert [comment["id"] for comment in payload["comments"]] == [
+        comment["id"] for comment in created
+    ]
+
+
+@pytest.mark.anyio
+async def test_user_can_stream_comments_with_authors(
+    authorized_test_client: AsyncClient,
+    test_article: ArticleDTO,
+    session: AsyncSession,
+    user_repository: UserRepository,
+    comment_repository: CommentRepository,
+) -> None:
+    new_user = await create_another_test_user(
+        session=session, user_repository=user_repository
+    )
+    await comment_repository.add_by_slug(
+        session=session,
+        author_id=new_user.id,
+        slug=test_article.slug,
+        create_item=CreateCommentDTO(body="Foreign comment"),
+    )
+    await create_comments(
+        client=authorized_test_client, slug=test_article.slug, count=1
+    )
+    response = await authorized_test_client.post(
+        url=f"/profiles/{new_user.username}/follow"
+    )
+    assert response.status_code == 200
+
+    response = await authorized_test_client.get(
+        url=f"/articles/{test_article.slug}/comments", params={"stream": True}
+    )
+    assert [
+        (comment["author"]["username"], comment["author"]["following"])
+        for comment in response.json()["comments"]
+    ] == [(new_user.username, True), (test_article.author.username, False)]
+
+
+@pytest.mark.anyio
+async def test_user_can_not_stream_comments_of_not_existing_article(
+    test_client: AsyncClient,
+) -> None:
+    response = await test_client.get(
+        url="/articles/not-existing-article-slug/comments", params={"stream": True}
+    )
+    assert response.status_code == 404
@@ -1,6 +1,8 @@
 import pytest
 from httpx import AsyncClient
 
+from conduit.core.lifecycle import LifecycleState, lifecycle
+
 
 @pytest.mark.anyio
 async def test_successful_health_check(test_client: AsyncClient) -> None:
@@ -9,3 +11,38 @@ async def test_successful_health_check(test_client: AsyncClient) -> None:
 
     response = response.json()
     assert response["message"] == "Conduit Realworld API"
+
+
+@pytest.mark.anyio
+async def test_request_id_is_returned(test_client: AsyncClient) -> None:
+    response = await test_client.get(
+        "/health-check", headers={"X-Request-ID": "client-request-1"}
+    )
+    assert response.headers["X-Request-ID"] == "client-request-1"
+    assert "handler;dur=" in response.headers["Server-Timing"]
+
+
+@pytest.mark.anyio
+async def test_invalid_request_id_is_replaced(test_client: AsyncClient) -> None:
+    response = await test_client.get(
+        "/health-check", headers={"X-Request-ID": "forged\tlog line"}
+    )
+    assert response.headers["X-Request-ID"] not in ("", "forged\tlog line")
+
+
+@pytest.mark.anyio
+async def test_readiness_follows_lifecycle(
+    monkeypatch: pytest.MonkeyPatch, test_client: AsyncClient
+) -> None:
+    monkeypatch.setattr(lifecycle, "state", LifecycleState.starting)
+    response = await test_client.get("/health-check/ready")
+    assert response.status_code == 503
+
+    monkeypatch.setattr(lifecycle, "state", LifecycleState.ready)
+    response = await test_client.get("/health-check/ready")
+    assert response.status_code == 200
+    assert response.json() == {"status": "ready"}
+
+    monkeypatch.setattr(lifecycle, "state", LifecycleState.draining)
+    response = await test_client.get("/health-check/ready")
+    assert response.status_code == 503
@@ -0,0 +1,13 @@
+import pytest
+from httpx import AsyncClient
+
+
+@pytest.mark.anyio
+async def test_metrics_report_requests_by_route(test_client: AsyncClient) -> None:
+    await test_client.get(url="/health-check")
+
+    response = await test_client.get(url="http://testserver/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert 'route="/api/health-check"' in response.text
+    assert "http_requests_in_flight" in response.text
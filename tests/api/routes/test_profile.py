@@ -165,3 +165,25 @@ async def test_user_can_not_retrieve_not_existing_profile(
         method=api_method, url=api_path.format(username="not-existing-username")
     )
     assert response.status_code == 404
+
+
+@pytest.mark.anyio
+async def test_profiles_suggestions_match_username_prefix(
+    test_client: AsyncClient,
+    test_user: UserDTO,
+    session: AsyncSession,
+    user_repository: UserRepository,
+) -> None:
+    await create_another_test_user(session=session, user_repository=user_repository)
+
+    response = await test_client.get(
+        url="/profiles/suggest", params={"prefix": test_user.username}
+    )
+    assert response.json() == {
+        "profiles": [{"username": test_user.username, "image": test_user.image_url}]
+    }
+
+    response = await test_client.get(
+        url="/profiles/suggest", params={"prefix": "te", "limit": 1}
+    )
+    assert len(response.json()["profiles"]) == 1
@@ -18,3 +18,20 @@ async def test_list_of_tags_when_article_with_tags_exists(
     response_tags = response.json()["tags"]
     assert len(response_tags) == len(set(test_article.tags))
     assert all(tag in test_article.tags for tag in response_tags)
+
+
+@pytest.mark.anyio
+async def test_tags_suggestions_match_prefix(
+    test_client: AsyncClient, test_article: ArticleDTO
+) -> None:
+    response = await test_client.get(url="/tags/suggest", params={"prefix": "tag"})
+    assert response.json() == {"tags": sorted(set(test_article.tags))}
+
+    response = await test_client.get(url="/tags/suggest", params={"prefix": "ta%"})
+    assert response.json() == {"tags": []}
+
+
+@pytest.mark.anyio
+async def test_tags_suggestions_require_prefix(test_client: AsyncClient) -> None:
+    response = await test_client.get(url="/tags/suggest")
+    assert response.status_code == 422
@@ -1,12 +1,15 @@
+import contextlib
 import os
-from collections.abc import Generator
+from collections.abc import Callable, Generator, Iterator
+from contextlib import AbstractContextManager
 from datetime import datetime
 from typing import TypeAlias
 
 import pytest
 from fastapi import FastAPI
 from httpx import AsyncClient
-from sqlalchemy import create_engine
+from pydantic import computed_field
+from sqlalchemy import NullPool, create_engine
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy_utils import create_database, database_exists, drop_database
 
@@ -14,16 +17,34 @@ from conduit.app import create_app
 from conduit.core.config import get_app_settings
 from conduit.core.container import Container
 from conduit.core.dependencies import IArticleService, IAuthTokenService
+from conduit.core.query_stats import QueryStats, collect_query_stats
 from conduit.core.settings.base import BaseAppSettings
+from conduit.core.settings.test import TestAppSettings as AppTestSettings
 from conduit.domain.dtos.article import ArticleDTO, CreateArticleDTO
 from conduit.domain.dtos.user import CreateUserDTO, UserDTO
 from conduit.domain.repositories.article import IArticleRepository
+from conduit.domain.repositories.comment import ICommentRepository
 from conduit.domain.repositories.user import IUserRepository
 from conduit.infrastructure.models import Base
 
 SetupFixture: TypeAlias = None
 
 
+class TransactionalTestAppSettings(AppTestSettings):
+    """
+    Settings of a production-like application, with transactions and caches.
+    """
+
+    cache_max_size: int = 1024
+    tag_id_cache_max_size: int = 1024
+
+    @computed_field  # type: ignore
+    @property
+    def sqlalchemy_engine_props(self) -> dict:
+        # Unlike the autocommit engine, a rollback discards the inserted rows.
+        return dict(url=self.sql_db_uri, echo=False, poolclass=NullPool)
+
+
 @pytest.fixture
 def anyio_backend() -> str:
     return "asyncio"
@@ -74,6 +95,11 @@ def di_container(settings: BaseAppSettings) -> Container:
     return Container(settings=settings)
 
 
+@pytest.fixture
+def transactional_container(create_test_db: SetupFixture) -> Container:
+    return Container(settings=TransactionalTestAppSettings())
+
+
 @pytest.fixture
 async def session(di_container: Container) -> AsyncSession:
     async with di_container.context_session() as session:
@@ -90,6 +116,11 @@ def article_repository(di_container: Container) -> IArticleRepository:
     return di_container.article_repository()
 
 
+@pytest.fixture
+def comment_repository(di_container: Container) -> ICommentRepository:
+    return di_container.comment_repository()
+
+
 @pytest.fixture
 def article_service(di_container: Container) -> IArticleService:
     return di_container.article_service()
@@ -146,7 +177,7 @@ async def test_article(
     test_user: UserDTO,
 ) -> ArticleDTO:
     return await article_service.create_new_article(
-        session=session, author_id=test_user.id, article_to_create=article_to_create
+        session=session, current_user=test_user, article_to_create=article_to_create
     )
 
 
@@ -162,6 +193,24 @@ async def not_exists_jwt_token(
     return auth_token_service.generate_jwt_token(user=not_exists_user)
 
 
+@pytest.fixture
+def query_budget() -> Callable[[int], AbstractContextManager[QueryStats]]:
+    """
+    Fail the test when the block executes more statements than allowed.
+    """
+
+    @contextlib.contextmanager
+    def budget(max_queries: int) -> Iterator[QueryStats]:
+        with collect_query_stats() as stats:
+            yield stats
+        assert stats.count <= max_queries, (
+            f"{stats.count} queries executed, budget is {max_queries}, "
+            f"slowest: {stats.slowest_statement}"
+        )
+
+    return budget
+
+
 @pytest.fixture
 async def test_client(application: FastAPI) -> AsyncClient:
     async with AsyncClient(
@@ -0,0 +1,70 @@
+import asyncio
+import os
+import signal
+from collections.abc import Iterator
+from types import FrameType
+
+import pytest
+
+from conduit.core.lifecycle import Lifecycle, LifecycleState
+
+
+@pytest.fixture(scope="session", autouse=True)
+def create_test_db() -> None:
+    return
+
+
+@pytest.fixture(scope="session", autouse=True)
+def create_tables() -> None:
+    return
+
+
+@pytest.fixture
+def server_signals() -> Iterator[list[int]]:
+    """
+    Stand in for the server handling SIGTERM.
+    """
+    received: list[int] = []
+
+    def handle_exit(signum: int, frame: FrameType | None) -> None:
+        received.append(signum)
+
+    previous_handler = signal.signal(signal.SIGTERM, handle_exit)
+    yield received
+    signal.signal(signal.SIGTERM, previous_handler)
+
+
+@pytest.mark.anyio
+async def test_shutdown_signal_reports_draining_before_server_stops(
+    server_signals: list[int],
+) -> None:
+    lifecycle = Lifecycle()
+    lifecycle.state = LifecycleState.ready
+    lifecycle.install_signal_handlers(delay=0.05)
+    try:
+        os.kill(os.getpid(), signal.SIGTERM)
+        await asyncio.sleep(0.01)
+        assert lifecycle.state == LifecycleState.draining
+        assert server_signals == []
+
+        await asyncio.sleep(0.1)
+        assert server_signals == [signal.SIGTERM]
+    finally:
+        lifecycle.restore_signal_handlers()
+
+
+@pytest.mark.anyio
+async def test_repeated_shutdown_signal_is_passed_on_at_once(
+    server_signals: list[int],
+) -> None:
+    lifecycle = Lifecycle()
+    lifecycle.install_signal_handlers(delay=60)
+    try:
+        os.kill(os.getpid(), signal.SIGTERM)
+        os.kill(os.getpid(), signal.SIGTERM)
+        await asyncio.sleep(0.01)
+        assert server_signals == [signal.SIGTERM]
+    finally:
+        lifecycle.restore_signal_handlers()
+
+    assert signal.getsignal(signal.SIGTERM).__name__ == "handle_exit"
@@ -0,0 +1,70 @@
+import logging
+import queue
+import time
+
+import pytest
+import structlog
+from prometheus_client import REGISTRY
+
+from conduit.core.logging import DroppingQueueHandler, EventSampler
+
+
+@pytest.fixture(scope="session", autouse=True)
+def create_test_db() -> None:
+    return
+
+
+@pytest.fixture(scope="session", autouse=True)
+def create_tables() -> None:
+    return
+
+
+def dropped_records(reason: str) -> float:
+    return (
+        REGISTRY.get_sample_value("log_records_dropped_total", {"reason": reason}) or 0
+    )
+
+
+def sample(sampler: EventSampler, method_name: str, event: str) -> dict | None:
+    try:
+        return sampler(logging.getLogger(), method_name, {"event": event})
+    except structlog.DropEvent:
+        return None
+
+
+def test_sampler_drops_events_over_burst() -> None:
+    sampler = EventSampler(burst=2, window_seconds=60)
+    dropped_before = dropped_records(reason="sampled")
+
+    events = [sample(sampler, "error", "User not found") for _ in range(5)]
+
+    assert events == [{"event": "User not found"}] * 2 + [None] * 3
+    assert sample(sampler, "error", "Incorrect password") is not None
+    assert sample(sampler, "info", "User not found") is not None
+    assert dropped_records(reason="sampled") == dropped_before + 3
+
+
+def test_sampler_reports_dropped_events_in_next_window() -> None:
+    sampler = EventSampler(burst=1, window_seconds=0.05)
+    sample(sampler, "error", "User not found")
+    sample(sampler, "error", "User not found")
+    sample(sampler, "error", "User not found")
+
+    time.sleep(0.06)
+
+    assert sample(sampler, "error", "User not found") == {
+        "event": "User not found",
+        "sampled_out": 2,
+    }
+    assert sample(sampler, "error", "User not found") is None
+
+
+def test_queue_handler_drops_records_when_queue_is_full() -> None:
+    handler = DroppingQueueHandler(queue.Queue(maxsize=1))
+    dropped_before = dropped_records(reason="queue_full")
+
+    for number in range(3):
+        handler.handle(logging.makeLogRecord({"msg": "Record %s", "args": (number,)}))
+
+    assert handler.queue.get_nowait().getMessage() == "Record 0"
+    assert dropped_records(reason="queue_full") == dropped_before + 2
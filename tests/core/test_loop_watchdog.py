@@ -0,0 +1,63 @@
+import asyncio
+import time
+from typing import Any
+
+import pytest
+
+from conduit.core import loop_watchdog
+from conduit.core.loop_watchdog import EventLoopWatchdog
+
+
+@pytest.fixture(scope="session", autouse=True)
+def create_test_db() -> None:
+    return
+
+
+@pytest.fixture(scope="session", autouse=True)
+def create_tables() -> None:
+    return
+
+
+class RecordingLogger:
+    def __init__(self) -> None:
+        self.events: list[dict[str, Any]] = []
+
+    def warning(self, event: str, **kwargs: Any) -> None:
+        self.events.append(dict(event=event, **kwargs))
+
+
+def block_event_loop() -> None:
+    time.sleep(0.3)
+
+
+@pytest.mark.anyio
+async def test_watchdog_logs_stack_of_blocking_callback(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    recording_logger = RecordingLogger()
+    monkeypatch.setattr(loop_watchdog, "logger", recording_logger)
+
+    watchdog = EventLoopWatchdog(interval_ms=10, threshold_ms=100)
+    watchdog.start()
+    await asyncio.sleep(0.05)
+    block_event_loop()
+    await asyncio.sleep(0.05)
+    watchdog.stop()
+
+    assert len(recording_logger.events) == 1
+    assert "block_event_loop" in recording_logger.events[0]["stack"]
+
+
+@pytest.mark.anyio
+async def test_watchdog_ignores_short_callbacks(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    recording_logger = RecordingLogger()
+    monkeypatch.setattr(loop_watchdog, "logger", recording_logger)
+
+    watchdog = EventLoopWatchdog(interval_ms=10, threshold_ms=100)
+    watchdog.start()
+    await asyncio.sleep(0.2)
+    watchdog.stop()
+
+    assert recording_logger.events == []
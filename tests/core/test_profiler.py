@@ -0,0 +1,89 @@
+import threading
+import time
+
+import pytest
+
+from conduit.core.profiler import SamplingProfiler, collapse_stacks, speedscope_profile
+
+
+@pytest.fixture(scope="session", autouse=True)
+def create_test_db() -> None:
+    return
+
+
+@pytest.fixture(scope="session", autouse=True)
+def create_tables() -> None:
+    return
+
+
+def busy_loop(stopped: threading.Event) -> None:
+    while not stopped.is_set():
+        sum(range(1000))
+
+
+@pytest.mark.anyio
+async def test_profiler_samples_other_threads() -> None:
+    stopped = threading.Event()
+    thread = threading.Thread(target=busy_loop, args=(stopped,), name="busy")
+    thread.start()
+    profiler = SamplingProfiler(interval=0.005)
+    try:
+        await profiler.run(duration=0.2)
+    finally:
+        stopped.set()
+        thread.join()
+
+    busy_samples = sum(
+        count
+        for (thread_name, stack), count in profiler.samples.items()
+        if thread_name == "busy" and stack[-1][0] == "busy_loop"
+    )
+    assert busy_samples > 0
+    assert all(
+        thread_name != "sampling-profiler" for thread_name, _ in profiler.samples
+    )
+
+
+def test_profiler_does_not_sample_after_stop() -> None:
+    profiler = SamplingProfiler(interval=0.001)
+    profiler.start()
+    time.sleep(0.05)
+    profiler.stop()
+    samples = profiler.samples.copy()
+    time.sleep(0.01)
+    assert profiler.samples == samples
+
+
+def test_collapse_stacks() -> None:
+    profiler = SamplingProfiler(interval=0.01)
+    profiler.samples.update(
+        {
+            ("MainThread", (("main", "app.py", 1), ("handler", "app.py", 10))): 3,
+            ("MainThread", (("main", "app.py", 1),)): 1,
+        }
+    )
+    assert collapse_stacks(samples=profiler.samples) == (
+        "MainThread;main (app.py:1);handler (app.py:10) 3\n"
+        "MainThread;main (app.py:1) 1\n"
+    )
+
+
+def test_speedscope_profile_shares_frames_between_threads() -> None:
+    main = ("main", "app.py", 1)
+    handler = ("handler", "app.py", 10)
+    profile = speedscope_profile(
+        samples={("MainThread", (main, handler)): 3, ("worker", (main,)): 2},
+        interval=0.01,
+        name="test",
+    )
+
+    assert profile["shared"]["frames"] == [
+        {"name": "main", "file": "app.py", "line": 1},
+        {"name": "handler", "file": "app.py", "line": 10},
+    ]
+    main_profile, worker_profile = profile["profiles"]
+    assert main_profile["name"] == "MainThread"
+    assert main_profile["samples"] == [[0, 1]]
+    assert main_profile["weights"] == [pytest.approx(0.03)]
+    assert worker_profile["samples"] == [[0]]
+    assert worker_profile["endValue"] == pytest.approx(0.02)
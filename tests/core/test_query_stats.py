@@ -0,0 +1,37 @@
+import pytest
+
+from conduit.core.query_stats import collect_query_stats, get_query_stats
+
+
+@pytest.fixture(scope="session", autouse=True)
+def create_test_db() -> None:
+    return
+
+
+@pytest.fixture(scope="session", autouse=True)
+def create_tables() -> None:
+    return
+
+
+def test_query_stats_keep_the_slowest_statement() -> None:
+    with collect_query_stats() as stats:
+        stats.add(statement="SELECT 1", duration=0.002)
+        stats.add(statement="SELECT 2", duration=0.005)
+        stats.add(statement="SELECT 3", duration=0.001)
+
+    assert stats.count == 3
+    assert stats.duration == pytest.approx(0.008)
+    assert stats.slowest_statement == "SELECT 2"
+    assert stats.server_timing() == 'db;dur=8.00;desc="3 queries", db-slowest;dur=5.00'
+    assert get_query_stats() is None
+
+
+def test_nested_query_stats_are_added_to_the_enclosing_ones() -> None:
+    with collect_query_stats() as outer:
+        outer.add(statement="SELECT 1", duration=0.001)
+        with collect_query_stats() as inner:
+            inner.add(statement="SELECT 2", duration=0.003)
+            assert get_query_stats() is inner
+
+    assert outer.count == 2
+    assert outer.slowest_statement == "SELECT 2"
@@ -0,0 +1,60 @@
+import pytest
+from fastapi import APIRouter, FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from conduit.api.middlewares import RequestContextMiddleware
+from conduit.api.routing import TimedRoute
+from conduit.core.request_context import (
+    RequestContext,
+    bind_request_user,
+    get_request_context,
+)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def create_test_db() -> None:
+    return
+
+
+@pytest.fixture(scope="session", autouse=True)
+def create_tables() -> None:
+    return
+
+
+@pytest.mark.anyio
+async def test_timed_routes_fill_request_context() -> None:
+    contexts: list[RequestContext] = []
+    router = APIRouter(route_class=TimedRoute)
+
+    @router.get("/items/{item_id}")
+    async def get_item(item_id: int) -> dict:
+        bind_request_user(user_id=7)
+        contexts.append(get_request_context())
+        return {"id": item_id}
+
+    @router.get("/sync")
+    def get_sync() -> dict:
+        contexts.append(get_request_context())
+        return {}
+
+    app = FastAPI()
+    app.include_router(router, prefix="/api")
+    app.add_middleware(RequestContextMiddleware)
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.get("/api/items/1", headers={"X-Request-ID": "r-1"})
+        await client.get("/api/sync")
+
+    assert response.json() == {"id": 1}
+    assert response.headers["X-Request-ID"] == "r-1"
+    item_context, sync_context = contexts
+    assert item_context.request_id == "r-1"
+    assert item_context.route == "/api/items/{item_id}"
+    assert item_context.user_id == 7
+    assert item_context.handler_duration is not None
+    assert item_context.serialization_duration is not None
+    assert sync_context.route == "/api/sync"
+    assert sync_context.handler_duration is not None
+    assert sync_context.request_id != "r-1"
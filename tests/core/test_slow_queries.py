@@ -0,0 +1,50 @@
+import datetime
+
+import pytest
+from sqlalchemy import NullPool, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from conduit.core.query_stats import collect_query_stats, instrument_engine
+from conduit.core.settings.base import BaseAppSettings
+from conduit.core.slow_queries import SlowQueryLogger, parameters_shape
+from tests.conftest import SetupFixture
+
+
+@pytest.fixture(scope="session", autouse=True)
+def create_tables() -> None:
+    return
+
+
+def test_parameters_shape_hides_values() -> None:
+    parameters = (42, "secret@example.com", datetime.datetime(2024, 1, 1), None)
+    assert parameters_shape(parameters) == ["int", "str", "datetime", "NoneType"]
+    assert parameters_shape({"email": "secret@example.com"}) == {"email": "str"}
+
+
+def test_parameters_shape_of_executemany_describes_first_row() -> None:
+    parameters = [(1, "first"), (2, "second")]
+    assert parameters_shape(parameters, executemany=True) == {
+        "rows": 2,
+        "row": ["int", "str"],
+    }
+
+
+@pytest.mark.anyio
+async def test_explain_is_not_counted_in_request_query_stats(
+    create_test_db: SetupFixture, settings: BaseAppSettings
+) -> None:
+    engine = create_async_engine(settings.sql_db_uri, poolclass=NullPool)
+    instrument_engine(engine=engine.sync_engine)
+    slow_query_logger = SlowQueryLogger(
+        engine=engine, threshold_ms=0, explain_sample_rate=1.0
+    )
+
+    with collect_query_stats() as stats:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        # Wait for the explain of the statement above.
+        await slow_query_logger._explain_task
+
+    assert stats.count == 1
+    assert stats.slowest_statement == "SELECT 1"
+    await engine.dispose()
@@ -0,0 +1,27 @@
+import datetime
+
+import pytest
+
+from conduit.core.utils.cursor import decode_cursor, encode_cursor
+
+
+@pytest.fixture(scope="session", autouse=True)
+def create_test_db() -> None:
+    return
+
+
+@pytest.fixture(scope="session", autouse=True)
+def create_tables() -> None:
+    return
+
+
+def test_decode_cursor_returns_encoded_position() -> None:
+    created_at = datetime.datetime(2024, 4, 15, 21, 23, 56, 595004)
+    cursor = encode_cursor(created_at=created_at, id=42)
+    assert decode_cursor(cursor=cursor) == (created_at, 42)
+
+
+@pytest.mark.parametrize("cursor", ("", "not-a-cursor", "!!!", "MjAyNC0wNC0xNQ"))
+def test_decode_cursor_raises_on_malformed_cursor(cursor: str) -> None:
+    with pytest.raises(ValueError):
+        decode_cursor(cursor=cursor)
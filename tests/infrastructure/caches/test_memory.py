@@ -0,0 +1,63 @@
+import time
+
+import pytest
+
+from conduit.infrastructure.caches.memory import LRUCache
+
+
+@pytest.fixture(scope="session", autouse=True)
+def create_test_db() -> None:
+    return
+
+
+@pytest.fixture(scope="session", autouse=True)
+def create_tables() -> None:
+    return
+
+
+@pytest.mark.anyio
+async def test_cache_returns_stored_value() -> None:
+    cache = LRUCache(max_size=2, ttl_seconds=60)
+    await cache.set("key", "value")
+    assert await cache.get("key") == "value"
+
+
+@pytest.mark.anyio
+async def test_cache_evicts_least_recently_used_entry() -> None:
+    cache = LRUCache(max_size=2, ttl_seconds=60)
+    await cache.set("first", 1)
+    await cache.set("second", 2)
+    await cache.get("first")
+    await cache.set("third", 3)
+
+    assert await cache.get("first") == 1
+    assert await cache.get("second") is None
+    assert await cache.get("third") == 3
+
+
+@pytest.mark.anyio
+async def test_cache_drops_expired_entry(monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = LRUCache(max_size=2, ttl_seconds=60)
+    await cache.set("key", "value")
+
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 61)
+    assert await cache.get("key") is None
+
+
+@pytest.mark.anyio
+async def test_cache_deletes_entries() -> None:
+    cache = LRUCache(max_size=2, ttl_seconds=60)
+    await cache.set("first", 1)
+    await cache.set("second", 2)
+    await cache.delete("first", "second", "missing")
+
+    assert await cache.get("first") is None
+    assert await cache.get("second") is None
+
+
+@pytest.mark.anyio
+async def test_cache_with_zero_size_stores_nothing() -> None:
+    cache = LRUCache(max_size=0, ttl_seconds=60)
+    await cache.set("key", "value")
+    assert await cache.get("key") is None
@@ -0,0 +1,128 @@
+import asyncio
+
+import pytest
+from prometheus_client import REGISTRY
+
+from conduit.infrastructure.caches.memory import LRUCache
+from conduit.infrastructure.caches.single_flight import SingleFlightCache
+
+
+@pytest.fixture(scope="session", autouse=True)
+def create_test_db() -> None:
+    return
+
+
+@pytest.fixture(scope="session", autouse=True)
+def create_tables() -> None:
+    return
+
+
+def coalesced_requests() -> float:
+    return (
+        REGISTRY.get_sample_value(
+            "cache_requests_total", {"cache": "test", "result": "coalesced"}
+        )
+        or 0
+    )
+
+
+@pytest.mark.anyio
+async def test_concurrent_misses_share_one_computation() -> None:
+    cache = SingleFlightCache(name="test", cache=LRUCache(max_size=0, ttl_seconds=60))
+    calls = 0
+    coalesced_before = coalesced_requests()
+
+    async def compute() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "value"
+
+    results = await asyncio.gather(
+        *(cache.get_or_set(key="key", factory=compute) for _ in range(5))
+    )
+
+    assert results == ["value"] * 5
+    assert calls == 1
+    assert coalesced_requests() == coalesced_before + 4
+
+
+@pytest.mark.anyio
+async def test_cached_value_is_returned_without_computation() -> None:
+    cache = SingleFlightCache(name="test", cache=LRUCache(max_size=1, ttl_seconds=60))
+
+    calls = 0
+
+    async def compute() -> str:
+        nonlocal calls
+        calls += 1
+        return "value"
+
+    await cache.get_or_set(key="key", factory=compute)
+    assert await cache.get_or_set(key="key", factory=compute) == "value"
+
+    assert calls == 1
+
+
+@pytest.mark.anyio
+async def test_failed_computation_is_propagated_and_not_cached() -> None:
+    cache = SingleFlightCache(name="test", cache=LRUCache(max_size=1, ttl_seconds=60))
+
+    async def fail() -> str:
+        await asyncio.sleep(0.01)
+        raise RuntimeError
+
+    async def compute() -> str:
+        return "value"
+
+    results = await asyncio.gather(
+        cache.get_or_set(key="key", factory=fail),
+        cache.get_or_set(key="key", factory=fail),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert await cache.get_or_set(key="key", factory=compute) == "value"
+
+
+@pytest.mark.anyio
+async def test_waiting_callers_recover_when_computing_caller_is_cancelled() -> None:
+    cache = SingleFlightCache(name="test", cache=LRUCache(max_size=1, ttl_seconds=60))
+    calls = 0
+
+    async def compute() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "value"
+
+    leader = asyncio.create_task(cache.get_or_set(key="key", factory=compute))
+    await asyncio.sleep(0)
+    followers = [
+        asyncio.create_task(cache.get_or_set(key="key", factory=compute))
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await asyncio.gather(*followers) == ["value"] * 3
+    assert leader.cancelled()
+    assert calls == 2
+
+
+@pytest.mark.anyio
+async def test_cancelled_waiting_caller_does_not_cancel_computation() -> None:
+    cache = SingleFlightCache(name="test", cache=LRUCache(max_size=1, ttl_seconds=60))
+
+    async def compute() -> str:
+        await asyncio.sleep(0.01)
+        return "value"
+
+    leader = asyncio.create_task(cache.get_or_set(key="key", factory=compute))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(cache.get_or_set(key="key", factory=compute))
+    await asyncio.sleep(0)
+    follower.cancel()
+
+    assert await leader == "value"
+    assert follower.cancelled()
@@ -0,0 +1,25 @@
+import pytest
+
+from conduit.infrastructure.caches.tag_id import TagIdCache
+
+
+@pytest.fixture(scope="session", autouse=True)
+def create_test_db() -> None:
+    return
+
+
+@pytest.fixture(scope="session", autouse=True)
+def create_tables() -> None:
+    return
+
+
+def test_cache_returns_only_interned_tags() -> None:
+    cache = TagIdCache(max_size=10)
+    cache.set_many({"tag1": 1, "tag2": 2})
+    assert cache.get_many(["tag1", "tag3"]) == {"tag1": 1}
+
+
+def test_cache_stops_interning_when_full() -> None:
+    cache = TagIdCache(max_size=1)
+    cache.set_many({"tag1": 1, "tag2": 2})
+    assert cache.get_many(["tag1", "tag2"]) == {"tag1": 1}
@@ -0,0 +1,139 @@
+import asyncio
+import datetime
+from collections.abc import Collection
+from typing import Any
+
+import pytest
+
+from conduit.core.exceptions import UserNotFoundException
+from conduit.domain.dtos.user import UserDTO
+from conduit.infrastructure.loaders.user import UserLoader
+
+
+@pytest.fixture(scope="session", autouse=True)
+def create_test_db() -> None:
+    return
+
+
+@pytest.fixture(scope="session", autouse=True)
+def create_tables() -> None:
+    return
+
+
+def make_user(user_id: int, username: str) -> UserDTO:
+    user = UserDTO(
+        username=username,
+        email=f"{username}@gmail.com",
+        password_hash="",
+        bio="",
+        image_url="",
+        created_at=datetime.datetime.now(),
+    )
+    user.id = user_id
+    return user
+
+
+class InMemoryUserRepository:
+
+    def __init__(self, users: list[UserDTO]) -> None:
+        self.users = users
+        self.queries: list[list[Any]] = []
+
+    async def list_by_users(
+        self, session: Any, user_ids: Collection[int]
+    ) -> list[UserDTO]:
+        self.queries.append(list(user_ids))
+        return [user for user in self.users if user.id in user_ids]
+
+    async def list_by_usernames(
+        self, session: Any, usernames: Collection[str]
+    ) -> list[UserDTO]:
+        self.queries.append(list(usernames))
+        return [user for user in self.users if user.username in usernames]
+
+
+@pytest.fixture
+def user_repository() -> InMemoryUserRepository:
+    return InMemoryUserRepository(
+        users=[
+            make_user(user_id=1, username="one"),
+            make_user(user_id=2, username="two"),
+        ]
+    )
+
+
+@pytest.fixture
+def user_loader(user_repository: InMemoryUserRepository) -> UserLoader:
+    return UserLoader(session=None, user_repo=user_repository)
+
+
+@pytest.mark.anyio
+async def test_loads_issued_in_same_tick_are_batched(
+    user_loader: UserLoader, user_repository: InMemoryUserRepository
+) -> None:
+    users = await asyncio.gather(
+        user_loader.load(user_id=1),
+        user_loader.load(user_id=2),
+        user_loader.load(user_id=1),
+    )
+
+    assert [user.id for user in users] == [1, 2, 1]
+    assert user_repository.queries == [[1, 2]]
+
+
+@pytest.mark.anyio
+async def test_loaded_users_are_cached_by_id_and_username(
+    user_loader: UserLoader, user_repository: InMemoryUserRepository
+) -> None:
+    await user_loader.load(user_id=1)
+    user = await user_loader.load_by_username(username="one")
+    users = await user_loader.load_many(user_ids=[1])
+
+    assert user.id == 1
+    assert [user.id for user in users] == [1]
+    assert user_repository.queries == [[1]]
+
+
+@pytest.mark.anyio
+async def test_missing_user_raises_not_found(user_loader: UserLoader) -> None:
+    with pytest.raises(UserNotFoundException):
+        await user_loader.load(user_id=3)
+
+    assert await user_loader.load_many(user_ids=[3, 2]) == [
+        await user_loader.load(user_id=2)
+    ]
+
+
+@pytest.mark.anyio
+async def test_primed_user_replaces_old_username(
+    user_loader: UserLoader, user_repository: InMemoryUserRepository
+) -> None:
+    await user_loader.load_by_username(username="one")
+    renamed_user = make_user(user_id=1, username="renamed")
+    user_repository.users[0] = renamed_user
+    user_loader.prime(user=renamed_user)
+
+    assert (await user_loader.load(user_id=1)).username == "renamed"
+    with pytest.raises(UserNotFoundException):
+        await user_loader.load_by_username(username="one")
+
+
+@pytest.mark.anyio
+async def test_cancelled_lookup_cancels_pending_loads(
+    monkeypatch: pytest.MonkeyPatch,
+    user_loader: UserLoader,
+    user_repository: InMemoryUserRepository,
+) -> None:
+    list_by_users = user_repository.list_by_users
+
+    async def cancelled_list_by_users(
+        session: Any, user_ids: Collection[int]
+    ) -> list[UserDTO]:
+        raise asyncio.CancelledError()
+
+    monkeypatch.setattr(user_repository, "list_by_users", cancelled_list_by_users)
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(user_loader.load(user_id=1), timeout=1)
+
+    monkeypatch.setattr(user_repository, "list_by_users", list_by_users)
+    assert (await user_loader.load(user_id=1)).id == 1
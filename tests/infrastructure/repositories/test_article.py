@@ -0,0 +1,39 @@
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from conduit.core.container import Container
+from conduit.core.query_stats import QueryStats
+from conduit.domain.dtos.article import CreateArticleDTO
+from conduit.domain.dtos.user import UserDTO
+from conduit.domain.repositories.article import IArticleRepository
+from conduit.domain.repositories.article_tag import IArticleTagRepository
+from tests.conftest import SetupFixture
+
+
+@pytest.fixture
+def article_tag_repository(di_container: Container) -> IArticleTagRepository:
+    return di_container.article_tag_repository()
+
+
+@pytest.mark.anyio
+async def test_article_with_tags_is_created_in_one_statement(
+    create_test_db: SetupFixture,
+    session: AsyncSession,
+    article_repository: IArticleRepository,
+    article_tag_repository: IArticleTagRepository,
+    test_user: UserDTO,
+    article_to_create: CreateArticleDTO,
+    query_budget: Callable[[int], AbstractContextManager[QueryStats]],
+) -> None:
+    # The second article links tags that exist already.
+    for _ in range(2):
+        with query_budget(1):
+            article = await article_repository.add_with_tags(
+                session=session, author_id=test_user.id, create_item=article_to_create
+            )
+
+        tags = await article_tag_repository.list(session=session, article_id=article.id)
+        assert sorted(tag.tag for tag in tags) == article_to_create.tags
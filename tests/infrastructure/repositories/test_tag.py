@@ -0,0 +1,36 @@
+import pytest
+
+from conduit.core.container import Container
+from conduit.domain.dtos.article import CreateArticleDTO
+from conduit.domain.dtos.user import UserDTO
+
+
+@pytest.mark.anyio
+async def test_tag_ids_are_cached_only_when_committed(
+    transactional_container: Container,
+    test_user: UserDTO,
+    article_to_create: CreateArticleDTO,
+) -> None:
+    article_service = transactional_container.article_service()
+    tag_id_cache = transactional_container.tag_id_cache()
+
+    with pytest.raises(RuntimeError):
+        async with transactional_container.context_session() as session:
+            await article_service.create_new_article(
+                session=session,
+                current_user=test_user,
+                article_to_create=article_to_create,
+            )
+            raise RuntimeError("Request failed")
+
+    assert tag_id_cache.get_many(article_to_create.tags) == {}
+
+    async with transactional_container.context_session() as session:
+        article = await article_service.create_new_article(
+            session=session, current_user=test_user, article_to_create=article_to_create
+        )
+
+    assert article.tags == article_to_create.tags
+    assert tag_id_cache.get_many(article_to_create.tags).keys() == set(
+        article_to_create.tags
+    )
@@ -0,0 +1,84 @@
+import pytest
+
+from conduit.core.container import Container
+from conduit.core.exceptions import ArticleNotFoundException
+from conduit.domain.dtos.article import ArticleDTO, CreateArticleDTO, UpdateArticleDTO
+from conduit.domain.dtos.user import UserDTO
+from tests.utils import read_article
+
+
+@pytest.fixture
+async def cached_article(
+    transactional_container: Container,
+    test_user: UserDTO,
+    article_to_create: CreateArticleDTO,
+) -> ArticleDTO:
+    async with transactional_container.context_session() as session:
+        article = await transactional_container.article_service().create_new_article(
+            session=session, current_user=test_user, article_to_create=article_to_create
+        )
+    await read_article(container=transactional_container, slug=article.slug)
+    return article
+
+
+@pytest.mark.anyio
+async def test_read_after_update_sees_updated_article(
+    transactional_container: Container, cached_article: ArticleDTO, test_user: UserDTO
+) -> None:
+    async with transactional_container.context_session() as session:
+        await transactional_container.article_service().update_article_by_slug(
+            session=session,
+            slug=cached_article.slug,
+            article_to_update=UpdateArticleDTO(
+                title=None, description="Updated Description", body=None
+            ),
+            current_user=test_user,
+        )
+        # A concurrent request still sees the old article and caches it.
+        await read_article(container=transactional_container, slug=cached_article.slug)
+
+    article = await read_article(
+        container=transactional_container, slug=cached_article.slug
+    )
+    assert article.description == "Updated Description"
+
+
+@pytest.mark.anyio
+async def test_read_after_favorite_sees_favorites_count(
+    transactional_container: Container, cached_article: ArticleDTO, test_user: UserDTO
+) -> None:
+    async with transactional_container.context_session() as session:
+        await transactional_container.article_service().add_article_into_favorites(
+            session=session, slug=cached_article.slug, current_user=test_user
+        )
+        await read_article(container=transactional_container, slug=cached_article.slug)
+
+    article = await read_article(
+        container=transactional_container, slug=cached_article.slug
+    )
+    assert article.favorites_count == 1
+
+    async with transactional_container.context_session() as session:
+        await transactional_container.article_service().remove_article_from_favorites(
+            session=session, slug=cached_article.slug, current_user=test_user
+        )
+        await read_article(container=transactional_container, slug=cached_article.slug)
+
+    article = await read_article(
+        container=transactional_container, slug=cached_article.slug
+    )
+    assert article.favorites_count == 0
+
+
+@pytest.mark.anyio
+async def test_read_after_delete_does_not_find_article(
+    transactional_container: Container, cached_article: ArticleDTO, test_user: UserDTO
+) -> None:
+    async with transactional_container.context_session() as session:
+        await transactional_container.article_service().delete_article_by_slug(
+            session=session, slug=cached_article.slug, current_user=test_user
+        )
+        await read_article(container=transactional_container, slug=cached_article.slug)
+
+    with pytest.raises(ArticleNotFoundException):
+        await read_article(container=transactional_container, slug=cached_article.slug)
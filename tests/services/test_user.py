@@ -0,0 +1,31 @@
+import pytest
+
+from conduit.core.container import Container
+from conduit.domain.dtos.article import CreateArticleDTO
+from conduit.domain.dtos.user import UpdateUserDTO, UserDTO
+from tests.utils import read_article
+
+
+@pytest.mark.anyio
+async def test_read_after_update_sees_updated_author(
+    transactional_container: Container,
+    test_user: UserDTO,
+    article_to_create: CreateArticleDTO,
+) -> None:
+    async with transactional_container.context_session() as session:
+        article = await transactional_container.article_service().create_new_article(
+            session=session, current_user=test_user, article_to_create=article_to_create
+        )
+    await read_article(container=transactional_container, slug=article.slug)
+
+    async with transactional_container.context_session() as session:
+        await transactional_container.user_service().update_user(
+            session=session,
+            current_user=test_user,
+            user_to_update=UpdateUserDTO(bio="Updated bio"),
+        )
+        # A concurrent request still sees the old author and caches it.
+        await read_article(container=transactional_container, slug=article.slug)
+
+    article = await read_article(container=transactional_container, slug=article.slug)
+    assert article.author.bio == "Updated bio"
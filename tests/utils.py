@@ -1,6 +1,7 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from conduit.domain.dtos.article import ArticleRecordDTO, CreateArticleDTO
+from conduit.core.container import Container
+from conduit.domain.dtos.article import ArticleDTO, ArticleRecordDTO, CreateArticleDTO
 from conduit.domain.dtos.user import CreateUserDTO, UserDTO
 from conduit.infrastructure.repositories.article import ArticleRepository
 from conduit.infrastructure.repositories.user import UserRepository
@@ -27,3 +28,10 @@ async def create_another_test_article(
     return await article_repository.add(
         session=session, author_id=author_id, create_item=create_article_dto
     )
+
+
+async def read_article(container: Container, slug: str) -> ArticleDTO:
+    async with container.context_session() as session:
+        return await container.article_service().get_article_by_slug(
+            session=session, slug=slug, current_user=None
+        )